@@ -0,0 +1,122 @@
+"""
+Columnar result benchmarks for pyZscaler.
+
+Times getting a listing into column form, as a dataframe needs it, from pages of raw ZCC device records: collecting
+a :obj:`BoxList` and transposing it, as callers did before ``as_columns``, against filling a
+:class:`~pyzscaler.utils.ColumnTable` as each page arrives. Reports the time per record and the peak memory of each.
+
+Examples:
+    Compare both on 50,000 devices::
+
+        python -m benchmarks.columns --records 50000
+
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+from box import BoxList
+
+from pyzscaler.utils import ColumnTable
+
+
+def devices(count: int, page_size: int = 5000) -> list:
+    """Pages of devices as returned by ZCC ``getDevices``."""
+    records = [
+        {
+            "udid": f"{i:08x}-udid",
+            "user": f"user{i}@example.com",
+            "type": 3,
+            "osVersion": "Microsoft Windows 10 Pro;64 bit",
+            "agentVersion": "4.1.0.85",
+            "companyName": "Example",
+            "machineHostname": f"LAPTOP-{i}",
+            "manufacturer": "LENOVO",
+            "state": 1,
+            "registrationState": "Registered",
+            "downloadCount": i % 7,
+            "keepAliveTime": 1685029476 + i,
+            "last_seen_time": "2023-05-25 15:44:36 GMT",
+        }
+        for i in range(count)
+    ]
+    return [records[start : start + page_size] for start in range(0, count, page_size)]
+
+
+def boxes(pages: list) -> dict:
+    """Collects the records into a BoxList, then builds the columns from it."""
+    records = BoxList([record for page in pages for record in page], camel_killer_box=True)
+    names = list(records[0]) if records else []
+    return {name: [record.get(name) for record in records] for name in names}
+
+
+def columns(pages: list) -> dict:
+    """Fills a ColumnTable as each page arrives, then returns its columns."""
+    table = ColumnTable()
+    for page in pages:
+        table.extend(page)
+    return table.to_dict()
+
+
+CASES = {"boxlist": boxes, "column_table": columns}
+
+
+def measure(func, pages: list) -> tuple:
+    start = time.perf_counter()
+    result = func(pages)
+    elapsed = time.perf_counter() - start
+    # Memory is traced in a second run, as tracing slows down allocation.
+    tracemalloc.start()
+    try:
+        func(pages)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def run(records: int = 20000) -> list:
+    """Runs every case on ``records`` devices, returning the results."""
+    pages = devices(records)
+    results = []
+    expected = None
+    for case, func in CASES.items():
+        result, elapsed, peak = measure(func, pages)
+        if expected is None:
+            expected = result
+        elif result != expected:
+            raise RuntimeError(f"The {case} columns differ from the boxlist columns")
+        results.append(
+            {
+                "case": case,
+                "records": records,
+                "us_per_record": round(elapsed * 1e6 / records, 2),
+                "peak_mb": round(peak / 1e6, 2),
+            }
+        )
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000, help="The number of device records to list")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.records)
+
+    fields = ("case", "records", "us_per_record", "peak_mb")
+    print(" ".join(f"{field:>14}" for field in fields))
+    for case in results:
+        print(" ".join(f"{case[field]:>14}" for field in fields))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
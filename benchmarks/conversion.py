@@ -0,0 +1,239 @@
+"""
+Key conversion microbenchmarks for pyZscaler.
+
+Times :func:`~pyzscaler.utils.convert_keys` on realistic ZPA application segment and ZIA location payloads, in both
+directions and from both plain dicts and the camel-killer Boxes returned by the API, against the uncached recursive
+implementation it replaced.
+
+Examples:
+    Run every case 20,000 times::
+
+        python -m benchmarks.conversion --iterations 20000
+
+"""
+import argparse
+import copy
+import json
+import re
+import sys
+import time
+
+from box import Box, BoxList
+
+from pyzscaler.utils import convert_keys
+
+
+def legacy_snake_to_camel(name: str):
+    if "_" not in name:
+        return name
+    edge_cases = {
+        "routable_ip": "routableIP",
+        "is_name_l10n_tag": "isNameL10nTag",
+        "name_l10n_tag": "nameL10nTag",
+        "surrogate_ip": "surrogateIP",
+        "surrogate_ip_enforced_for_known_browsers": "surrogateIPEnforcedForKnownBrowsers",
+        "ec_vms": "ecVMs",
+        "ipv6_enabled": "ipV6Enabled",
+        "valid_ssl_certificate": "validSSLCertificate",
+    }
+    return edge_cases.get(name, name[0].lower() + name.title()[1:].replace("_", ""))
+
+
+def legacy_camel_to_snake(name: str):
+    edge_cases = {
+        "routableIP": "routable_ip",
+        "isNameL10nTag": "is_name_l10n_tag",
+        "nameL10nTag": "name_l10n_tag",
+        "surrogateIP": "surrogate_ip",
+        "surrogateIPEnforcedForKnownBrowsers": "surrogate_ip_enforced_for_known_browsers",
+        "ecVMs": "ec_vms",
+        "ipV6Enabled": "ipv6_enabled",
+        "validSSLCertificate": "valid_ssl_certificate",
+    }
+    if name in edge_cases:
+        return edge_cases[name]
+    name = re.sub("([a-z0-9])([A-Z])", r"\1_\2", name)
+    return name.lower()
+
+
+def legacy_convert_keys(data, direction="to_camel"):
+    """The recursive implementation of :func:`~pyzscaler.utils.convert_keys` before key conversion was memoised."""
+    converter = legacy_camel_to_snake if direction == "to_snake" else legacy_snake_to_camel
+
+    if isinstance(data, (list, BoxList)):
+        return [legacy_convert_keys(inner_dict, direction=direction) for inner_dict in data]
+    elif isinstance(data, (dict, Box)):
+        new_dict = {}
+        for k in data.keys():
+            v = data[k]
+            new_key = converter(k)
+            new_dict[new_key] = legacy_convert_keys(v, direction=direction) if isinstance(v, (dict, list)) else v
+        return new_dict
+    else:
+        return data
+
+
+def app_segment() -> dict:
+    """A ZPA application segment as returned by ``app_segments.get_segment``."""
+    return {
+        "id": "216196257331291921",
+        "name": "Finance Apps",
+        "description": "Line of business finance applications",
+        "enabled": True,
+        "doubleEncrypt": False,
+        "configSpace": "DEFAULT",
+        "bypassType": "NEVER",
+        "healthCheckType": "DEFAULT",
+        "healthReporting": "ON_ACCESS",
+        "icmpAccessType": "NONE",
+        "ipAnchored": False,
+        "isCnameEnabled": True,
+        "passiveHealthEnabled": True,
+        "selectConnectorCloseToApp": False,
+        "segmentGroupId": "216196257331291903",
+        "segmentGroupName": "Finance",
+        "domainNames": [f"app{i}.finance.example.com" for i in range(20)],
+        "tcpPortRanges": ["443", "443", "8443", "8443"],
+        "tcpPortRange": [{"from": "443", "to": "443"}, {"from": "8443", "to": "8443"}],
+        "udpPortRanges": [],
+        "serverGroups": [
+            {
+                "id": f"21619625733129{i}",
+                "name": f"Finance Servers {i}",
+                "enabled": True,
+                "dynamicDiscovery": True,
+                "configSpace": "DEFAULT",
+                "appConnectorGroups": [
+                    {"id": f"2161962573312{i}{j}", "name": f"Connectors {j}", "cityCountry": "Sydney, AU"} for j in range(3)
+                ],
+            }
+            for i in range(3)
+        ],
+        "clientlessApps": [
+            {
+                "id": "216196257331291950",
+                "name": "finance-portal",
+                "applicationPort": "443",
+                "applicationProtocol": "HTTPS",
+                "certificateId": "216196257331291960",
+                "domain": "portal.finance.example.com",
+                "allowOptions": False,
+                "trustUntrustedCert": True,
+            }
+        ],
+        "creationTime": "1623132834",
+        "modifiedBy": "216196257331281958",
+        "modifiedTime": "1657076234",
+    }
+
+
+def location() -> dict:
+    """A ZIA location as returned by ``locations.get_location``."""
+    return {
+        "id": 56547217,
+        "name": "Sydney Office",
+        "parentId": 0,
+        "upBandwidth": 100000,
+        "dnBandwidth": 100000,
+        "country": "AUSTRALIA",
+        "tz": "AUSTRALIA_SYDNEY",
+        "ipAddresses": ["203.0.113.1", "203.0.113.2"],
+        "ports": [80, 443],
+        "vpnCredentials": [{"id": 1234567, "type": "UFQDN", "fqdn": "sydney@example.com", "comments": "Primary"}],
+        "authRequired": True,
+        "sslScanEnabled": True,
+        "zappSslScanEnabled": False,
+        "xffForwardEnabled": True,
+        "surrogateIP": True,
+        "idleTimeInMinutes": 480,
+        "displayTimeUnit": "HOUR",
+        "surrogateIPEnforcedForKnownBrowsers": True,
+        "surrogateRefreshTimeInMinutes": 120,
+        "surrogateRefreshTimeUnit": "HOUR",
+        "ofwEnabled": True,
+        "ipsControl": True,
+        "aupEnabled": False,
+        "cautionEnabled": False,
+        "aupBlockInternetUntilAccepted": False,
+        "aupForceSslInspection": False,
+        "ipv6Enabled": False,
+        "ipv6Dns64Prefix": False,
+        "aupTimeoutInDays": 0,
+        "profile": "CORPORATE",
+        "staticLocationGroups": [{"id": 66754705, "name": "Corporate User Traffic Group"}],
+        "dynamiclocationGroups": [{"id": 66754706, "name": "Unassigned Locations"}],
+        "excludeFromDynamicGroups": False,
+        "excludeFromManualGroups": False,
+    }
+
+
+PAYLOADS = {"zpa_app_segment": app_segment, "zia_location": location}
+
+CASES = {
+    "to_camel_box": ("to_camel", True),
+    "to_camel_dict": ("to_camel", False),
+    "to_snake_dict": ("to_snake", False),
+}
+
+
+def payload(name: str, direction: str, box: bool):
+    """Returns a payload in the form that convert_keys receives it in for the case."""
+    data = PAYLOADS[name]()
+    if direction == "to_camel":
+        # Read-modify-write updates convert the snake_case Box returned by a get method back to camelCase.
+        data = Box(data, camel_killer_box=True) if box else legacy_convert_keys(data, "to_snake")
+    return data
+
+
+def timed(func, data, direction: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(data, direction)
+    return (time.perf_counter() - start) / iterations
+
+
+def run_case(name: str, case: str, iterations: int = 10000) -> dict:
+    """Times one payload and case with the current and legacy converters, returning the measurements."""
+    direction, box = CASES[case]
+    data = payload(name, direction, box)
+    expected = legacy_convert_keys(copy.deepcopy(data), direction)
+    if convert_keys(data, direction) != expected:
+        raise RuntimeError(f"convert_keys output differs from the legacy converter for {name} {case}")
+
+    current = timed(convert_keys, data, direction, iterations)
+    legacy = timed(legacy_convert_keys, data, direction, iterations)
+    return {
+        "payload": name,
+        "case": case,
+        "current_us": round(current * 1e6, 2),
+        "legacy_us": round(legacy * 1e6, 2),
+        "speedup": round(legacy / current, 2),
+    }
+
+
+def run(iterations: int = 10000) -> list:
+    """Runs every payload and case, returning the results."""
+    return [run_case(name, case, iterations) for name in PAYLOADS for case in CASES]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=10000, help="Conversions to time for each case")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.iterations)
+
+    columns = ("payload", "case", "current_us", "legacy_us", "speedup")
+    print(" ".join(f"{column:>16}" for column in columns))
+    for case in results:
+        print(" ".join(f"{case[column]:>16}" for column in columns))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Import-time benchmarks for pyZscaler.
+
+Times the cold start of common imports, each in a fresh interpreter so that nothing is already in ``sys.modules``, and
+reports the median import time and the number of modules loaded, in total and from pyZscaler itself. The ``eager``
+case imports every pyZscaler module, which is what ``import pyzscaler`` did before the product packages and endpoint
+modules were loaded lazily.
+
+Examples:
+    Compare the cold start of one product with importing everything::
+
+        python -m benchmarks.imports --repeat 20
+
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+CASES = {
+    "package": "import pyzscaler",
+    "zia": "from pyzscaler import ZIA",
+    "zpa": "from pyzscaler import ZPA",
+    "all_products": "from pyzscaler import ZCC, ZCON, ZDX, ZIA, ZPA",
+    "eager": (
+        "import pkgutil, importlib, pyzscaler\n"
+        "for module in pkgutil.walk_packages(pyzscaler.__path__, 'pyzscaler.'):\n"
+        "    importlib.import_module(module.name)"
+    ),
+}
+
+_TIMER = """
+import sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+loaded = set(sys.modules) - before
+print(elapsed, len(loaded), sum(name.startswith("pyzscaler") for name in loaded))
+"""
+
+
+def run_case(name: str, repeat: int = 10) -> dict:
+    """Times one import case ``repeat`` times, each in a fresh interpreter, returning the measurements."""
+    code = _TIMER.format(statement=CASES[name])
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+        elapsed, modules, own_modules = output.split()
+        timings.append(float(elapsed))
+    return {
+        "case": name,
+        "median_ms": round(statistics.median(timings) * 1000, 2),
+        "min_ms": round(min(timings) * 1000, 2),
+        "modules": int(modules),
+        "pyzscaler_modules": int(own_modules),
+    }
+
+
+def run(cases, repeat: int = 10) -> list:
+    """Runs every import case, returning the results."""
+    return [run_case(name, repeat) for name in cases]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=10, help="Fresh interpreters to time each case in")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.cases, args.repeat)
+
+    columns = ("case", "median_ms", "min_ms", "modules", "pyzscaler_modules")
+    print(" ".join(f"{column:>18}" for column in columns))
+    for case in results:
+        print(" ".join(f"{case[column]:>18}" for column in columns))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
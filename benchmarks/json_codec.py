@@ -0,0 +1,182 @@
+"""
+JSON encoding and decoding benchmarks for pyZscaler.
+
+Times response decoding and request encoding with each installed JSON backend on large pages modelled on ZIA URL
+categories with full URL lists, ZIA ``cloudApplications/lite`` and ZPA ``policySet`` rules, and reports the time per
+MB of JSON. Responses are decoded through :class:`~pyzscaler.utils.JSONResponse`, as the API client does, and the
+``json`` backend is what requests does without a faster library installed.
+
+Examples:
+    Time every installed backend on 5 MB pages::
+
+        python -m benchmarks.json_codec --size-mb 5
+
+"""
+import argparse
+import json
+import sys
+import time
+
+from pyzscaler import utils
+
+
+def url_categories(count: int) -> list:
+    """Custom URL categories as returned by ``url_categories.list_categories``, each with a full URL list."""
+    return [
+        {
+            "id": f"CUSTOM_{i:02d}",
+            "configuredName": f"Allowed Sites {i}",
+            "superCategory": "USER_DEFINED",
+            "keywords": [],
+            "keywordsRetainingParentCategory": [],
+            "urls": [f"app{j}.tenant{i}.example.com/path/{j}" for j in range(500)],
+            "dbCategorizedUrls": [f".cdn{j}.example.net" for j in range(100)],
+            "customCategory": True,
+            "editable": True,
+            "description": "Sites allowed for the finance department",
+            "type": "URL_CATEGORY",
+            "val": 128 + i,
+            "customUrlsCount": 500,
+            "urlsRetainingParentCategoryCount": 0,
+        }
+        for i in range(count)
+    ]
+
+
+def cloud_apps(count: int) -> list:
+    """Cloud applications as returned by ``cloudApplications/lite``."""
+    return [
+        {"id": i, "name": f"Cloud Application {i}", "parent": "SAAS", "parentName": "Sanctioned SaaS", "risk": i % 5}
+        for i in range(count)
+    ]
+
+
+def policy_rules(count: int) -> list:
+    """ZPA access policy rules as returned by ``policies.list_rules``."""
+    return [
+        {
+            "id": f"2161962573312{i:05d}",
+            "name": f"Allow Finance {i}",
+            "description": "Allow the finance groups to reach the finance applications",
+            "action": "ALLOW",
+            "policyType": "1",
+            "ruleOrder": str(i + 1),
+            "priority": str(i + 1),
+            "operator": "AND",
+            "creationTime": "1623132834",
+            "modifiedTime": "1657076234",
+            "conditions": [
+                {
+                    "id": f"{i}{c}",
+                    "negated": False,
+                    "operator": "OR",
+                    "operands": [
+                        {
+                            "id": f"{i}{c}{o}",
+                            "objectType": "APP" if c == 0 else "SCIM_GROUP",
+                            "lhs": "id" if c == 0 else "216196257331281920",
+                            "rhs": f"21619625733129{o:04d}",
+                            "name": f"Operand {o}",
+                        }
+                        for o in range(8)
+                    ],
+                }
+                for c in range(3)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+PAYLOADS = {"zia_url_categories": url_categories, "zia_cloud_apps_lite": cloud_apps, "zpa_policy_rules": policy_rules}
+
+# The number of records of each payload in roughly 1 MB of JSON.
+_records_per_mb = {"zia_url_categories": 45, "zia_cloud_apps_lite": 9000, "zpa_policy_rules": 300}
+
+
+def payload(name: str, size_mb: float) -> list:
+    """Returns a page of ``name`` records that is about ``size_mb`` MB as JSON."""
+    return PAYLOADS[name](max(1, int(_records_per_mb[name] * size_mb)))
+
+
+def response(body: bytes) -> utils.JSONResponse:
+    """Builds a JSON response holding ``body``, as the transport adapter would."""
+    resp = utils.JSONResponse()
+    resp._content = body
+    resp.status_code = 200
+    resp.encoding = "utf-8"
+    resp.headers["Content-Type"] = "application/json"
+    return resp
+
+
+def timed(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations
+
+
+def installed_backends() -> list:
+    return [name for name, (loads, _) in utils.json_backends.items() if loads is not None]
+
+
+def run_case(name: str, backend: str, size_mb: float = 2.0, iterations: int = 10) -> dict:
+    """Times decoding and encoding one payload with one backend, returning the measurements."""
+    data = payload(name, size_mb)
+    body = json.dumps(data).encode("utf-8")
+    megabytes = len(body) / 1e6
+
+    previous = utils.json_backend
+    utils.set_json_backend(backend)
+    try:
+        resp = response(body)
+        if resp.json() != data or json.loads(utils.json_dumps(data)) != data:
+            raise RuntimeError(f"The {backend} backend doesn't round-trip {name}")
+        decode = timed(resp.json, iterations)
+        encode = timed(lambda: utils.json_dumps(data), iterations)
+    finally:
+        utils.set_json_backend(previous)
+    return {
+        "payload": name,
+        "backend": backend,
+        "size_mb": round(megabytes, 2),
+        "decode_ms_per_mb": round(decode * 1000 / megabytes, 2),
+        "encode_ms_per_mb": round(encode * 1000 / megabytes, 2),
+    }
+
+
+def run(size_mb: float = 2.0, iterations: int = 10, backends: list = None) -> list:
+    """Runs every payload with every installed backend, adding each backend's decode speedup over ``json``."""
+    results = []
+    for name in PAYLOADS:
+        cases = [run_case(name, backend, size_mb, iterations) for backend in backends or installed_backends()]
+        baseline = next((case for case in cases if case["backend"] == "json"), None)
+        for case in cases:
+            case["decode_speedup"] = round(baseline["decode_ms_per_mb"] / case["decode_ms_per_mb"], 2) if baseline else None
+        results.extend(cases)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=2.0, help="The approximate size of each page in MB")
+    parser.add_argument("--iterations", type=int, default=10, help="Decodes and encodes to time for each case")
+    parser.add_argument("--backends", nargs="+", choices=list(utils.json_backends), help="Defaults to every installed one")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run(args.size_mb, args.iterations, args.backends)
+
+    columns = ("payload", "backend", "size_mb", "decode_ms_per_mb", "encode_ms_per_mb", "decode_speedup")
+    print(" ".join(f"{column:>20}" for column in columns))
+    for case in results:
+        print(" ".join(f"{str(case[column]):>20}" for column in columns))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
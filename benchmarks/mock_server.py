@@ -0,0 +1,168 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ZPA_CUSTOMER_ID = "1"
+
+
+def make_record(index: int) -> dict:
+    """Returns a record shaped like a typical Zscaler object, with camelCase and nested keys for Box to convert."""
+    return {
+        "id": index,
+        "name": f"record-{index}",
+        "description": "Benchmark record",
+        "enabled": True,
+        "creationTime": 1690000000 + index,
+        "modifiedBy": {"id": 1, "name": "admin@example.com"},
+        "serverGroups": [{"id": index % 10, "name": f"group-{index % 10}"}],
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so that the requests session can keep the connection alive between pages.
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.mock.handle(self, "GET")
+
+    def do_POST(self):
+        self.server.mock.handle(self, "POST")
+
+    def do_DELETE(self):
+        self.server.mock.handle(self, "DELETE")
+
+
+class MockZscalerServer:
+    """
+    A local stand-in for the Zscaler APIs that serves paginated collections of generated records.
+
+    The server emulates the ZIA ``page``/``pageSize``, ZPA ``page``/``pagesize`` with ``list``/``totalPages`` and ZDX
+    ``limit``/``offset`` with ``next_offset`` response formats, along with just enough of each authentication flow for
+    the pyZscaler controllers to sign in. Point a controller at it with ``override_url``:
+
+    * ZIA: ``{url}/zia/api/v1`` serving ``users``
+    * ZPA: ``{url}/zpa`` with customer ID ``1``, serving ``application``
+    * ZDX: ``{url}/zdx/v1`` serving ``devices``
+
+    Args:
+        records (int): The number of records in each collection.
+        latency (float): The number of seconds to wait before answering each request.
+        throttle_every (int):
+            Answer every nth request with ``429 Too Many Requests`` instead of the page. Defaults to ``0`` (never).
+        retry_after (int): The ``Retry-After`` header sent with throttled responses.
+        zdx_page_size (int): The number of records returned per ZDX page when the client doesn't send ``limit``.
+
+    Examples:
+        >>> with MockZscalerServer(records=10000, latency=0.05) as server:
+        ...     zpa = ZPA(client_id="id", client_secret="secret", customer_id="1", override_url=f"{server.url}/zpa")
+        ...     apps = zpa.app_segments.list_segments()
+
+    """
+
+    def __init__(
+        self,
+        records: int = 1000,
+        latency: float = 0.0,
+        throttle_every: int = 0,
+        retry_after: int = 0,
+        zdx_page_size: int = 1000,
+    ):
+        self.records = records
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.zdx_page_size = zdx_page_size
+        self.requests = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockZscalerServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-zscaler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _page(self, start: int, size: int) -> list:
+        return [make_record(index) for index in range(start, min(start + size, self.records))]
+
+    def handle(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+        """Routes a request to the emulated endpoint."""
+        # Always drain the request body so that the connection can be reused.
+        length = int(handler.headers.get("Content-Length") or 0)
+        if length:
+            handler.rfile.read(length)
+
+        url = urlparse(handler.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+
+        with self._lock:
+            self.requests += 1
+            throttle = self.throttle_every and self.requests % self.throttle_every == 0
+            if throttle:
+                self.throttled += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if throttle:
+            return self._send(handler, 429, {"message": "Rate Limit Exceeded"}, {"Retry-After": str(self.retry_after)})
+
+        path = url.path
+        if path == "/zia/api/v1/authenticatedSession":
+            return self._send(handler, 200, {"authType": "ADMIN_LOGIN"}, {"Set-Cookie": "JSESSIONID=benchmark; Path=/"})
+        if path == "/zia/api/v1/users" and method == "GET":
+            size = int(query.get("pageSize", 100))
+            page = int(query.get("page", 1))
+            return self._send(handler, 200, self._page((page - 1) * size, size))
+
+        if path == "/zpa/signin":
+            return self._send(handler, 200, {"token_type": "Bearer", "access_token": "benchmark"})
+        if path == f"/zpa/mgmtconfig/v1/admin/customers/{ZPA_CUSTOMER_ID}/application":
+            size = int(query.get("pagesize", 20))
+            page = int(query.get("page", 1))
+            total_pages = max(1, -(-self.records // size))
+            return self._send(handler, 200, {"totalPages": str(total_pages), "list": self._page((page - 1) * size, size)})
+
+        if path == "/zdx/v1/oauth/token":
+            return self._send(handler, 200, {"token": "benchmark", "token_type": "Bearer", "expires_in": 3600})
+        if path == "/zdx/v1/devices":
+            size = int(query.get("limit", self.zdx_page_size))
+            start = int(query.get("offset", 0))
+            next_offset = str(start + size) if start + size < self.records else None
+            return self._send(handler, 200, {"devices": self._page(start, size), "next_offset": next_offset})
+
+        return self._send(handler, 404, {"message": f"No mock for {method} {path}"})
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, body, headers: dict = None) -> None:
+        data = json.dumps(body).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(data)
@@ -0,0 +1,176 @@
+"""
+Pagination benchmarks for pyZscaler.
+
+Runs :class:`~pyzscaler.utils.Iterator` (ZIA and ZPA) and :class:`~pyzscaler.utils.ZDXIterator` against a local
+:class:`~benchmarks.mock_server.MockZscalerServer` and reports items/sec, p50/p99 page latency and peak RSS for each
+case. Every case runs in a fresh process so that peak RSS isn't inflated by earlier cases.
+
+Examples:
+    Run the default 1k/100k/1M record matrix and save the results::
+
+        python -m benchmarks.pagination --output results.json
+
+    Fail if items/sec regressed by more than 10% against a saved baseline::
+
+        python -m benchmarks.pagination --records 1000 100000 --compare results.json --threshold 0.1
+
+"""
+import argparse
+import json
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from benchmarks.mock_server import ZPA_CUSTOMER_ID, MockZscalerServer
+
+PRODUCTS = ("zia", "zpa", "zdx")
+
+
+def _controller(product: str, url: str, rate: float):
+    """Returns a controller signed in to the mock server with a rate limiter of ``rate`` requests per second."""
+    from pyzscaler import ZDX, ZIA, ZPA
+    from pyzscaler.ratelimit import RateLimiter
+
+    limiter = RateLimiter(product.upper(), rate=rate, burst=rate)
+    if product == "zia":
+        return ZIA(
+            api_key="benchmark123",
+            username="admin@example.com",
+            password="password",
+            override_url=f"{url}/zia/api/v1",
+            rate_limiter=limiter,
+        )
+    if product == "zpa":
+        return ZPA(
+            client_id="id",
+            client_secret="secret",
+            customer_id=ZPA_CUSTOMER_ID,
+            override_url=f"{url}/zpa",
+            rate_limiter=limiter,
+        )
+    return ZDX(client_id="id", client_secret="secret", override_url=f"{url}/zdx/v1", rate_limiter=limiter)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes everywhere else.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(product: str, url: str, records: int, rate: float, prefetch: int, stream: bool) -> dict:
+    """Lists every record of one product from the mock server, returning the measurements for the case."""
+    from box import BoxList
+
+    from pyzscaler.utils import Iterator, ZDXIterator
+
+    api = _controller(product, url, rate)
+    if product == "zia":
+        iterator = Iterator(api, "users", prefetch=prefetch)
+    elif product == "zpa":
+        iterator = Iterator(api, "application", prefetch=prefetch)
+    else:
+        iterator = ZDXIterator(api, "devices", result_key="devices", prefetch=bool(prefetch))
+
+    # Time each page request, including any wait on the rate limiter and 429 retries.
+    latencies = []
+    fetch = iterator._fetch
+
+    def timed_fetch(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fetch(*args, **kwargs)
+        finally:
+            latencies.append(time.perf_counter() - start)
+
+    iterator._fetch = timed_fetch
+
+    start = time.perf_counter()
+    if stream:
+        count = sum(1 for _ in iterator)
+    else:
+        count = len(BoxList(iterator))
+    elapsed = time.perf_counter() - start
+
+    if count != records:
+        raise RuntimeError(f"{product} returned {count} of {records} records")
+
+    latencies.sort()
+    return {
+        "product": product,
+        "records": records,
+        "pages": len(latencies),
+        "seconds": round(elapsed, 3),
+        "items_per_sec": round(count / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000, 2),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def run(products, record_counts, latency=0.0, throttle_every=0, rate=1000000.0, prefetch=0, stream=False) -> list:
+    """Runs every product and record count combination, each in a fresh process, returning the results."""
+    results = []
+    for records in record_counts:
+        with MockZscalerServer(records=records, latency=latency, throttle_every=throttle_every) as server:
+            for product in products:
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                    future = executor.submit(run_case, product, server.url, records, rate, prefetch, stream)
+                    results.append(future.result())
+    return results
+
+
+def compare(results: list, baseline: list, threshold: float) -> list:
+    """Returns a description of every case whose items/sec fell more than ``threshold`` below the baseline."""
+    previous = {(case["product"], case["records"]): case for case in baseline}
+    regressions = []
+    for case in results:
+        before = previous.get((case["product"], case["records"]))
+        if before and case["items_per_sec"] < before["items_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{case['product']} {case['records']} records: {case['items_per_sec']} items/sec "
+                f"(baseline {before['items_per_sec']})"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--products", nargs="+", choices=PRODUCTS, default=list(PRODUCTS))
+    parser.add_argument("--records", nargs="+", type=int, default=[1000, 100000, 1000000])
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the mock server waits before each response")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Answer every nth request with a 429")
+    parser.add_argument(
+        "--rate", type=float, default=1000000.0, help="Requests per second allowed by the rate limiter (default: no limit)"
+    )
+    parser.add_argument("--prefetch", type=int, default=0, help="Pages to prefetch ahead of the page being consumed")
+    parser.add_argument("--stream", action="store_true", help="Stream records instead of collecting a BoxList")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="A JSON file of previous results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Allowed items/sec regression (default: 0.1)")
+    args = parser.parse_args(argv)
+
+    results = run(args.products, args.records, args.latency, args.throttle_every, args.rate, args.prefetch, args.stream)
+
+    columns = ("product", "records", "pages", "seconds", "items_per_sec", "p50_ms", "p99_ms", "peak_rss_mb")
+    print(" ".join(f"{column:>14}" for column in columns))
+    for case in results:
+        print(" ".join(f"{case[column]:>14}" for column in columns))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
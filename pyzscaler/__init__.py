@@ -6,8 +6,37 @@ __contributors__ = [
 ]
 __version__ = "1.6.0"
 
-from pyzscaler.zcc import ZCC  # noqa
-from pyzscaler.zcon import ZCON  # noqa
-from pyzscaler.zdx import ZDX  # noqa
-from pyzscaler.zia import ZIA  # noqa
-from pyzscaler.zpa import ZPA  # noqa
+import importlib
+
+# The controllers are imported on first access, so that importing pyzscaler only loads the product that is used.
+_exports = {
+    "AsyncZCC": "pyzscaler.aio",
+    "AsyncZCON": "pyzscaler.aio",
+    "AsyncZDX": "pyzscaler.aio",
+    "AsyncZIA": "pyzscaler.aio",
+    "AsyncZPA": "pyzscaler.aio",
+    "TenantPool": "pyzscaler.pool",
+    "ZCC": "pyzscaler.zcc",
+    "ZCON": "pyzscaler.zcon",
+    "ZDX": "pyzscaler.zdx",
+    "ZIA": "pyzscaler.zia",
+    "ZPA": "pyzscaler.zpa",
+}
+
+_submodules = ("aio", "batch", "cache", "models", "pool", "ratelimit", "tokens", "utils", "zcc", "zcon", "zdx", "zia", "zpa")
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_exports[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports) | set(_submodules))
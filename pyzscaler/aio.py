@@ -0,0 +1,201 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from restfly import APIIterator
+from restfly.endpoint import APIEndpoint
+
+import pyzscaler
+
+_DONE = object()
+
+
+class AsyncIterator:
+    """
+    Asynchronous wrapper for the iterator returned by list methods called with ``stream=True``.
+
+    Each page is requested on the controller's worker pool, so ``async for`` only yields control to the event loop while
+    a page is in flight.
+
+    """
+
+    def __init__(self, iterator: APIIterator, run):
+        self._iterator = iterator
+        self._run = run
+
+    def __getattr__(self, name):
+        return getattr(self._iterator, name)
+
+    def __aiter__(self):
+        return self
+
+    def _next(self):
+        # StopIteration can't be raised into a Future, so the end of iteration is returned as a sentinel instead.
+        try:
+            return self._iterator.next()
+        except StopIteration:
+            return _DONE
+
+    async def __anext__(self):
+        # Records on the current page are returned without a round trip to the worker pool.
+        if self._iterator.page_count < len(self._iterator.page):
+            record = self._next()
+        else:
+            record = await self._run(self._next)
+        if record is _DONE:
+            raise StopAsyncIteration
+        return record
+
+
+class AsyncEndpoint:
+    """
+    Asynchronous wrapper for an endpoint interface.
+
+    Every public method of the wrapped endpoint becomes a coroutine function that runs the original method, including
+    its payload building, on the controller's worker pool.
+
+    """
+
+    def __init__(self, endpoint: APIEndpoint, run):
+        self._endpoint = endpoint
+        self._run = run
+
+    def __getattr__(self, name):
+        attr = getattr(self._endpoint, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            result = await self._run(functools.partial(attr, *args, **kwargs))
+            if isinstance(result, APIIterator):
+                return AsyncIterator(result, self._run)
+            return result
+
+        return method
+
+
+class AsyncController:
+    """
+    Base class for the asynchronous controllers.
+
+    An asynchronous controller signs in and stores its session exactly like the synchronous controller it wraps, and
+    exposes the same endpoint interfaces with every method returning a coroutine. Requests are sent from a bounded worker
+    pool that shares the controller's HTTP connection pool and rate limiter, so one event loop can fan out thousands of
+    calls while ``max_concurrency`` requests are in flight.
+
+    Args:
+        max_concurrency (int): The maximum number of requests in flight at once. Defaults to ``32``.
+        **kw: The keyword arguments accepted by the synchronous controller.
+
+    """
+
+    _controller = None
+
+    def __init__(self, max_concurrency: int = 32, **kw):
+        self.max_concurrency = max_concurrency
+        # Keep a pooled connection for every request that can be in flight.
+        kw.setdefault("pool_maxsize", max_concurrency)
+        self._kw = kw
+        self._api = None
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="pyzscaler-async")
+
+    async def _run(self, func):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def open(self) -> None:
+        """Signs in to the API. This is called automatically when the controller is used with ``async with``."""
+        if self._api is None:
+            self._api = await self._run(functools.partial(getattr(pyzscaler, self._controller), **self._kw))
+
+    async def close(self) -> None:
+        """Ends the session and releases the worker pool."""
+        if self._api is not None:
+            await self._run(functools.partial(self._api.__exit__, None, None, None))
+            self._api = None
+        self._executor.shutdown(wait=False)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if self._api is None:
+            raise RuntimeError(f"{type(self).__name__} must be opened with 'async with' or 'await open()' before use.")
+        attr = getattr(self._api, name)
+        if isinstance(attr, APIEndpoint):
+            return AsyncEndpoint(attr, self._run)
+        return attr
+
+
+class AsyncZIA(AsyncController):
+    """
+    An asynchronous Controller to access Endpoints in the Zscaler Internet Access (ZIA) API.
+
+    Accepts the same arguments as :class:`~pyzscaler.ZIA` along with ``max_concurrency``.
+
+    Examples:
+        Fetch 5,000 users concurrently:
+
+        >>> async with AsyncZIA(api_key='API_KEY', cloud='CLOUD', username='USERNAME', password='PASSWORD') as zia:
+        ...     users = await asyncio.gather(*(zia.users.get_user(user_id) for user_id in user_ids))
+
+    """
+
+    _controller = "ZIA"
+
+
+class AsyncZPA(AsyncController):
+    """
+    An asynchronous Controller to access Endpoints in the Zscaler Private Access (ZPA) API.
+
+    Accepts the same arguments as :class:`~pyzscaler.ZPA` along with ``max_concurrency``.
+
+    Examples:
+        Stream application segments:
+
+        >>> async with AsyncZPA(client_id='CLIENT_ID', client_secret='CLIENT_SECRET', customer_id='CUSTOMER_ID') as zpa:
+        ...     async for segment in await zpa.app_segments.list_segments(stream=True):
+        ...         print(segment.name)
+
+    """
+
+    _controller = "ZPA"
+
+
+class AsyncZDX(AsyncController):
+    """
+    An asynchronous Controller to access Endpoints in the Zscaler Digital Experience (ZDX) API.
+
+    Accepts the same arguments as :class:`~pyzscaler.ZDX` along with ``max_concurrency``.
+
+    """
+
+    _controller = "ZDX"
+
+
+class AsyncZCC(AsyncController):
+    """
+    An asynchronous Controller to access Endpoints in the Zscaler Mobile Admin Portal API.
+
+    Accepts the same arguments as :class:`~pyzscaler.ZCC` along with ``max_concurrency``.
+
+    """
+
+    _controller = "ZCC"
+
+
+class AsyncZCON(AsyncController):
+    """
+    An asynchronous Controller to access Endpoints in the Zscaler Cloud and Branch Connector API.
+
+    Accepts the same arguments as :class:`~pyzscaler.ZCON` along with ``max_concurrency``.
+
+    """
+
+    _controller = "ZCON"
@@ -0,0 +1,254 @@
+import base64
+import contextlib
+import hashlib
+import hmac
+import json
+import os
+import tempfile
+import threading
+import time
+
+from requests.cookies import remove_cookie_by_name
+
+from pyzscaler.tokens import jwt_expiry
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:
+    Fernet = InvalidToken = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+
+def _derive(secret: str, salt: bytes, iterations: int) -> bytes:
+    """Derives a 32-byte key from the credentials with PBKDF2-HMAC-SHA256."""
+    return hashlib.pbkdf2_hmac("sha256", secret.encode(), salt, iterations)
+
+
+def seal(secret: str, plaintext: bytes, iterations: int = 100000) -> bytes:
+    """
+    Binds ``plaintext`` to ``secret`` for storage in the cache.
+
+    When ``cryptography`` is installed the plaintext is encrypted with Fernet, using a key derived from ``secret`` and a
+    random salt. Otherwise it is stored as-is alongside a salted PBKDF2 fingerprint of ``secret``, which only stops a
+    process holding other credentials from using the entry.
+
+    """
+    salt = os.urandom(16)
+    key = _derive(secret, salt, iterations)
+    if Fernet is not None:
+        return b"fernet:" + base64.b64encode(salt) + b":" + Fernet(base64.urlsafe_b64encode(key)).encrypt(plaintext)
+    return b"plain:" + base64.b64encode(salt) + b":" + base64.b64encode(key) + b":" + plaintext
+
+
+def unseal(secret: str, data: bytes, iterations: int = 100000) -> bytes:
+    """Reverses :func:`seal`, raising :obj:`ValueError` if ``secret`` is wrong or the entry can't be read."""
+    scheme, salt, rest = data.split(b":", 2)
+    key = _derive(secret, base64.b64decode(salt), iterations)
+    if scheme == b"fernet" and Fernet is not None:
+        try:
+            return Fernet(base64.urlsafe_b64encode(key)).decrypt(rest)
+        except InvalidToken:
+            raise ValueError("The cache entry could not be decrypted.") from None
+    if scheme == b"plain":
+        fingerprint, plaintext = rest.split(b":", 1)
+        if hmac.compare_digest(base64.b64decode(fingerprint), key):
+            return plaintext
+    raise ValueError("The cache entry could not be read with these credentials.")
+
+
+class TokenCache:
+    """
+    An on-disk cache of session tokens and cookies that is shared between processes.
+
+    Each entry is scoped to the product, API URL and user or client ID, and is only used by a process holding the same
+    credentials. Entries are written to a directory and files that only their owner can access. If the optional
+    ``cryptography`` package is installed (``pip install pyzscaler[cryptography]``), entries are also encrypted with a
+    key derived from the credentials; otherwise the tokens are stored unencrypted. Processes take a file lock while
+    they read or create an entry, so a fleet of short-lived processes signs in once and reuses the session until it
+    expires.
+
+    Args:
+        path (str): The cache directory. Defaults to ``$XDG_CACHE_HOME/pyzscaler`` or ``~/.cache/pyzscaler``.
+        ttl (float):
+            The lifetime in seconds of sessions whose expiry isn't reported, e.g. ZIA and ZCON session cookies.
+            Defaults to ``1800``.
+        margin (float): Entries that expire within this many seconds are treated as expired. Defaults to ``60``.
+
+    Examples:
+        Reuse the ZIA session between script runs:
+
+        >>> zia = ZIA(api_key='API_KEY', cloud='CLOUD', username='USERNAME', password='PASSWORD',
+        ...    token_cache=TokenCache())
+
+    """
+
+    iterations = 100000
+
+    def __init__(self, path: str = None, ttl: float = 1800, margin: float = 60):
+        self.path = path or os.path.join(
+            os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "pyzscaler"
+        )
+        self.ttl = ttl
+        self.margin = margin
+
+    def _file(self, scope: tuple) -> str:
+        name = hashlib.sha256("\0".join(str(part) for part in scope).encode()).hexdigest()
+        return os.path.join(self.path, name)
+
+    @contextlib.contextmanager
+    def _lock(self, file: str):
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        with open(f"{file}.lock", "a+") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            elif msvcrt:  # pragma: no cover - Windows
+                msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+                elif msvcrt:  # pragma: no cover - Windows
+                    lock.seek(0)
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _read(self, file: str, secret: str):
+        try:
+            with open(file, "rb") as f:
+                entry = json.loads(unseal(secret, f.read(), self.iterations))
+        except (OSError, ValueError):
+            return None
+        if entry["expires_at"] - self.margin <= time.time():
+            return None
+        return entry
+
+    def _write(self, file: str, secret: str, entry: dict) -> None:
+        fd, temp = tempfile.mkstemp(dir=self.path)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(seal(secret, json.dumps(entry).encode(), self.iterations))
+            os.chmod(temp, 0o600)
+            os.replace(temp, file)
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+    def get_or_create(self, scope: tuple, secret: str, create, stale=None) -> dict:
+        """
+        Returns the cached entry for ``scope``, or creates and stores a new one if there isn't a current entry.
+
+        Args:
+            scope (tuple): The values that identify the session, e.g. the product, URL and client ID.
+            secret (str): The credential secret that the entry is bound to.
+            create:
+                A callable that signs in and returns a tuple of ``(data, expires_at)``, where ``data`` is a dict and
+                ``expires_at`` is an epoch timestamp or ``None`` to use the cache TTL.
+            stale: Data that was rejected by the API; a cached entry holding it is replaced rather than returned.
+
+        Returns:
+            :obj:`dict`: A dict holding the ``data`` and ``expires_at`` of the entry.
+
+        """
+        file = self._file(scope)
+        with self._lock(file):
+            entry = self._read(file, secret)
+            if entry is not None and (stale is None or entry["data"] != stale):
+                return entry
+
+            data, expires_at = create()
+            entry = {"data": data, "expires_at": expires_at or time.time() + self.ttl}
+            self._write(file, secret, entry)
+            return entry
+
+    def token(self, scope: tuple, secret: str, create, stale: str = None) -> tuple:
+        """
+        Returns a cached bearer token, in the ``(token, expires_in)`` form used by :class:`~pyzscaler.tokens.TokenManager`.
+
+        Args:
+            scope (tuple): The values that identify the session.
+            secret (str): The credential secret that the entry is bound to.
+            create: A callable that signs in and returns a tuple of ``(token, expires_in)``.
+            stale (str): The token currently in use, which is replaced rather than returned.
+
+        """
+
+        def create_entry():
+            token, expires_in = create()
+            return {"token": token}, time.time() + float(expires_in) if expires_in else jwt_expiry(token)
+
+        entry = self.get_or_create(scope, secret, create_entry, stale={"token": stale} if stale else None)
+        return entry["data"]["token"], entry["expires_at"] - time.time()
+
+    def cookies(self, scope: tuple, secret: str, session, create, stale: dict = None) -> None:
+        """
+        Restores cached session cookies into ``session``, signing in with ``create`` if there aren't any.
+
+        Args:
+            scope (tuple): The values that identify the session.
+            secret (str): The credential secret that the entry is bound to.
+            session (:obj:`requests.Session`): The session that holds the cookies.
+            create: A callable that signs in, setting the session cookies.
+            stale (dict): The cookies that were rejected by the API, which are replaced rather than restored.
+
+        """
+
+        def create_entry():
+            for name in stale or ():
+                remove_cookie_by_name(session.cookies, name)
+            create()
+            return {"cookies": session.cookies.get_dict()}, None
+
+        entry = self.get_or_create(scope, secret, create_entry, stale={"cookies": stale} if stale else None)
+        for name, value in entry["data"]["cookies"].items():
+            # Drop the cookie set by the sign-in response, or a rejected one, so that only one value is sent.
+            remove_cookie_by_name(session.cookies, name)
+            session.cookies.set(name, value)
+
+    def cookie_hook(self, scope: tuple, secret: str, session, create):
+        """
+        Returns a :mod:`requests` response hook that replaces cached session cookies rejected with ``401``.
+
+        The session signs in again through the cache, unless another process has already replaced the cookies, and the
+        request is re-sent once with the new cookies.
+
+        Args:
+            scope (tuple): The values that identify the session.
+            secret (str): The credential secret that the entry is bound to.
+            session (:obj:`requests.Session`): The session that holds the cookies.
+            create: A callable that signs in, setting the session cookies.
+
+        """
+        local = threading.local()
+
+        def hook(response, *args, **kwargs):
+            request = response.request
+            if response.status_code != 401 or getattr(local, "refreshing", False) or getattr(request, "cookie_retried", False):
+                return response
+            sent = dict(pair.split("=", 1) for pair in request.headers.get("Cookie", "").split("; ") if "=" in pair)
+            local.refreshing = True
+            try:
+                self.cookies(scope, secret, session, create, stale=sent or None)
+            finally:
+                local.refreshing = False
+
+            retry = request.copy()
+            retry.headers.pop("Cookie", None)
+            retry.prepare_cookies(session.cookies)
+            retry.cookie_retried = True
+            # Release the connection of the rejected response before re-sending.
+            response.content
+            response.close()
+            new_response = response.connection.send(retry, **kwargs)
+            new_response.history.append(response)
+            new_response.request = retry
+            return new_response
+
+        return hook
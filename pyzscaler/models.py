@@ -0,0 +1,297 @@
+from pyzscaler.utils import SnakeView, camel_to_snake, snake_to_camel
+
+
+class RecordMeta(type):
+    """
+    Builds the ``__slots__`` of a :class:`Record` subclass from the API keys listed in its ``_fields``.
+
+    Each field is stored in a slot named after its snake_case attribute. Fields listed in ``_nested`` are stored as the
+    raw value in a private slot and wrapped in a :class:`~pyzscaler.utils.SnakeView` when the attribute is read.
+
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        fields = namespace.get("_fields", ())
+        nested = set(namespace.get("_nested", ()))
+        slots = {}
+        for key in fields:
+            attribute = camel_to_snake(key)
+            if key in nested:
+                slots[key] = f"_{attribute}"
+                namespace[attribute] = property(_nested_getter(f"_{attribute}"))
+            else:
+                slots[key] = attribute
+        namespace["__slots__"] = tuple(namespace.get("__slots__", ())) + tuple(slots.values())
+        cls = super().__new__(mcs, name, bases, namespace)
+        # Map every API key of the record, including inherited fields, to the slot it is stored in.
+        cls._slots = {**getattr(cls, "_slots", {}), **slots}
+        cls._slot_names = tuple(cls._slots.values())
+        return cls
+
+
+def _nested_getter(slot: str):
+    def getter(self):
+        return SnakeView._wrap(getattr(self, slot))
+
+    return getter
+
+
+class Record(metaclass=RecordMeta):
+    """
+    Base class for compact, read-only record models.
+
+    A record keeps each known field in a slot, so it costs a fraction of the memory of a :obj:`Box` holding the same
+    data. Fields are read as snake_case attributes. Keys that aren't declared fields are kept in a small dict and can
+    still be read as attributes, and nested records are only wrapped when they are read.
+
+    Args:
+        data (dict): The raw record returned by the API.
+
+    """
+
+    _fields = ()
+    _nested = ()
+    __slots__ = ("_extra",)
+
+    def __init__(self, data: dict):
+        slots = self._slots
+        for slot in self._slot_names:
+            setattr(self, slot, None)
+        extra = None
+        for key, value in data.items():
+            slot = slots.get(key)
+            if slot is not None:
+                setattr(self, slot, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self._extra = extra
+
+    def __getattr__(self, name):
+        extra = self._extra
+        if extra:
+            key = snake_to_camel(name)
+            if key in extra:
+                return SnakeView._wrap(extra[key])
+            if name in extra:
+                return SnakeView._wrap(extra[name])
+        raise AttributeError(f"'{type(self).__name__}' record has no field '{name}'")
+
+    def get(self, name: str, default=None):
+        """Returns the value of a field, or ``default`` if the record doesn't have it."""
+        try:
+            value = getattr(self, name)
+        except AttributeError:
+            return default
+        return default if value is None else value
+
+    def to_dict(self) -> dict:
+        """Returns the record as a camelCase dict in the form the API returned it, omitting empty fields."""
+        data = {key: getattr(self, slot) for key, slot in self._slots.items() if getattr(self, slot) is not None}
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class ZIAUser(Record):
+    """A ZIA user, as returned by ``zia.users.list_users(model=True)``."""
+
+    _fields = (
+        "id",
+        "name",
+        "email",
+        "groups",
+        "department",
+        "comments",
+        "tempAuthEmail",
+        "adminUser",
+        "type",
+        "isNonEditable",
+        "disabled",
+        "deleted",
+    )
+    _nested = ("groups", "department")
+
+
+class ZIALocation(Record):
+    """A ZIA location, as returned by ``zia.locations.list_locations(model=True)``."""
+
+    _fields = (
+        "id",
+        "name",
+        "description",
+        "parentId",
+        "upBandwidth",
+        "dnBandwidth",
+        "country",
+        "tz",
+        "profile",
+        "ipAddresses",
+        "ports",
+        "vpnCredentials",
+        "authRequired",
+        "sslScanEnabled",
+        "zappSslScanEnabled",
+        "xffForwardEnabled",
+        "surrogateIP",
+        "idleTimeInMinutes",
+        "displayTimeUnit",
+        "surrogateIPEnforcedForKnownBrowsers",
+        "surrogateRefreshTimeInMinutes",
+        "surrogateRefreshTimeUnit",
+        "ofwEnabled",
+        "ipsControl",
+        "aupEnabled",
+        "cautionEnabled",
+        "aupBlockInternetUntilAccepted",
+        "aupForceSslInspection",
+        "aupTimeoutInDays",
+        "ipv6Enabled",
+        "ipv6Dns64Prefix",
+        "staticLocationGroups",
+        "dynamiclocationGroups",
+    )
+    _nested = ("vpnCredentials", "staticLocationGroups", "dynamiclocationGroups")
+
+
+class ZPAAppSegment(Record):
+    """A ZPA application segment, as returned by ``zpa.app_segments.list_segments(model=True)``."""
+
+    _fields = (
+        "id",
+        "name",
+        "description",
+        "enabled",
+        "domainNames",
+        "doubleEncrypt",
+        "configSpace",
+        "bypassType",
+        "healthCheckType",
+        "healthReporting",
+        "icmpAccessType",
+        "ipAnchored",
+        "isCnameEnabled",
+        "passiveHealthEnabled",
+        "selectConnectorCloseToApp",
+        "segmentGroupId",
+        "segmentGroupName",
+        "tcpPortRanges",
+        "udpPortRanges",
+        "tcpPortRange",
+        "udpPortRange",
+        "serverGroups",
+        "clientlessApps",
+        "creationTime",
+        "modifiedBy",
+        "modifiedTime",
+    )
+    _nested = ("tcpPortRange", "udpPortRange", "serverGroups", "clientlessApps")
+
+
+class ZPAServer(Record):
+    """A ZPA application server, as returned by ``zpa.servers.list_servers(model=True)``."""
+
+    _fields = (
+        "id",
+        "name",
+        "description",
+        "address",
+        "enabled",
+        "appServerGroupIds",
+        "configSpace",
+        "creationTime",
+        "modifiedBy",
+        "modifiedTime",
+    )
+
+
+class ZPAConnector(Record):
+    """A ZPA App Connector, as returned by ``zpa.connectors.list_connectors(model=True)``."""
+
+    _fields = (
+        "id",
+        "name",
+        "description",
+        "enabled",
+        "appConnectorGroupId",
+        "appConnectorGroupName",
+        "controlChannelStatus",
+        "ctrlBrokerName",
+        "currentVersion",
+        "expectedVersion",
+        "previousVersion",
+        "fingerprint",
+        "ipAcl",
+        "issuedCertId",
+        "lastBrokerConnectTime",
+        "lastBrokerDisconnectTime",
+        "lastUpgradeTime",
+        "latitude",
+        "longitude",
+        "location",
+        "platform",
+        "privateIp",
+        "publicIp",
+        "upgradeAttempt",
+        "upgradeStatus",
+        "enrollmentCert",
+        "creationTime",
+        "modifiedBy",
+        "modifiedTime",
+    )
+    _nested = ("enrollmentCert",)
+
+
+class ZCCDevice(Record):
+    """A device enrolled in Client Connector, as returned by ``zcc.devices.list_devices(model=True)``."""
+
+    _fields = (
+        "udid",
+        "user",
+        "type",
+        "osVersion",
+        "agentVersion",
+        "companyName",
+        "owner",
+        "macAddress",
+        "machineHostname",
+        "manufacturer",
+        "hardwareFingerprint",
+        "policyName",
+        "state",
+        "registrationState",
+        "tunnelVersion",
+        "upmVersion",
+        "vpnState",
+        "zappArch",
+        "detail",
+        "downloadCount",
+        "keepAliveTime",
+        "deregistrationTimestamp",
+        "config_download_time",
+        "last_seen_time",
+        "registration_time",
+    )
+
+
+class ZDXDevice(Record):
+    """A ZDX device, as returned by ``zdx.devices.list_devices(model=True)``."""
+
+    _fields = ("id", "name", "userid", "geo_loc")
+    _nested = ("geo_loc",)
+
+
+class ZDXUser(Record):
+    """A ZDX user, as returned by ``zdx.users.list_users(model=True)``."""
+
+    _fields = ("id", "name", "email", "devices")
+    _nested = ("devices",)
@@ -0,0 +1,238 @@
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+
+import pyzscaler
+
+products = ("ZCC", "ZCON", "ZDX", "ZIA", "ZPA")
+
+TenantResult = namedtuple("TenantResult", ["tenant", "result", "error"])
+TenantResult.__doc__ = """
+The outcome of an operation on one tenant. ``result`` holds the return value when the operation succeeded and ``error``
+holds the exception when it failed.
+"""
+
+
+class TenantPool:
+    """
+    A pool of controllers for many tenants that are built on first use and reused between jobs.
+
+    Tenants are registered by name with their product and credentials. Controllers are cached by product and
+    credentials, so tenants registered twice share one session, connection pool and rate limiter. At most
+    ``max_controllers`` are kept signed in; the least recently used controller is evicted when the limit is reached,
+    and closed once no operation holds a :meth:`lease` on it.
+    Operations run with :meth:`run` and :meth:`map` share a bounded thread pool, with at most ``per_tenant`` operations
+    running against any one tenant.
+
+    Args:
+        max_workers (int): The number of operations that can run at once across all tenants. Defaults to ``16``.
+        per_tenant (int): The number of operations that can run at once against one tenant. Defaults to ``4``.
+        max_controllers (int): The number of controllers to keep signed in. Defaults to ``None`` (no limit).
+
+    Examples:
+        List the locations of every tenant:
+
+        >>> with TenantPool(max_workers=16) as pool:
+        ...     for tenant in tenants:
+        ...         pool.add(tenant.name, "ZIA", api_key=tenant.api_key, cloud=tenant.cloud,
+        ...             username=tenant.username, password=tenant.password)
+        ...     for item in pool.map("locations", "list_locations"):
+        ...         print(item.tenant, item.error or len(item.result))
+
+    """
+
+    def __init__(self, max_workers: int = 16, per_tenant: int = 4, max_controllers: int = None):
+        self.max_workers = max_workers
+        self.per_tenant = per_tenant
+        self.max_controllers = max_controllers
+        self._tenants = {}
+        self._controllers = OrderedDict()
+        self._building = {}
+        self._semaphores = {}
+        # The number of leases held on each controller, and the evicted controllers waiting for theirs to be released.
+        self._leases = {}
+        self._evicted = set()
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def tenants(self) -> list:
+        """The names of the registered tenants."""
+        return list(self._tenants)
+
+    def add(self, tenant: str, product, **kwargs) -> None:
+        """
+        Registers a tenant. The controller isn't built until the tenant is first used.
+
+        Args:
+            tenant (str): The name of the tenant.
+            product: The product name, e.g. ``ZIA``, or the controller class.
+            **kwargs: The keyword arguments for the controller, e.g. the credentials and cloud.
+
+        """
+        if isinstance(product, str):
+            if product.upper() not in products:
+                raise KeyError(product)
+            controller = getattr(pyzscaler, product.upper())
+        else:
+            controller = product
+        # Size each controller's connection pool to the number of operations that can run against it.
+        kwargs.setdefault("pool_maxsize", self.per_tenant)
+        key = (controller, tuple(sorted((name, repr(value)) for name, value in kwargs.items())))
+        with self._lock:
+            self._tenants[tenant] = (key, controller, kwargs)
+            self._semaphores.setdefault(key, threading.BoundedSemaphore(self.per_tenant))
+
+    def get(self, tenant: str):
+        """
+        Returns the controller for a tenant, signing in on first use.
+
+        The controller is closed if it is evicted to make room for another, so hold a :meth:`lease` instead while using
+        it alongside other tenants.
+
+        Args:
+            tenant (str): The name of the tenant.
+
+        """
+        return self._get(tenant, lease=False)
+
+    @contextmanager
+    def lease(self, tenant: str):
+        """
+        Provides the controller for a tenant, signing in on first use, and keeps it open until the context exits.
+
+        If the controller is evicted while it is leased, it is only closed once every lease on it has been released.
+
+        Args:
+            tenant (str): The name of the tenant.
+
+        Examples:
+            >>> with pool.lease("acme") as zia:
+            ...     users = zia.users.list_users()
+
+        """
+        api = self._get(tenant, lease=True)
+        try:
+            yield api
+        finally:
+            with self._lock:
+                self._leases[api] -= 1
+                idle = not self._leases[api]
+                if idle:
+                    del self._leases[api]
+                close = idle and api in self._evicted
+                if close:
+                    self._evicted.discard(api)
+            if close:
+                api.__exit__(None, None, None)
+
+    def _get(self, tenant: str, lease: bool):
+        key, controller, kwargs = self._tenants[tenant]
+        with self._lock:
+            if key in self._controllers:
+                self._controllers.move_to_end(key)
+                return self._take(self._controllers[key], lease)
+            building = self._building.get(key)
+            if building is None:
+                building = self._building[key] = threading.Lock()
+
+        # Only one thread signs in for each set of credentials; the others wait and reuse its controller.
+        with building:
+            with self._lock:
+                if key in self._controllers:
+                    return self._take(self._controllers[key], lease)
+            api = controller(**kwargs)
+            with self._lock:
+                self._controllers[key] = api
+                self._building.pop(key, None)
+                self._take(api, lease)
+                evicted = []
+                while self.max_controllers and len(self._controllers) > self.max_controllers:
+                    old = self._controllers.popitem(last=False)[1]
+                    # A controller that is still in use is closed when its last lease is released.
+                    if self._leases.get(old):
+                        self._evicted.add(old)
+                    else:
+                        evicted.append(old)
+        for old in evicted:
+            old.__exit__(None, None, None)
+        return api
+
+    def _take(self, api, lease: bool):
+        """Counts a lease on a controller while the pool lock is held."""
+        if lease:
+            self._leases[api] = self._leases.get(api, 0) + 1
+        return api
+
+    def run(self, func, tenants: list = None):
+        """
+        Runs ``func(controller)`` for each tenant, yielding the results as they complete.
+
+        A failure for one tenant is reported in its :obj:`TenantResult` and does not stop the others.
+
+        Args:
+            func: A callable that takes a controller.
+            tenants (list): The names of the tenants to run against. Defaults to all registered tenants.
+
+        Yields:
+            :obj:`TenantResult`: A named tuple of ``(tenant, result, error)`` for each tenant.
+
+        """
+        tenants = self.tenants if tenants is None else list(tenants)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pyzscaler-tenant")
+
+        def call(tenant):
+            with self._semaphores[self._tenants[tenant][0]], self.lease(tenant) as api:
+                return func(api)
+
+        futures = {self._executor.submit(call, tenant): tenant for tenant in tenants}
+        try:
+            for future in as_completed(futures):
+                try:
+                    yield TenantResult(futures[future], future.result(), None)
+                except Exception as e:
+                    yield TenantResult(futures[future], None, e)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def map(self, interface: str, method: str, *args, tenants: list = None, **kwargs):
+        """
+        Calls the same endpoint method on each tenant, yielding the results as they complete.
+
+        Args:
+            interface (str): The name of the endpoint interface, e.g. ``locations``.
+            method (str): The name of the method, e.g. ``list_locations``.
+            *args: Positional arguments for the method.
+            tenants (list): The names of the tenants to run against. Defaults to all registered tenants.
+            **kwargs: Keyword arguments for the method.
+
+        Yields:
+            :obj:`TenantResult`: A named tuple of ``(tenant, result, error)`` for each tenant.
+
+        Examples:
+            >>> results = {item.tenant: item.result for item in pool.map("users", "list_users", dept="Finance")}
+
+        """
+        return self.run(lambda api: getattr(getattr(api, interface), method)(*args, **kwargs), tenants)
+
+    def close(self) -> None:
+        """Signs out of every tenant and releases the thread pool."""
+        with self._lock:
+            controllers = list(self._controllers.values()) + list(self._evicted)
+            self._controllers.clear()
+            self._evicted.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for api in controllers:
+            api.__exit__(None, None, None)
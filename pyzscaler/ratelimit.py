@@ -0,0 +1,589 @@
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+
+def _path_segments(path: str) -> list:
+    """Returns the segments of a request path beneath the API base."""
+    segments = [segment for segment in urlparse(path).path.split("/") if segment]
+
+    # ZPA builds full URLs for the v2 and userconfig APIs, so trim everything up to the customer ID.
+    if "customers" in segments:
+        segments = segments[segments.index("customers") + 2 :]
+    # ZIA and ZCON full URLs are versioned under /api/v1.
+    elif "api" in segments:
+        segments = segments[segments.index("api") + 2 :]
+    else:
+        # ZCC paths are versioned under /papi/public/v1.
+        if segments[:1] == ["papi"]:
+            segments = segments[1:]
+        if segments[:1] == ["public"]:
+            segments = segments[2:]
+    return segments
+
+
+def endpoint_path(path: str) -> str:
+    """
+    Returns a request path relative to the API base, e.g. ``locations/lite`` for a full ZIA URL ending in
+    ``/api/v1/locations/lite`` or ``scimgroup/idpId/1`` for a full ZPA userconfig URL.
+
+    """
+    return "/".join(_path_segments(path))
+
+
+def endpoint_family(path: str) -> str:
+    """
+    Returns the endpoint family for a request path.
+
+    The endpoint family is the first path segment beneath the API base, e.g. ``users`` for ``users/123``,
+    ``application`` for a full ZPA URL ending in ``/customers/1234/application`` or ``getDevices`` for the ZCC path
+    ``public/v1/getDevices``.
+
+    """
+    segments = _path_segments(path)
+    return segments[0] if segments else ""
+
+
+def _relative_path(url: str, base_url: str = "") -> str:
+    """Returns the path of a request URL without its query string and, if supplied, the controller's base URL."""
+    path = url.split("?", 1)[0]
+    if base_url and path.startswith(base_url):
+        path = path[len(base_url) :]
+    return path
+
+
+def retry_after(status: int, headers) -> float:
+    """
+    Returns the number of seconds the API has asked callers to wait before sending another request.
+
+    The wait is read from ``Retry-After`` on a ``429`` response, or from the ``RateLimit-Reset`` header (with or without
+    an ``X-`` prefix) once ``RateLimit-Remaining`` reaches zero. Resets given as an epoch timestamp or ``Retry-After``
+    given as an HTTP date are converted to a number of seconds from now.
+
+    """
+    value = None
+    if status == 429:
+        value = headers.get("Retry-After")
+    if value is None:
+        remaining = headers.get("RateLimit-Remaining", headers.get("X-RateLimit-Remaining"))
+        if remaining is not None and remaining.strip() == "0":
+            value = headers.get("RateLimit-Reset", headers.get("X-RateLimit-Reset"))
+    if value is None:
+        return 0.0
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return 0.0
+    else:
+        # Anything larger than a day is an epoch timestamp rather than a number of seconds.
+        if seconds > 86400:
+            seconds -= time.time()
+    return max(seconds, 0.0)
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket.
+
+    Tokens are replenished at ``rate`` tokens per second up to ``capacity``. Callers only block when a token isn't
+    available, and waiting callers reserve their token up front so that they are served in the order they arrived.
+
+    Args:
+        rate (float): The number of tokens added to the bucket every second.
+        capacity (float): The maximum number of tokens the bucket can hold, i.e. the permitted burst.
+
+    """
+
+    def __init__(self, rate: float = 1.0, capacity: float = 1.0):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserves tokens from the bucket without blocking.
+
+        Args:
+            tokens (float): The number of tokens to take from the bucket.
+
+        Returns:
+            :obj:`float`: The number of seconds the caller must wait before the reservation is honoured.
+
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def delay(self, tokens: float = 1.0) -> float:
+        """
+        Returns the number of seconds until ``tokens`` are available, without taking them.
+
+        Args:
+            tokens (float): The number of tokens required.
+
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(tokens - self._tokens, 0.0) / self.rate
+
+    def take(self, tokens: float = 1.0) -> None:
+        """
+        Takes tokens from the bucket without waiting, e.g. once :meth:`delay` has reported that they are available.
+
+        Args:
+            tokens (float): The number of tokens to take from the bucket.
+
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Takes tokens from the bucket, blocking only until they are available.
+
+        Args:
+            tokens (float): The number of tokens to take from the bucket.
+
+        Returns:
+            :obj:`float`: The number of seconds spent waiting.
+
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def set_rate(self, rate: float) -> None:
+        """
+        Changes the rate that tokens are added to the bucket, keeping the tokens accrued at the previous rate.
+
+        Args:
+            rate (float): The number of tokens added to the bucket every second.
+
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Empties the bucket so that the next token is not available for at least ``seconds``.
+
+        Args:
+            seconds (float): The number of seconds to hold back callers.
+
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            # Leave the bucket one token short of the wait so that the next caller's reservation waits ``seconds``.
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+
+class RateLimiter:
+    """
+    A per-session rate limiter that keeps a :class:`TokenBucket` for every endpoint family of a product.
+
+    Every paginated and bulk call made through a controller draws a token from the bucket for its endpoint family
+    before the request is sent. A limiter instance can be shared between controllers so that several sessions for the
+    same tenant draw from the same budget.
+
+    Args:
+        product (str): The product that the limiter is applied to, e.g. ``ZIA`` or ``ZPA``.
+        rate (float): The default number of requests per second for each endpoint family. Defaults to ``1``.
+        burst (float): The default number of requests that can be sent back-to-back. Defaults to ``1``.
+        limits (dict):
+            Overrides for individual endpoint families, keyed by family with a tuple of ``(rate, burst)``, e.g.
+            ``{"users": (2, 2)}``.
+
+    Examples:
+        Allow two paginated user requests per second for a ZIA session:
+
+        >>> zia = ZIA(api_key='API_KEY', cloud='CLOUD', username='USERNAME', password='PASSWORD',
+        ...    rate_limiter=RateLimiter("ZIA", limits={"users": (2, 2)}))
+
+    """
+
+    def __init__(self, product: str = "", rate: float = 1.0, burst: float = 1.0, limits: dict = None):
+        self.product = product
+        self.rate = rate
+        self.burst = burst
+        self.limits = limits or {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def bucket(self, family: str) -> TokenBucket:
+        """
+        Returns the token bucket for an endpoint family, creating it on first use.
+
+        Args:
+            family (str): The endpoint family.
+
+        Returns:
+            :obj:`TokenBucket`: The token bucket for the endpoint family.
+
+        """
+        key = (self.product, family)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    rate, burst = self.limits.get(family, (self.rate, self.burst))
+                    bucket = self._buckets[key] = TokenBucket(rate, burst)
+        return bucket
+
+    def acquire(self, path: str, tokens: float = 1.0) -> float:
+        """
+        Takes a token for the endpoint family of the supplied request path, blocking only if none are available.
+
+        Args:
+            path (str): The request path or full URL.
+            tokens (float): The number of tokens required for the request.
+
+        Returns:
+            :obj:`float`: The number of seconds spent waiting.
+
+        """
+        return self.bucket(endpoint_family(path)).acquire(tokens)
+
+    def update(self, path: str, status: int, headers) -> None:
+        """
+        Applies the rate-limit feedback from a response to the bucket for its endpoint family.
+
+        When the API asks callers to back off (see :func:`retry_after`) the bucket is paused, so that the next request
+        for the endpoint family waits instead of being throttled again.
+
+        Args:
+            path (str): The request path or full URL.
+            status (int): The response status code.
+            headers: The response headers.
+
+        """
+        wait = retry_after(status, headers)
+        if wait:
+            self.bucket(endpoint_family(path)).pause(wait)
+
+    @contextmanager
+    def limit_requests(self):
+        """
+        Draws a token for every request sent by the current thread while the context is active.
+
+        Each request takes its token from the endpoint family of the URL it is sent to, as the request is sent, so
+        calls whose request path isn't known up front (e.g. the ``get_*`` calls of a batch) draw from the right bucket.
+
+        """
+        previous = getattr(self._local, "limit", False)
+        self._local.limit = True
+        try:
+            yield
+        finally:
+            self._local.limit = previous
+
+    def request_hook(self, base_url: str = ""):
+        """
+        Returns a callable that admits each request before it is sent.
+
+        A :class:`RateLimiter` only limits the paginated and bulk calls that :meth:`acquire` a token and the requests
+        sent within :meth:`limit_requests`. :class:`RequestScheduler` returns a hook that schedules every request.
+
+        Args:
+            base_url (str): The controller's base URL, which is stripped from request URLs to find the request path.
+
+        """
+
+        def hook(request):
+            if getattr(self._local, "limit", False):
+                self.acquire(_relative_path(request.url, base_url))
+
+        return hook
+
+    def response_hook(self, base_url: str = ""):
+        """
+        Returns a :mod:`requests` response hook that feeds every response (including retried ones) to :meth:`update`.
+
+        Args:
+            base_url (str): The controller's base URL, which is stripped from response URLs to find the request path.
+
+        """
+
+        def hook(response, *args, **kwargs):
+            self.update(_relative_path(response.url, base_url), response.status_code, response.headers)
+
+        return hook
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    A :class:`RateLimiter` that adjusts the rate of each endpoint family to the rate the tenant allows.
+
+    The rate is adjusted AIMD-style from the responses: each successful response to a request that drew a token adds
+    ``increase`` requests per second up to ``max_rate``, and each ``429`` multiplies the rate by ``decrease`` down to
+    ``min_rate``. Responses to requests that weren't rate limited don't grow the rate, as they say nothing about
+    whether the tenant allows it. ``Retry-After`` and
+    exhausted ``RateLimit-*`` headers additionally pause the endpoint family as they do for :class:`RateLimiter`.
+
+    Args:
+        product (str): The product that the limiter is applied to, e.g. ``ZIA`` or ``ZPA``.
+        rate (float): The initial number of requests per second for each endpoint family. Defaults to ``1``.
+        burst (float): The number of requests that can be sent back-to-back. Defaults to ``1``.
+        limits (dict): Overrides for the initial ``(rate, burst)`` of individual endpoint families.
+        min_rate (float): The lowest rate the limiter will back off to. Defaults to ``0.1``.
+        max_rate (float): The highest rate the limiter will grow to. Defaults to ``10``.
+        increase (float): The requests per second added after each successful response. Defaults to ``0.1``.
+        decrease (float): The factor applied to the rate after each ``429``. Defaults to ``0.5``.
+
+    Examples:
+        Let ZIA user listings grow to 20 requests per second and watch the current rates:
+
+        >>> limiter = AdaptiveRateLimiter("ZIA", max_rate=20)
+        >>> zia = ZIA(api_key='API_KEY', cloud='CLOUD', username='USERNAME', password='PASSWORD',
+        ...    rate_limiter=limiter)
+        >>> users = zia.users.list_users()
+        >>> limiter.rates
+        {'users': 3.1}
+
+    """
+
+    def __init__(
+        self,
+        product: str = "",
+        rate: float = 1.0,
+        burst: float = 1.0,
+        limits: dict = None,
+        min_rate: float = 0.1,
+        max_rate: float = 10.0,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+    ):
+        super().__init__(product, rate, burst, limits)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        # The number of tokens drawn for each endpoint family whose responses haven't been seen yet.
+        self._drawn = {}
+
+    def _draw(self, family: str) -> None:
+        """Records that a request for the endpoint family drew a token."""
+        with self._lock:
+            self._drawn[family] = self._drawn.get(family, 0) + 1
+
+    def _answered(self, family: str) -> bool:
+        """Consumes a drawn token for the endpoint family, returning whether there was one."""
+        with self._lock:
+            drawn = self._drawn.get(family, 0)
+            if drawn:
+                self._drawn[family] = drawn - 1
+            return bool(drawn)
+
+    @property
+    def rates(self) -> dict:
+        """The current number of requests per second allowed for each endpoint family that has been used."""
+        return {family: bucket.rate for (_, family), bucket in list(self._buckets.items())}
+
+    def acquire(self, path: str, tokens: float = 1.0) -> float:
+        wait = super().acquire(path, tokens)
+        self._draw(endpoint_family(path))
+        return wait
+
+    def update(self, path: str, status: int, headers) -> None:
+        family = endpoint_family(path)
+        bucket = self.bucket(family)
+        if status == 429:
+            self._answered(family)
+            bucket.set_rate(max(self.min_rate, bucket.rate * self.decrease))
+        elif status < 400 and self._answered(family):
+            bucket.set_rate(min(self.max_rate, bucket.rate + self.increase))
+        # Pause at the new rate so that the wait matches the one the API asked for.
+        super().update(path, status, headers)
+
+
+# The priority classes of the request scheduler, from the most to the least urgent.
+priorities = {"interactive": 0, "normal": 1, "bulk": 2}
+
+
+class RequestScheduler(AdaptiveRateLimiter):
+    """
+    An :class:`AdaptiveRateLimiter` that schedules every request of a session by priority.
+
+    Each request waits in one queue for a token from the bucket of its endpoint family and, when ``tenant_rate`` is
+    set, from a tenant-wide bucket shared by every family. Waiting requests are served by priority class, so an
+    interactive call is sent as soon as a token is free instead of queueing behind bulk page fetches. Within a class,
+    threads are served fairly: a thread that has just been served waits behind threads that have been waiting longer.
+    A request only waits behind higher-priority requests for its own endpoint family or for the tenant budget, so a
+    throttled family never holds up the others.
+
+    Paginated and bulk calls, and requests sent within :meth:`limit_requests`, are scheduled as ``bulk`` and all other
+    requests as ``normal``, unless the calling thread has set a priority with :meth:`priority`.
+
+    Args:
+        product (str): The product that the scheduler is applied to, e.g. ``ZIA`` or ``ZCC``.
+        tenant_rate (float): The number of requests per second allowed across all endpoint families. Defaults to
+            ``None`` (only the endpoint family budgets apply).
+        tenant_burst (float): The number of requests that can be sent back-to-back across all endpoint families.
+            Defaults to ``1``.
+        **kwargs: The endpoint family budgets, as accepted by :class:`AdaptiveRateLimiter`.
+
+    Examples:
+        Let helpdesk OTP lookups jump ahead of a background device sync on the same tenant:
+
+        >>> scheduler = RequestScheduler("ZCC", tenant_rate=5, tenant_burst=5)
+        >>> zcc = ZCC(client_id='CLIENT_ID', client_secret='CLIENT_SECRET', cloud='CLOUD', rate_limiter=scheduler)
+        >>> devices = zcc.devices.list_devices()  # on a background thread
+        >>> with scheduler.priority("interactive"):
+        ...     otp = zcc.secrets.get_otp(device_id)
+
+    """
+
+    def __init__(self, product: str = "", tenant_rate: float = None, tenant_burst: float = 1.0, **kwargs):
+        super().__init__(product, **kwargs)
+        self.tenant = TokenBucket(tenant_rate, tenant_burst) if tenant_rate else None
+        self._waiters = []
+        self._vtime = 0
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def priority(self, name: str):
+        """
+        Sets the priority class of the requests sent by the current thread while the context is active.
+
+        Args:
+            name (str): The priority class, one of ``interactive``, ``normal`` or ``bulk``.
+
+        """
+        if name not in priorities:
+            raise ValueError(f"Unknown priority '{name}', expected one of: {', '.join(priorities)}.")
+        previous = getattr(self._local, "priority", None)
+        self._local.priority = name
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def acquire(self, path: str, tokens: float = 1.0, priority: str = None) -> float:
+        """
+        Waits for the request's turn and takes a token for the endpoint family of the supplied request path.
+
+        The thread's next request for the same endpoint family is admitted with this token rather than being scheduled
+        again. If that request is retried, the retry is scheduled again at the same priority.
+
+        Args:
+            path (str): The request path or full URL.
+            tokens (float): The number of tokens required for the request.
+            priority (str): The priority class. Defaults to the thread's priority, or ``bulk``.
+
+        Returns:
+            :obj:`float`: The number of seconds spent waiting.
+
+        """
+        priority = priority or getattr(self._local, "priority", None) or "bulk"
+        family = endpoint_family(path)
+        wait = self._admit(family, tokens, priority)
+        self._local.grant = (family, priority)
+        return wait
+
+    def request_hook(self, base_url: str = ""):
+        def hook(request):
+            family = endpoint_family(_relative_path(request.url, base_url))
+            grant = getattr(self._local, "grant", None)
+            retry = getattr(self._local, "retry", None)
+            self._local.grant = self._local.retry = None
+            if grant and grant[0] == family:
+                # The token was taken by acquire() for this request.
+                request.priority = grant[1]
+                return
+            if retry and retry[0] == (request.method, request.url):
+                priority = retry[1]
+            else:
+                default = "bulk" if getattr(self._local, "limit", False) else "normal"
+                priority = getattr(self._local, "priority", None) or default
+            self._admit(family, 1.0, priority)
+            request.priority = priority
+
+        return hook
+
+    def response_hook(self, base_url: str = ""):
+        update = super().response_hook(base_url)
+
+        def hook(response, *args, **kwargs):
+            update(response, *args, **kwargs)
+            # restfly resends a failed request as a new one, so remember its priority for the retry.
+            request = response.request
+            priority = getattr(request, "priority", None)
+            if response.status_code >= 400 and priority:
+                self._local.retry = ((request.method, request.url), priority)
+
+        return hook
+
+    def _admit(self, family: str, tokens: float, priority: str) -> float:
+        """Queues a request and blocks until it has been granted its tokens, returning the seconds spent waiting."""
+        start = time.monotonic()
+        bucket = self.bucket(family)
+        self._draw(family)
+        with self._condition:
+            # Start-time fair queuing: a thread's next request is tagged after its previous one, but never before the
+            # request that was served last, so a thread can't bank priority while it is idle.
+            tag = max(self._vtime, getattr(self._local, "tag", 0)) + 1
+            self._local.tag = tag
+            waiter = {"key": (priorities[priority], tag, next(self._sequence)), "bucket": bucket, "tokens": tokens}
+            self._waiters.append(waiter)
+            self._waiters.sort(key=lambda item: item["key"])
+            while True:
+                delay = self._dispatch()
+                if waiter.get("granted"):
+                    break
+                self._condition.wait(delay)
+        return time.monotonic() - start
+
+    def _dispatch(self):
+        """
+        Grants tokens to the queued requests that can be sent now, in priority order, returning the number of seconds
+        until the next queued request could be granted.
+
+        """
+        granted = False
+        blocked = set()
+        delay = None
+        for waiter in list(self._waiters):
+            bucket, tokens = waiter["bucket"], waiter["tokens"]
+            # Lower-priority requests for a family that is out of tokens can't overtake the ones ahead of them.
+            if bucket in blocked:
+                continue
+            tenant_wait = self.tenant.delay(tokens) if self.tenant else 0.0
+            wait = max(bucket.delay(tokens), tenant_wait)
+            if wait <= 0:
+                bucket.take(tokens)
+                if self.tenant:
+                    self.tenant.take(tokens)
+                waiter["granted"] = True
+                self._waiters.remove(waiter)
+                self._vtime = max(self._vtime, waiter["key"][1])
+                granted = True
+                continue
+            blocked.add(bucket)
+            delay = wait if delay is None else min(delay, wait)
+            # The tenant budget is exhausted, so the next token goes to this request ahead of everything queued behind it.
+            if tenant_wait > 0:
+                break
+        if granted:
+            self._condition.notify_all()
+        return delay
@@ -0,0 +1,146 @@
+import base64
+import json
+import threading
+import time
+
+
+def jwt_expiry(token: str):
+    """
+    Returns the ``exp`` claim of a JSON Web Token as an epoch timestamp, or ``None`` if the token isn't a JWT.
+
+    The signature isn't verified; the claim is only used to decide when to refresh the token.
+
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenManager:
+    """
+    Keeps the bearer token of a session current.
+
+    The token is refreshed on a background timer shortly before it expires, using the lifetime from the token response
+    or the JWT ``exp`` claim, so requests never wait on re-authentication. The new token is swapped into the session
+    headers in one step while requests already in flight complete with the old one. If a request is still rejected with
+    ``401`` (e.g. after the host was suspended past the expiry) the token is refreshed once and the request is re-sent.
+    Refreshes are serialised, so concurrent threads that see the same expired token only sign in once.
+
+    Args:
+        session (:obj:`requests.Session`): The session to keep authenticated.
+        fetch:
+            A callable that signs in and returns a tuple of ``(token, expires_in)``. ``expires_in`` is the token
+            lifetime in seconds, or ``None`` to read it from the JWT.
+        header (str): The header that carries the token. Defaults to ``Authorization``.
+        scheme (str): The prefix for the token in the header. Defaults to ``Bearer``.
+        margin (float): The number of seconds before expiry to refresh the token. Defaults to ``60``.
+
+    """
+
+    retry_delay = 10.0
+
+    def __init__(self, session, fetch, header: str = "Authorization", scheme: str = "Bearer ", margin: float = 60.0):
+        self.session = session
+        self.fetch = fetch
+        self.header = header
+        self.scheme = scheme
+        self.margin = margin
+        self.token = None
+        self.expires_at = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._timer = None
+        self._stopped = False
+
+    def start(self) -> str:
+        """Signs in, applies the token to the session and schedules the background refresh."""
+        self._stopped = False
+        session_hooks = self.session.hooks["response"]
+        if self.response_hook not in session_hooks:
+            session_hooks.append(self.response_hook)
+        return self.refresh()
+
+    def stop(self) -> None:
+        """Cancels the background refresh."""
+        self._stopped = True
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def refresh(self, stale: str = None) -> str:
+        """
+        Signs in again and applies the new token.
+
+        Args:
+            stale (str):
+                The token that was rejected. If another thread has already replaced it, that token is returned without
+                signing in again.
+
+        Returns:
+            :obj:`str`: The current token.
+
+        """
+        with self._lock:
+            if stale is not None and self.token != stale:
+                return self.token
+
+            self._local.refreshing = True
+            try:
+                token, expires_in = self.fetch()
+            finally:
+                self._local.refreshing = False
+
+            self.token = token
+            self.session.headers[self.header] = f"{self.scheme}{token}"
+            self.expires_at = time.time() + float(expires_in) if expires_in else jwt_expiry(token)
+            self._schedule(self.delay())
+            return token
+
+    def delay(self):
+        """Returns the number of seconds until the token should be refreshed, or ``None`` if its expiry is unknown."""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - self.margin - time.time(), 1.0)
+
+    def _schedule(self, delay) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if delay is None or self._stopped:
+            return
+        self._timer = threading.Timer(delay, self._background_refresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh(stale=self.token)
+        except Exception:
+            # Keep using the current token and try again shortly; a 401 will still trigger a refresh.
+            with self._lock:
+                self._schedule(self.retry_delay)
+
+    def response_hook(self, response, *args, **kwargs):
+        """A :mod:`requests` response hook that refreshes the token and re-sends a request rejected with ``401``."""
+        if response.status_code != 401 or getattr(self._local, "refreshing", False):
+            return response
+        request = response.request
+        sent = request.headers.get(self.header, "")
+        if getattr(request, "token_retried", False) or not sent.startswith(self.scheme):
+            return response
+
+        token = self.refresh(stale=sent[len(self.scheme) :])
+
+        retry = request.copy()
+        retry.headers[self.header] = f"{self.scheme}{token}"
+        retry.token_retried = True
+        # Release the connection of the rejected response before re-sending.
+        response.content
+        response.close()
+        new_response = response.connection.send(retry, **kwargs)
+        new_response.history.append(response)
+        new_response.request = retry
+        return new_response
@@ -1,47 +1,65 @@
 import functools
+import gzip
+import importlib
+import json
+import math
 import re
+import socket
+import sys
 import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from box import Box, BoxList
+from box import BoxList
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
 from restfly import APIIterator
+from urllib3.connection import HTTPConnection
 
+from pyzscaler.ratelimit import endpoint_path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+# Keys where the generic conversion doesn't produce the name the API uses.
+_camel_edge_cases = {
+    "routable_ip": "routableIP",
+    "is_name_l10n_tag": "isNameL10nTag",
+    "name_l10n_tag": "nameL10nTag",
+    "surrogate_ip": "surrogateIP",
+    "surrogate_ip_enforced_for_known_browsers": "surrogateIPEnforcedForKnownBrowsers",
+    "ec_vms": "ecVMs",
+    "ipv6_enabled": "ipV6Enabled",
+    "valid_ssl_certificate": "validSSLCertificate",
+}
+_snake_edge_cases = {camel: snake for snake, camel in _camel_edge_cases.items()}
+_camel_boundary = re.compile("([a-z0-9])([A-Z])")
+
+# Payloads reuse a small vocabulary of keys, so each key is only converted once.
+_key_cache_size = 4096
+
+
+@functools.lru_cache(maxsize=_key_cache_size)
 def snake_to_camel(name: str):
     """Converts Python Snake Case to Zscaler's lower camelCase."""
     if "_" not in name:
         return name
-    # Edge-cases where camelCase is breaking
-    edge_cases = {
-        "routable_ip": "routableIP",
-        "is_name_l10n_tag": "isNameL10nTag",
-        "name_l10n_tag": "nameL10nTag",
-        "surrogate_ip": "surrogateIP",
-        "surrogate_ip_enforced_for_known_browsers": "surrogateIPEnforcedForKnownBrowsers",
-        "ec_vms": "ecVMs",
-        "ipv6_enabled": "ipV6Enabled",
-        "valid_ssl_certificate": "validSSLCertificate",
-    }
-    return edge_cases.get(name, name[0].lower() + name.title()[1:].replace("_", ""))
+    return _camel_edge_cases.get(name) or name[0].lower() + name.title()[1:].replace("_", "")
 
 
+@functools.lru_cache(maxsize=_key_cache_size)
 def camel_to_snake(name: str):
     """Converts Zscaler's lower camelCase to Python Snake Case."""
-    edge_cases = {
-        "routableIP": "routable_ip",
-        "isNameL10nTag": "is_name_l10n_tag",
-        "nameL10nTag": "name_l10n_tag",
-        "surrogateIP": "surrogate_ip",
-        "surrogateIPEnforcedForKnownBrowsers": "surrogate_ip_enforced_for_known_browsers",
-        "ecVMs": "ec_vms",
-        "ipV6Enabled": "ipv6_enabled",
-        "validSSLCertificate": "valid_ssl_certificate",
-    }
-    # Check if name is an edge case
-    if name in edge_cases:
-        return edge_cases[name]
-
-    name = re.sub("([a-z0-9])([A-Z])", r"\1_\2", name)
-    return name.lower()
+    if name in _snake_edge_cases:
+        return _snake_edge_cases[name]
+    return _camel_boundary.sub(r"\1_\2", name).lower()
 
 
 def chunker(lst, n):
@@ -50,20 +68,55 @@ def chunker(lst, n):
         yield lst[i : i + n]
 
 
+def _convert_frame(source, key=None) -> list:
+    """Returns the stack frame for a container that :func:`convert_keys` is about to convert."""
+    # Read the stored values directly, so that Boxes don't wrap each nested record as it is read.
+    if isinstance(source, dict):
+        return [key, iter(dict.items(source)), [], []]
+    return [key, enumerate(list.__iter__(source)), None, []]
+
+
 def convert_keys(data, direction="to_camel"):
-    converter = camel_to_snake if direction == "to_snake" else snake_to_camel
+    """
+    Converts the keys of a payload, and of every record nested in it, to camelCase or snake_case.
 
-    if isinstance(data, (list, BoxList)):
-        return [convert_keys(inner_dict, direction=direction) for inner_dict in data]
-    elif isinstance(data, (dict, Box)):
-        new_dict = {}
-        for k in data.keys():
-            v = data[k]
-            new_key = converter(k)
-            new_dict[new_key] = convert_keys(v, direction=direction) if isinstance(v, (dict, list)) else v
-        return new_dict
-    else:
+    The payload is copied into new plain dicts and lists, including Boxes, so the result can be modified without
+    changing ``data``.
+
+    Args:
+        data: The payload to convert.
+        direction (str): ``to_camel`` or ``to_snake``. Defaults to ``to_camel``.
+
+    """
+    if not isinstance(data, (dict, list)):
         return data
+    converter = camel_to_snake if direction == "to_snake" else snake_to_camel
+
+    # Walk the payload with an explicit stack of [key in parent, items, keys, values] frames, so that deeply nested
+    # payloads don't recurse.
+    stack = [_convert_frame(data)]
+    while True:
+        frame = stack[-1]
+        keys, values = frame[2], frame[3]
+        for key, value in frame[1]:
+            if keys is not None:
+                key = converter(key)
+            if isinstance(value, (dict, list)):
+                stack.append(_convert_frame(value, key))
+                break
+            if keys is not None:
+                keys.append(key)
+            values.append(value)
+        else:
+            stack.pop()
+            key, _, keys, values = frame
+            result = values if keys is None else dict(zip(keys, values))
+            if not stack:
+                return result
+            parent = stack[-1]
+            if parent[2] is not None:
+                parent[2].append(key)
+            parent[3].append(result)
 
 
 def keys_exists(element: dict, *keys):
@@ -114,8 +167,559 @@ def pick_version_profile(kwargs: list, payload: list):
             payload["versionProfileId"] = 2
 
 
+# The largest page size accepted by paginated endpoints, keyed by product. Each product maps to the name of its page
+# size query parameter and the maximum page size for each endpoint path relative to the API base, with ``None`` holding
+# the product default. Paths that aren't listed, e.g. ZIA ``locations/lite``, are left to the API's default page size.
+max_page_sizes = {
+    "ZIA": (
+        "pageSize",
+        {
+            "adminUsers": 1000,
+            "departments": 1000,
+            "greTunnels": 1000,
+            "groups": 1000,
+            "ipv6config/nat64prefix": 1000,
+            "locations": 1000,
+            "ruleLabels": 1000,
+            "staticIP": 1000,
+            "users": 1000,
+            "vips": 1000,
+            "vpnCredentials": 1000,
+        },
+    ),
+    "ZPA": ("pagesize", {None: 500}),
+}
+
+# The default page size of each product, which every paginated endpoint honours. A page size above the documented
+# maximum may still be capped by the API, so a page shorter than the requested size is only known to be the final page
+# when it is also shorter than this or than a page already returned.
+default_page_sizes = {"ZIA": 100, "ZPA": 20}
+
+
+def lazy_import(package: str, names: dict, name: str):
+    """
+    Imports ``name`` from the submodule of ``package`` that ``names`` maps it to, for use in a module ``__getattr__``.
+
+    The imported object is stored on the package so that later lookups don't go through ``__getattr__`` again.
+
+    """
+    if name not in names:
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(names[name], package), name)
+    setattr(sys.modules[package], name, value)
+    return value
+
+
+# The connection pool and transport options accepted by every controller.
+pool_options = ("pool_connections", "pool_maxsize", "pool_block", "keep_alive", "compress_requests")
+
+
+class PoolAdapter(HTTPAdapter):
+    """
+    An :class:`~requests.adapters.HTTPAdapter` that can enable TCP keep-alive probes on its pooled connections, gzip
+    large request bodies and pass every request to an admission hook, e.g. a request scheduler, before it is sent.
+
+    """
+
+    compress_level = 6
+
+    def __init__(self, keep_alive: bool = True, compress_min_size: int = None, admit=None, **kwargs):
+        self.keep_alive = keep_alive
+        self.compress_min_size = compress_min_size
+        self.admit = admit
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.keep_alive:
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if self.admit is not None:
+            self.admit(request)
+        body = request.body
+        if self.compress_min_size is not None and body and "Content-Encoding" not in request.headers:
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            if isinstance(body, bytes) and len(body) >= self.compress_min_size:
+                request.body = gzip.compress(body, compresslevel=self.compress_level, mtime=0)
+                request.headers["Content-Encoding"] = "gzip"
+                request.headers["Content-Length"] = str(len(request.body))
+        return super().send(request, **kwargs)
+
+
+def mount_pool(
+    session,
+    pool_connections: int = 10,
+    pool_maxsize: int = 32,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+    compress_requests=False,
+    admit=None,
+) -> None:
+    """
+    Mounts a connection-pooling adapter for all HTTP and HTTPS requests sent by a session.
+
+    Args:
+        session (:obj:`requests.Session`): The session to configure.
+        pool_connections (int): The number of hosts to keep a connection pool for. Defaults to ``10``.
+        pool_maxsize (int):
+            The maximum number of connections kept open to each host. Size this to the number of concurrent requests.
+            Defaults to ``32``.
+        pool_block (bool):
+            Wait for a pooled connection when ``pool_maxsize`` connections to a host are in use, rather than opening a
+            connection that is discarded after the request. Defaults to ``False``.
+        keep_alive (bool):
+            Reuse connections between requests and enable TCP keep-alive probes on them. Set to ``False`` to close
+            every connection after its response. Defaults to ``True``.
+        compress_requests (bool or int):
+            Gzip request bodies of at least this many bytes, or at least 1 KiB if ``True``. Defaults to ``False``.
+        admit:
+            A callable that is passed each request and blocks until it may be sent, e.g. the hook returned by
+            :meth:`RequestScheduler.request_hook <pyzscaler.ratelimit.RequestScheduler.request_hook>`. Defaults to
+            ``None``.
+
+    """
+    if compress_requests is True:
+        compress_min_size = 1024
+    else:
+        compress_min_size = compress_requests or None
+    adapter = PoolAdapter(
+        keep_alive=keep_alive,
+        compress_min_size=compress_min_size,
+        admit=admit,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+
+def _orjson_dumps(data) -> bytes:
+    try:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # e.g. integers wider than 64 bits, which the stdlib encoder handles.
+        return _stdlib_dumps(data)
+
+
+def _ujson_dumps(data) -> bytes:
+    try:
+        return ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+    except (OverflowError, TypeError):
+        return _stdlib_dumps(data)
+
+
+def _stdlib_dumps(data) -> bytes:
+    return json.dumps(data, allow_nan=False).encode("utf-8")
+
+
+# The JSON backends in order of preference, as (loads, dumps) pairs. loads accepts bytes and dumps returns bytes.
+json_backends = {
+    "orjson": (getattr(orjson, "loads", None), _orjson_dumps),
+    "ujson": (getattr(ujson, "loads", None), _ujson_dumps),
+    "json": (json.loads, _stdlib_dumps),
+}
+
+
+def _fastest_json_backend() -> str:
+    return next(name for name, (loads, _) in json_backends.items() if loads is not None)
+
+
+json_backend = _fastest_json_backend()
+
+
+def set_json_backend(name: str = None) -> str:
+    """
+    Selects the JSON library used to encode request bodies and decode responses.
+
+    Args:
+        name (str):
+            ``orjson``, ``ujson`` or ``json``. Defaults to the fastest one that is installed, which is what pyZscaler
+            uses unless this is called.
+
+    Returns:
+        :obj:`str`: The name of the selected backend.
+
+    """
+    global json_backend
+    name = name or _fastest_json_backend()
+    if json_backends.get(name, (None,))[0] is None:
+        raise ValueError(f"The {name!r} JSON backend isn't installed.")
+    json_backend = name
+    return name
+
+
+def json_loads(data):
+    """Decodes a JSON document from bytes or str with the selected JSON backend."""
+    return json_backends[json_backend][0](data)
+
+
+def json_dumps(data) -> bytes:
+    """Encodes ``data`` as a UTF-8 JSON document with the selected JSON backend."""
+    return json_backends[json_backend][1](data)
+
+
+class JSONResponse(Response):
+    """A :class:`~requests.Response` that decodes its body with the selected JSON backend."""
+
+    def json(self, **kwargs):
+        if kwargs or json_backend == "json":
+            return super().json(**kwargs)
+        try:
+            return json_loads(self.content)
+        except (ValueError, OverflowError):
+            # Leave anything the fast decoders reject, e.g. NaN or a non-UTF-8 body, to requests so that the result and
+            # any error are the same as without a backend.
+            return super().json()
+
+
+class JSONSession(Session):
+    """
+    A :class:`~requests.Session` that encodes ``json`` request bodies and decodes responses with the selected JSON
+    backend, e.g. orjson or ujson when one is installed.
+
+    """
+
+    def prepare_request(self, request):
+        if request.json is not None and not request.data and not request.files and json_backend != "json":
+            request.data = json_dumps(request.json)
+            request.json = None
+            if not any(key.lower() == "content-type" for key in (request.headers or {})) and (
+                "Content-Type" not in self.headers
+            ):
+                request.headers = {**(request.headers or {}), "Content-Type": "application/json"}
+        return super().prepare_request(request)
+
+    def send(self, request, **kwargs):
+        response = super().send(request, **kwargs)
+        # Responses are built by the transport adapter, so they are given the faster json() here.
+        if type(response) is Response:
+            response.__class__ = JSONResponse
+        return response
+
+
+def stream_to_file(response, filename: str, chunk_size: int = 65536) -> str:
+    """
+    Writes the body of a response that was requested with ``stream=True`` to ``filename`` as it arrives.
+
+    A gzip or deflate encoded body is decompressed chunk by chunk, so a large export never has to fit in memory.
+
+    Args:
+        response (:obj:`requests.Response`): The streamed response.
+        filename (str): The file to write the body to.
+        chunk_size (int): The number of bytes to read at a time. Defaults to ``65536``.
+
+    Returns:
+        :obj:`str`: The filename.
+
+    """
+    with response, open(filename, "wb") as f:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            f.write(chunk)
+    return filename
+
+
+def raw_options(raw: bool) -> dict:
+    """Returns the request options that make restfly return parsed JSON as plain dicts and lists instead of Box objects."""
+    return {"box": False, "conv_json": True} if raw else {}
+
+
+def record_model(model, default=None):
+    """
+    Returns the record class selected by the ``model`` argument of a list method.
+
+    Args:
+        model: ``True`` to use ``default``, a :class:`~pyzscaler.models.Record` subclass, or ``False``.
+        default: The record model of the list method.
+
+    """
+    if not model:
+        return None
+    if model is True:
+        if default is None:
+            raise ValueError("This list method doesn't have a record model; pass a Record subclass as model instead.")
+        return default
+    return model
+
+
+def collect(iterator: APIIterator):
+    """
+    Returns the records from a pagination iterator.
+
+    The records are materialised into a :obj:`BoxList`, or a plain :obj:`list` of dicts or record models when the
+    iterator is in raw or model mode, unless the caller passed ``stream=True``, in which case the iterator itself is
+    returned so that records are yielded as each page arrives. With ``as_columns=True`` the records are collected into
+    a :class:`ColumnTable` instead.
+
+    """
+    if getattr(iterator, "as_columns", False):
+        if iterator.stream or iterator.model is not None:
+            raise ValueError("as_columns can't be combined with stream or model.")
+        return ColumnTable(iterator)
+    if getattr(iterator, "stream", False):
+        return iterator
+    if getattr(iterator, "raw", False):
+        return list(iterator)
+    return BoxList(iterator)
+
+
+class SnakeView(Mapping):
+    """
+    A read-only snake_case view of a raw camelCase record, e.g. one returned by a list method called with ``raw=True``.
+
+    Keys are translated when they are looked up and nested records are wrapped when they are accessed, so the record
+    is never copied or converted. Values can be read by key or as attributes.
+
+    Args:
+        data (dict): The raw record.
+
+    Examples:
+        >>> for location in zia.locations.list_locations(raw=True, stream=True):
+        ...     view = SnakeView(location)
+        ...     print(view.name, view.ip_addresses, view["surrogate_ip"])
+
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    @staticmethod
+    def _wrap(value):
+        if isinstance(value, dict):
+            return SnakeView(value)
+        if isinstance(value, list):
+            return [SnakeView._wrap(item) for item in value]
+        return value
+
+    def __getitem__(self, key):
+        camel = snake_to_camel(key)
+        if camel in self._data:
+            return self._wrap(self._data[camel])
+        return self._wrap(self._data[key])
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self):
+        return (camel_to_snake(key) for key in self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+class ColumnTable(Mapping):
+    """
+    Records stored as one list per field, e.g. as returned by a list method called with ``as_columns=True``.
+
+    Columns are filled in as each record arrives, so a large listing can be handed to a dataframe without building a
+    :obj:`Box` per record, and converting the table only costs one step per column. Columns are named by the snake_case
+    field name and can also be looked up by the API's field name. A record that lacks a field has ``None`` in that
+    column.
+
+    Args:
+        records: The raw records to add to the table.
+
+    Examples:
+        Load the users into a pandas dataframe:
+
+        >>> users = zia.users.list_users(as_columns=True)
+        >>> df = pandas.DataFrame(users.to_dict())
+
+        Sum a numeric column with NumPy:
+
+        >>> devices = zdx.devices.list_devices(as_columns=True)
+        >>> devices.to_numpy()["userid"].sum()
+
+    """
+
+    __slots__ = ("_columns", "_names", "num_rows")
+
+    def __init__(self, records=()):
+        # The columns are keyed by the API field name, and _names maps each snake_case column name to it.
+        self._columns = {}
+        self._names = {}
+        self.num_rows = 0
+        self.extend(records)
+
+    def extend(self, records) -> None:
+        """Appends records to the table, adding a column for each field that hasn't been seen before."""
+        columns = self._columns
+        rows = self.num_rows
+        for record in records:
+            for key, value in record.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * rows
+                    self._names[camel_to_snake(key)] = key
+                column.append(value)
+            rows += 1
+            # A record with every field has filled every column, so only pad the table when fields are missing.
+            if len(record) != len(columns):
+                for column in columns.values():
+                    if len(column) < rows:
+                        column.append(None)
+        self.num_rows = rows
+
+    def __getitem__(self, name):
+        return self._columns[self._names.get(name, name)]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(columns={list(self._names)!r}, num_rows={self.num_rows})"
+
+    def to_dict(self) -> dict:
+        """Returns a dict of the columns by their snake_case name. The column lists are shared, not copied."""
+        return {name: self._columns[key] for name, key in self._names.items()}
+
+    def to_numpy(self) -> dict:
+        """
+        Returns a dict of the columns as NumPy arrays, by their snake_case name.
+
+        Columns that only hold numbers, e.g. scores and epoch timestamps, become ``int64`` or ``float64`` arrays, with
+        ``NaN`` for records that lack the field. Boolean columns become ``bool`` arrays and all other columns become
+        ``object`` arrays. NumPy must be installed.
+
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("ColumnTable.to_numpy requires NumPy.") from None
+        return {name: _numpy_column(numpy, self._columns[key]) for name, key in self._names.items()}
+
+
+def _numpy_column(numpy, column: list):
+    kinds = set(map(type, column))
+    if kinds == {bool}:
+        return numpy.array(column, dtype=bool)
+    if kinds == {int}:
+        try:
+            return numpy.array(column, dtype=numpy.int64)
+        except OverflowError:
+            return numpy.array(column, dtype=object)
+    if kinds and kinds <= {int, float, type(None)} and kinds != {type(None)}:
+        return numpy.array([numpy.nan if value is None else value for value in column], dtype=numpy.float64)
+    return numpy.array(column, dtype=object)
+
+
+def sharded(list_method, shards: list, max_workers: int = 4, key: str = "id", stream: bool = False, **kwargs):
+    """
+    Splits a listing into filtered partitions that are requested concurrently, merging the results by ``key``.
+
+    Each shard is a dict of filter keyword arguments that is passed to ``list_method`` along with ``kwargs``. Shards
+    may overlap (e.g. ``starts with`` name searches), so records that were already returned by another shard are
+    dropped. Records without ``key`` are always returned. Shards still draw from the session's rate limiter, so raise
+    the limit for the endpoint family if the API permits it.
+
+    Args:
+        list_method: The list method to call for each shard, e.g. ``zia.users.list_users``.
+        shards (list): A list of dicts holding the filter keyword arguments for each shard.
+        max_workers (int): The number of shards to request concurrently. Defaults to ``4``.
+        key (str): The record key used to de-duplicate the merged results. Defaults to ``id``.
+        stream (bool):
+            Returns an iterator that yields the records from each shard as it completes instead of a :obj:`BoxList`.
+        **kwargs:
+            Keyword arguments that are passed to ``list_method`` for every shard. With ``raw=True`` the merged records
+            are returned as a plain :obj:`list` of dicts, and with ``as_columns=True`` as a :class:`ColumnTable`.
+
+    Returns:
+        :obj:`BoxList`: The de-duplicated records from all shards.
+
+    Examples:
+        List all users by splitting the listing across departments:
+
+        >>> users = sharded(zia.users.list_users, [{"dept": dept.name} for dept in zia.users.list_departments()])
+
+        Stream locations matching any of several search terms:
+
+        >>> for location in sharded(zia.locations.list_locations, [{"search": "SYD"}, {"search": "MEL"}],
+        ...     stream=True):
+        ...     print(location.name)
+
+    """
+    if kwargs.pop("as_columns", False):
+        return ColumnTable(_merge_shards(list_method, shards, max_workers, key, {**kwargs, "raw": True}))
+    records = _merge_shards(list_method, shards, max_workers, key, kwargs)
+    if stream:
+        return records
+    return list(records) if kwargs.get("raw") else BoxList(records)
+
+
+def _merge_shards(list_method, shards: list, max_workers: int, key: str, kwargs: dict):
+    """Yields the de-duplicated records from each shard in the order that the shards complete."""
+    seen = set()
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pyzscaler-shard")
+    futures = [executor.submit(list_method, **{**kwargs, **shard}) for shard in shards]
+    try:
+        for future in as_completed(futures):
+            for record in future.result():
+                value = record.get(key)
+                if value is not None:
+                    if value in seen:
+                        continue
+                    seen.add(value)
+                yield record
+    finally:
+        # Don't wait on shards that haven't started if the caller stops early or a shard fails.
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
 class Iterator(APIIterator):
-    """Iterator class."""
+    """
+    Iterator class for paginated ZIA, ZPA and ZCC endpoints.
+
+    Iteration ends after the final page, i.e. the last page reported by ZPA, the page that reaches ``max_items`` or a
+    page that is shorter than the API is known to return, without requesting (or waiting on the rate limiter for) a
+    trailing empty page. As the API may cap the page size below the one requested, a short page is only taken as the
+    final page when it is also shorter than the product's default page size or than an earlier page; otherwise
+    iteration ends on an empty page.
+
+    Keyword Args:
+        cursor (dict):
+            A checkpoint previously taken from :attr:`Iterator.cursor`. Iteration resumes from the next unread record
+            using the query parameters stored in the cursor, instead of starting again from page 1. Any query
+            parameters passed alongside the cursor must match the stored ones, otherwise a :obj:`ValueError` is
+            raised.
+        max_items (int): The maximum number of items to request before stopping iteration.
+        max_pages (int): The maximum number of pages to request before stopping iteration.
+        prefetch (int):
+            The number of pages to request ahead of the page being consumed. Pages are fetched in a bounded thread
+            pool, drawing from the session's rate limiter, and are still returned in order. Prefetching stops at
+            the last page reported by ZPA's ``totalPages``, after the final page and once enough pages have been
+            requested to reach ``max_items``; for ZIA up to ``prefetch`` requests may still be made past the end of a
+            collection. Defaults to ``0`` (fetch pages one at a time).
+        stream (bool): Yield records as each page arrives instead of collecting them into a :obj:`BoxList`.
+        raw (bool):
+            Return each record as the plain dict parsed from the response instead of a :obj:`Box`. Defaults to the
+            controller's ``raw`` setting.
+        model (bool):
+            Return each record as a compact :class:`~pyzscaler.models.Record` instead of a :obj:`Box`. Pass ``True`` to
+            use the record model of the list method, or a :class:`~pyzscaler.models.Record` subclass.
+        as_columns (bool):
+            Collect the records into a :class:`ColumnTable`, filling one list per field as each page arrives, instead
+            of a :obj:`BoxList`.
+
+    All other keyword arguments are converted to camelCase and sent as query parameters.
+
+    """
 
     page_size = 100
 
@@ -126,75 +730,304 @@ class Iterator(APIIterator):
         self.path = path
         self.max_items = kw.pop("max_items", 0)
         self.max_pages = kw.pop("max_pages", 0)
-        self.payload = {}
-        if kw:
-            self.payload = {snake_to_camel(key): value for key, value in kw.items()}
+        self.stream = kw.pop("stream", False)
+        self.model = record_model(kw.pop("model", False), kw.pop("record_model", None))
+        self.as_columns = kw.pop("as_columns", False)
+        self.raw = kw.pop("raw", getattr(api, "raw", False)) or self.model is not None or self.as_columns
+        self.prefetch = kw.pop("prefetch", 0)
+        self.total_pages = None
+        self._last_page = False
+        # The length of the longest page returned so far, which the API has shown it will return in full.
+        self._longest_page = 0
+        self._pending = {}
+        self._executor = None
+        # The number of records skipped at the start of the current page when resuming from a cursor.
+        self._offset = 0
+        self._skip = 0
+        cursor = kw.pop("cursor", None)
+        self.payload = {snake_to_camel(key): value for key, value in kw.items()}
+        if cursor:
+            self._resume(cursor)
+        self._set_page_size()
 
-    def _get_page(self) -> None:
-        """Iterator function to get the page."""
+    def _resume(self, cursor: dict) -> None:
+        """Restores the iterator position from a cursor."""
+        if cursor["path"] != self.path:
+            raise ValueError(f"Cursor is for '{cursor['path']}' and cannot be used to resume '{self.path}'.")
+        # Resuming with different query parameters would skip or repeat records, so any that are passed alongside
+        # the cursor must match the ones it was taken with.
+        params = dict(cursor["params"])
+        page_size = params.get("pageSize", params.get("pagesize"))
+        for key, value in self.payload.items():
+            expected = page_size if key.lower() == "pagesize" else params.get(key)
+            if value != expected:
+                raise ValueError(f"'{key}' does not match the cursor, which was taken with {key}={expected!r}.")
+        self.payload = params
+        self.num_pages = cursor["page"] - 1
+        self.count = cursor["count"]
+        self._skip = cursor["offset"]
+
+    @property
+    def cursor(self) -> dict:
+        """
+        A JSON-serialisable checkpoint of the iterator position.
+
+        The cursor records the endpoint, query parameters, the page holding the next unread record, the offset of that
+        record within the page and the number of records returned so far.
+
+        Examples:
+            Checkpoint a large listing to disk and resume it after a failure:
+
+            >>> users = zia.users.list_users(stream=True)
+            >>> try:
+            ...     for user in users:
+            ...         process(user)
+            ... finally:
+            ...     with open("users.cursor", "w") as f:
+            ...         json.dump(users.cursor, f)
+
+            >>> with open("users.cursor") as f:
+            ...     for user in zia.users.list_users(stream=True, cursor=json.load(f)):
+            ...         process(user)
+
+        """
+        if self.page_count >= len(self.page):
+            page, offset = self.num_pages + 1, 0
+        else:
+            page, offset = self.num_pages, self._offset + self.page_count
+        return {"path": self.path, "params": dict(self.payload), "page": page, "offset": offset, "count": self.count}
+
+    def _set_page_size(self) -> None:
+        """Requests the largest page size the endpoint accepts unless the caller has supplied a smaller one."""
+        param, sizes = max_page_sizes.get(getattr(self._api, "_env_base", None), ("pageSize", {}))
+        self.max_page_size = sizes.get(endpoint_path(self.path), sizes.get(None))
+        page_size = self.payload.pop("pageSize", None) or self.payload.pop("pagesize", None)
+        if page_size:
+            # A larger page would be capped by the API, so only request as many records as it will return.
+            if self.max_page_size:
+                page_size = min(int(page_size), self.max_page_size)
+        else:
+            page_size = self.max_page_size
+            # There is no point requesting more records than we are going to return.
+            if page_size and self.max_items:
+                page_size = min(page_size, self.max_items)
+        if page_size:
+            self.payload[param] = page_size
+        self.page_size = page_size
+
+    def _honoured_page_size(self) -> int:
+        """Returns the number of records per page that the API is known to return in full."""
+        return max(default_page_sizes.get(getattr(self._api, "_env_base", None), 0), self._longest_page)
+
+    def _fetch(self, page: int) -> tuple:
+        """Requests a single page, returning the records and the total number of pages if the API reports it."""
+        # ZIA and ZPA have a standard 1 sec rate limit on the API endpoints
+        # with pagination. Draw from the session's rate limiter so that we only
+        # wait when the endpoint family is actually out of tokens, rather than
+        # sleeping after every page.
+        self._api.rate_limiter.acquire(self.path)
         resp = self._api.get(
             self.path,
-            params={**self.payload, "page": self.num_pages + 1},
+            params={**self.payload, "page": page},
+            **raw_options(self.raw),
         )
         try:
             # If we are using ZPA then the API will return records under the
-            # 'list' key.
-            self.page = resp.get("list") or []
+            # 'list' key along with the total number of pages.
+            total_pages = resp.get("totalPages", resp.get("total_pages"))
+            return self._records(resp.get("list") or []), int(total_pages) if total_pages else None
         except AttributeError:
             # If the list key doesn't exist then we're likely using ZIA so just
             # return the full response.
-            self.page = resp
-        finally:
-            # If we use the default retry-after logic in Restfly then we are
-            # going to keep seeing 429 messages in stdout. ZIA and ZPA have a
-            # standard 1 sec rate limit on the API endpoints with pagination so
-            # we are going to include it here.
-            time.sleep(1)
+            return self._records(resp), None
+
+    def _records(self, records: list) -> list:
+        """Wraps the records of a page in the record model, if one was requested."""
+        if self.model is None:
+            return records
+        return [self.model(record) for record in records]
+
+    def _schedule(self, page: int) -> None:
+        """Submits requests for the pages following the current one to the prefetch thread pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.prefetch, thread_name_prefix="pyzscaler-prefetch")
+
+        last = page + self.prefetch - 1
+        if self.total_pages:
+            last = min(last, self.total_pages)
+        if self.max_pages:
+            last = min(last, self.max_pages)
+        if self.max_items and self.page_size:
+            # Only request the pages needed to reach max_items, counting the records on the current page.
+            remaining = self.max_items - self.count - len(self.page)
+            last = min(last, page - 1 + math.ceil(remaining / self.page_size))
+
+        for number in range(page, last + 1):
+            if number not in self._pending:
+                self._pending[number] = self._executor.submit(self._fetch, number)
+
+    def close(self) -> None:
+        """Cancels any outstanding prefetch requests and releases the prefetch thread pool."""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending = {}
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def next(self):
+        try:
+            return super().next()
+        except StopIteration:
+            self.close()
+            raise
+
+    def _get_page(self) -> None:
+        """Iterator function to get the page."""
+        # The previous page was the final one, so end iteration without requesting (or waiting for) an empty page.
+        if self._last_page:
+            self.page = []
+            return
+
+        page = self.num_pages + 1
+        future = self._pending.pop(page, None)
+        self.page, total_pages = future.result() if future else self._fetch(page)
+        self.total_pages = total_pages or self.total_pages
+
+        # The last page reported by ZPA or a page shorter than the API is known to return is the final page.
+        self._longest_page = max(self._longest_page, len(self.page))
+        short = bool(self.page_size) and len(self.page) < min(self.page_size, self._honoured_page_size())
+        self._last_page = short or bool(self.total_pages and page >= self.total_pages)
+
+        # Drop the records that were already returned before the cursor was taken.
+        self._offset, self._skip = self._skip, 0
+        if self._offset:
+            self.page = self.page[self._offset :]
+
+        # So is the page that reaches max_items, counting only the records that will be returned from it.
+        if self.max_items and self.count + len(self.page) >= self.max_items:
+            self._last_page = True
+
+        if self.prefetch:
+            # The first page is always fetched on its own so that we learn the
+            # total number of pages (ZPA) before requesting any more.
+            if self.page and not self._last_page:
+                self._schedule(page + 1)
+            else:
+                self.close()
 
 
 class ZDXIterator(APIIterator):
     """
     Iterator class for ZDX endpoints.
 
+    ZDX collection endpoints return their records under a result key (e.g. ``users`` or ``devices``) along with a
+    ``next_offset`` that is sent back as ``offset`` to request the following page. Endpoints that return a bare list
+    are treated as a single page.
+
+    Args:
+        api (:obj:`APISession`): The ZDX session.
+        endpoint (str): The API endpoint path.
+        result_key (str): The response key that holds the records. Omit for endpoints that return a bare list.
+        limit (int): The number of records to request per page.
+        prefetch (bool): Request the next page while the current page is being consumed. Defaults to ``False``.
+
+    Keyword Args:
+        max_items (int): The maximum number of items to request before stopping iteration.
+        max_pages (int): The maximum number of pages to request before stopping iteration.
+        stream (bool): Yield records as each page arrives instead of collecting them into a :obj:`BoxList`.
+        raw (bool):
+            Return each record as the plain dict parsed from the response instead of a :obj:`Box`. Defaults to the
+            controller's ``raw`` setting.
+        model (bool):
+            Return each record as a compact :class:`~pyzscaler.models.Record` instead of a :obj:`Box`. Pass ``True`` to
+            use the record model of the list method, or a :class:`~pyzscaler.models.Record` subclass.
+        as_columns (bool):
+            Collect the records into a :class:`ColumnTable`, filling one list per field as each page arrives, instead
+            of a :obj:`BoxList`.
+
+    All other keyword arguments are sent as query parameters, ignoring any that are ``None``.
+
     """
 
-    def __init__(self, api, endpoint, limit=None, **kwargs):
-        super().__init__(api, **kwargs)
+    def __init__(self, api, endpoint: str, result_key: str = None, limit: int = None, prefetch: bool = False, **kwargs):
+        super().__init__(api)
         self.endpoint = endpoint
+        self.result_key = result_key
         self.limit = limit
+        self.prefetch = prefetch
+        self.max_items = kwargs.pop("max_items", 0)
+        self.max_pages = kwargs.pop("max_pages", 0)
+        self.stream = kwargs.pop("stream", False)
+        self.model = record_model(kwargs.pop("model", False), kwargs.pop("record_model", None))
+        self.as_columns = kwargs.pop("as_columns", False)
+        self.raw = kwargs.pop("raw", getattr(api, "raw", False)) or self.model is not None or self.as_columns
+        self.params = {key: value for key, value in kwargs.items() if value is not None}
         self.next_offset = None
-        self.total = 0
+        self._last_page = False
+        self._pending = None
+        self._executor = None
 
-        # Load the first page
-        self._get_page()
+    def _fetch(self, offset: str = None) -> tuple:
+        """Requests a single page, returning the records and the offset of the following page."""
+        params = dict(self.params)
+        if self.limit:
+            params["limit"] = self.limit
+        if offset:
+            params["offset"] = offset
 
-    def __next__(self):
-        try:
-            item = super().__next__()
-        except StopIteration:
-            if self.next_offset is None:
-                # There is no next page, so we're done iterating
-                raise
-            # There is another page, so get it and continue iterating
-            self._get_page()
-            item = super().__next__()
-        return item
+        self._api.rate_limiter.acquire(self.endpoint)
+        response = self._api.get(self.endpoint, params=params, **raw_options(self.raw))
+
+        if self.result_key is None or isinstance(response, list):
+            return self._records(response), None
+        return self._records(response.get(self.result_key) or []), response.get("next_offset")
+
+    def _records(self, records: list) -> list:
+        """Wraps the records of a page in the record model, if one was requested."""
+        if self.model is None:
+            return records
+        return [self.model(record) for record in records]
 
-    def _get_page(self):
-        params = {"limit": self.limit, "offset": self.next_offset} if self.next_offset else {}
+    def close(self) -> None:
+        """Cancels any outstanding prefetch request and releases the prefetch thread."""
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
-        # Request the next page
-        response = self._api.get(self.endpoint, params=params)
+    def next(self):
+        try:
+            return super().next()
+        except StopIteration:
+            self.close()
+            raise
 
-        # Extract the next offset and the data items from the response
-        self.next_offset = response.get("next_offset")
-        self.page = response["users"]
+    def _get_page(self) -> None:
+        # The previous page didn't return a next_offset, so there is nothing left to request.
+        if self._last_page:
+            self.page = []
+            return
 
-        # Update the total number of records
-        self.total += len(self.page)
+        offset = self.next_offset
+        if self._pending is not None:
+            self.page, self.next_offset = self._pending.result()
+            self._pending = None
+        else:
+            self.page, self.next_offset = self._fetch(offset)
 
-        # Reset page_count for the new page
-        self.page_count = 0
+        # Stop when there is no next page, when the API hands back the offset we just requested (which would otherwise
+        # loop forever) or when the next page would exceed max_pages. num_pages is incremented after this page is
+        # returned, so the following page is num_pages + 2.
+        if not self.next_offset or self.next_offset == offset or (self.max_pages and self.num_pages + 2 > self.max_pages):
+            self._last_page = True
+            self.close()
+        elif self.prefetch:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyzscaler-prefetch")
+            self._pending = self._executor.submit(self._fetch, self.next_offset)
 
 
 # Maps ZCC numeric os_type and registration_type arguments to a human-readable string
@@ -1,10 +1,16 @@
-import shutil
 from datetime import datetime
 
 from box import BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, convert_keys, zcc_param_map
+from pyzscaler.models import ZCCDevice
+from pyzscaler.utils import (
+    Iterator,
+    collect,
+    convert_keys,
+    stream_to_file,
+    zcc_param_map,
+)
 
 
 class DevicesAPI(APIEndpoint):
@@ -96,12 +102,9 @@ class DevicesAPI(APIEndpoint):
                         "registration_type options."
                     )
 
-        # Create the local file and stream the device list csv to it
-        with self._get("public/v1/downloadDevices", params=payload, stream=True) as r:
-            with open(filename, "wb") as f:
-                shutil.copyfileobj(r.raw, f)
-
-        return filename
+        # Create the local file and stream the device list csv to it, decompressing it if it was sent gzipped
+        self._api.rate_limiter.acquire("public/v1/downloadDevices")
+        return stream_to_file(self._get("public/v1/downloadDevices", params=payload, stream=True), filename)
 
     def list_devices(self, **kwargs) -> BoxList:
         """
@@ -120,6 +123,12 @@ class DevicesAPI(APIEndpoint):
                 Return a specific page number.
             page_size (int):
                 Specify the number of devices per page, defaults to ``30``.
+            model (bool):
+                Returns each record as a compact :class:`~pyzscaler.models.ZCCDevice` instead of a :obj:`Box`.
+            as_columns (bool):
+                Returns a :class:`~pyzscaler.utils.ColumnTable` holding one list per field instead of a :obj:`BoxList`.
+            stream (bool):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
             user_name (str):
                 Filter by the enrolled user for the device.
 
@@ -133,6 +142,8 @@ class DevicesAPI(APIEndpoint):
             ...    print(device)
 
         """
+        # as_columns is an option of the iterator rather than a query parameter, so it isn't converted to camelCase.
+        as_columns = kwargs.pop("as_columns", False)
         payload = convert_keys(dict(kwargs))
 
         # Simplify the os_type argument, raise an error if the user supplies the wrong one.
@@ -143,7 +154,7 @@ class DevicesAPI(APIEndpoint):
             else:
                 raise ValueError("Invalid os_type specified. Check the pyZscaler documentation for valid os_type options.")
 
-        return BoxList(Iterator(self._api, "public/v1/getDevices", **payload))
+        return collect(Iterator(self._api, "public/v1/getDevices", record_model=ZCCDevice, as_columns=as_columns, **payload))
 
     def remove_devices(self, force: bool = False, **kwargs):
         """
@@ -210,6 +221,8 @@ class DevicesAPI(APIEndpoint):
                 raise ValueError("Invalid os_type specified. Check the pyZscaler documentation for valid os_type options.")
 
         if force:
+            self._api.rate_limiter.acquire("public/v1/forceRemoveDevices")
             return self._post("public/v1/forceRemoveDevices", json=payload)
         else:
+            self._api.rate_limiter.acquire("public/v1/removeDevices")
             return self._post("public/v1/removeDevices", json=payload)
@@ -1,15 +1,35 @@
 import os
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 from box import Box
 from restfly import APISession
 
 from pyzscaler import __version__
+from pyzscaler.batch import BatchAPI
+from pyzscaler.cache import TokenCache
+from pyzscaler.ratelimit import RateLimiter
+from pyzscaler.utils import JSONSession, lazy_import, mount_pool, pool_options
 
-from .admin import ZCONAdminAPI
-from .config import ZCONConfigAPI
-from .connectors import ZCONConnectorsAPI
-from .locations import ZCONLocationsAPI
-from .session import ZCONSessionAPI
+if TYPE_CHECKING:
+    from .admin import ZCONAdminAPI
+    from .config import ZCONConfigAPI
+    from .connectors import ZCONConnectorsAPI
+    from .locations import ZCONLocationsAPI
+    from .session import ZCONSessionAPI
+
+# The endpoint modules are imported when an interface is first used, so importing a controller stays fast.
+_endpoints = {
+    "ZCONAdminAPI": ".admin",
+    "ZCONConfigAPI": ".config",
+    "ZCONConnectorsAPI": ".connectors",
+    "ZCONLocationsAPI": ".locations",
+    "ZCONSessionAPI": ".session",
+}
+
+
+def __getattr__(name):
+    return lazy_import(__name__, _endpoints, name)
 
 
 class ZCON(APISession):
@@ -18,6 +38,32 @@ class ZCON(APISession):
 
     The ZCON object stores the session token and simplifies access to CRUD options within the ZCON Portal.
 
+    Attributes:
+        rate_limiter (RateLimiter):
+            If supplied, list requests will draw from this :class:`~pyzscaler.ratelimit.RateLimiter` instead of the
+            default limiter of one request per second for each endpoint family. Pass an
+            :class:`~pyzscaler.ratelimit.AdaptiveRateLimiter` to adapt the rate to the one the tenant allows.
+            Pass a :class:`~pyzscaler.ratelimit.RequestScheduler` to schedule every request by priority.
+        pool_connections (int): The number of hosts to keep an HTTP connection pool for. Defaults to ``10``.
+        pool_maxsize (int):
+            The maximum number of connections kept open to each host. Size this to the number of concurrent requests.
+            Defaults to ``32``.
+        pool_block (bool):
+            Wait for a free pooled connection once ``pool_maxsize`` connections to a host are in use, instead of opening
+            one that is discarded after the request. Defaults to ``False``.
+        keep_alive (bool):
+            Reuse connections between requests, with TCP keep-alive probes enabled. Defaults to ``True``.
+        compress_requests (bool or int):
+            Gzip request bodies of at least this many bytes, or at least 1 KiB if ``True``, e.g. for bulk URL category
+            updates. Only enable this for tenants whose API accepts ``Content-Encoding: gzip``. Defaults to ``False``.
+        raw (bool):
+            Return the records of paginated list methods as plain dicts and lists instead of :obj:`Box` objects, which
+            skips the Box conversion on large exports. Any list method can also be called with ``raw=True``.
+            Defaults to ``False``.
+        token_cache (TokenCache):
+            If supplied, the session is stored in this :class:`~pyzscaler.cache.TokenCache` and reused by other
+            processes with the same credentials until it expires. Pass ``True`` to use the default cache location.
+
     """
 
     _vendor = "Zscaler"
@@ -40,6 +86,10 @@ class ZCON(APISession):
             or f"https://connector.{self.env_cloud}.net/api/v1"
         )
         self.conv_box = True
+        self.rate_limiter = kw.get("rate_limiter") or RateLimiter(self._env_base)
+        self.raw = kw.get("raw", False)
+        self._pool_options = {key: kw[key] for key in pool_options if key in kw}
+        self._token_cache = TokenCache() if kw.get("token_cache") is True else kw.get("token_cache")
         super(ZCON, self).__init__(**kw)
 
     def _build_session(self, **kwargs) -> Box:
@@ -52,21 +102,48 @@ class ZCON(APISession):
             Box: The Box object representing the ZCON API.
 
         """
+        kwargs.setdefault("session", JSONSession())
         super(ZCON, self)._build_session(**kwargs)
+        mount_pool(self._session, admit=self.rate_limiter.request_hook(self._url), **self._pool_options)
+        self._session.hooks["response"].append(self.rate_limiter.response_hook(self._url))
+        if self._token_cache is None:
+            return self._create_session()
+        # Reuse the session cookie of another process signed in with the same credentials, and replace it through the
+        # cache if the API rejects it.
+        scope, secret = (self._env_base, self._url, self._username), f"{self._api_key}:{self._password}"
+        self._token_cache.cookies(scope, secret, self._session, self._create_session)
+        self._session.hooks["response"].append(
+            self._token_cache.cookie_hook(scope, secret, self._session, self._create_session)
+        )
+
+    def _create_session(self) -> Box:
         return self.session.create(api_key=self._api_key, username=self._username, password=self._password)
 
     def _deauthenticate(self):
         """
-        End the authentication session.
+        End the authentication session, unless it is shared with other processes through the token cache.
 
         Returns:
             Box: The Box object representing the ZCON API.
 
         """
+        if self._token_cache is not None:
+            return None
         return self.session.delete()
 
-    @property
-    def admin(self) -> ZCONAdminAPI:
+    @cached_property
+    def batch(self) -> BatchAPI:
+        """
+        The interface object for running ``get_*`` calls concurrently with :meth:`~pyzscaler.batch.BatchAPI.get_many`.
+
+        Returns:
+            BatchAPI: The BatchAPI object.
+
+        """
+        return BatchAPI(self)
+
+    @cached_property
+    def admin(self) -> "ZCONAdminAPI":
         """
         The interface object for the :ref:`ZCON Admin interface <zcon-admin>`.
 
@@ -74,10 +151,12 @@ class ZCON(APISession):
             ZCONAdminAPI: The AdminAPI object.
 
         """
+        from .admin import ZCONAdminAPI
+
         return ZCONAdminAPI(self)
 
-    @property
-    def connectors(self) -> ZCONConnectorsAPI:
+    @cached_property
+    def connectors(self) -> "ZCONConnectorsAPI":
         """
         The interface object for the :ref:`ZCON Connectors interface <zcon-connectors>`.
 
@@ -85,10 +164,12 @@ class ZCON(APISession):
             ZCONConnectorsAPI: The ConnectorsAPI object.
 
         """
+        from .connectors import ZCONConnectorsAPI
+
         return ZCONConnectorsAPI(self)
 
-    @property
-    def config(self) -> ZCONConfigAPI:
+    @cached_property
+    def config(self) -> "ZCONConfigAPI":
         """
         The interface object for the :ref:`ZCON Config interface <zcon-config>`.
 
@@ -96,10 +177,12 @@ class ZCON(APISession):
             ZCONConfigAPI: The ConfigAPI object.
 
         """
+        from .config import ZCONConfigAPI
+
         return ZCONConfigAPI(self)
 
-    @property
-    def locations(self) -> ZCONLocationsAPI:
+    @cached_property
+    def locations(self) -> "ZCONLocationsAPI":
         """
         The interface object for the :ref:`ZCON Locations interface <zcon-locations>`.
 
@@ -107,10 +190,12 @@ class ZCON(APISession):
             ZCONLocationsAPI: The LocationsAPI object.
 
         """
+        from .locations import ZCONLocationsAPI
+
         return ZCONLocationsAPI(self)
 
-    @property
-    def session(self) -> ZCONSessionAPI:
+    @cached_property
+    def session(self) -> "ZCONSessionAPI":
         """
         The interface object for the :ref:`ZCON Authentication interface <zcon-session>`.
 
@@ -118,4 +203,6 @@ class ZCON(APISession):
             ZCONSessionAPI: The SessionAPI object.
 
         """
+        from .session import ZCONSessionAPI
+
         return ZCONSessionAPI(self)
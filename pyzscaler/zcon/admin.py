@@ -34,6 +34,7 @@ class ZCONAdminAPI(APIEndpoint):
                     print(role)
 
         """
+        self._api.rate_limiter.acquire("adminRoles")
         return self._get("adminRoles")
 
     def get_role(self, role_id: str) -> Box:
@@ -303,6 +304,7 @@ class ZCONAdminAPI(APIEndpoint):
         # Convert snake to camelcase if needed
         payload = convert_keys(payload)
 
+        self._api.rate_limiter.acquire("adminUsers")
         return self._get("adminUsers", params=payload)
 
     def get_admin(self, admin_id: str) -> Box:
@@ -490,6 +492,7 @@ class ZCONAdminAPI(APIEndpoint):
         if "include_partner_keys" in kwargs:
             params["includePartnerKeys"] = kwargs["include_partner_keys"]
 
+        self._api.rate_limiter.acquire("apiKeys")
         return self._get("apiKeys", params=params)
 
     def regenerate_api_key(self, api_key_id: str) -> Box:
@@ -30,9 +30,8 @@ class ZCONConnectorsAPI(APIEndpoint):
         """
         # There is an edge case in the camelcase to snake conversion that we're going to handle here. We'll revert
         # the default camel_killer_box and run it through our conversion function in utils that handles edge-cases.
-        self._box_attrs = {"camel_killer_box": False}
-
-        return convert_keys(self._get("ecgroup", params=kwargs), "to_snake")
+        self._api.rate_limiter.acquire("ecgroup")
+        return convert_keys(self._get("ecgroup", params=kwargs, box_attrs={"camel_killer_box": False}), "to_snake")
 
     def get_group(self, group_id: str) -> Box:
         """
@@ -51,9 +50,7 @@ class ZCONConnectorsAPI(APIEndpoint):
         """
         # There is an edge case in the camelcase to snake conversion that we're going to handle here. We'll revert
         # the default camel_killer_box and run it through our conversion function in utils that handles edge-cases.
-        self._box_attrs = {"camel_killer_box": False}
-
-        return convert_keys(self._get(f"ecgroup/{group_id}"), "to_snake")
+        return convert_keys(self._get(f"ecgroup/{group_id}", box_attrs={"camel_killer_box": False}), "to_snake")
 
     def get_vm(self, group_id: str, vm_id: str) -> Box:
         """
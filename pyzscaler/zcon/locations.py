@@ -46,6 +46,7 @@ class ZCONLocationsAPI(APIEndpoint):
                     print(location)
 
         """
+        self._api.rate_limiter.acquire("location")
         return self._get("location")
 
     def get_location(self, location_id: str) -> Box:
@@ -87,6 +88,7 @@ class ZCONLocationsAPI(APIEndpoint):
                     print(template)
 
         """
+        self._api.rate_limiter.acquire("locationTemplate")
         return self._get("locationTemplate", params=kwargs)
 
     def get_location_template(self, template_id: str) -> Box:
@@ -1,14 +1,28 @@
 import os
+from functools import cached_property
 
 from box import Box
 from restfly.session import APISession
 
 from pyzscaler import __version__
-from pyzscaler.zdx.admin import AdminAPI
-from pyzscaler.zdx.apps import AppsAPI
-from pyzscaler.zdx.devices import DevicesAPI
-from pyzscaler.zdx.session import SessionAPI
-from pyzscaler.zdx.users import UsersAPI
+from pyzscaler.batch import BatchAPI
+from pyzscaler.cache import TokenCache
+from pyzscaler.ratelimit import RateLimiter
+from pyzscaler.tokens import TokenManager
+from pyzscaler.utils import JSONSession, lazy_import, mount_pool, pool_options
+
+# The endpoint modules are imported when an interface is first used, so importing a controller stays fast.
+_endpoints = {
+    "AdminAPI": "pyzscaler.zdx.admin",
+    "AppsAPI": "pyzscaler.zdx.apps",
+    "DevicesAPI": "pyzscaler.zdx.devices",
+    "SessionAPI": "pyzscaler.zdx.session",
+    "UsersAPI": "pyzscaler.zdx.users",
+}
+
+
+def __getattr__(name):
+    return lazy_import(__name__, _endpoints, name)
 
 
 class ZDX(APISession):
@@ -31,6 +45,30 @@ class ZDX(APISession):
             (e.g. internal test instance etc). When using this attribute, there is no need to supply the `cloud`
             attribute. The override URL will be prepended to the API endpoint suffixes. The protocol must be included
             i.e. http:// or https://.
+        rate_limiter (RateLimiter):
+            If supplied, paginated and bulk requests will draw from this :class:`~pyzscaler.ratelimit.RateLimiter`
+            instead of the default limiter of one request per second for each endpoint family. Pass an
+            :class:`~pyzscaler.ratelimit.AdaptiveRateLimiter` to adapt the rate to the one the tenant allows.
+            Pass a :class:`~pyzscaler.ratelimit.RequestScheduler` to schedule every request by priority.
+        pool_connections (int): The number of hosts to keep an HTTP connection pool for. Defaults to ``10``.
+        pool_maxsize (int):
+            The maximum number of connections kept open to each host. Size this to the number of concurrent requests.
+            Defaults to ``32``.
+        pool_block (bool):
+            Wait for a free pooled connection once ``pool_maxsize`` connections to a host are in use, instead of opening
+            one that is discarded after the request. Defaults to ``False``.
+        keep_alive (bool):
+            Reuse connections between requests, with TCP keep-alive probes enabled. Defaults to ``True``.
+        compress_requests (bool or int):
+            Gzip request bodies of at least this many bytes, or at least 1 KiB if ``True``, e.g. for bulk URL category
+            updates. Only enable this for tenants whose API accepts ``Content-Encoding: gzip``. Defaults to ``False``.
+        raw (bool):
+            Return the records of paginated list methods as plain dicts and lists instead of :obj:`Box` objects, which
+            skips the Box conversion on large exports. Any list method can also be called with ``raw=True``.
+            Defaults to ``False``.
+        token_cache (TokenCache):
+            If supplied, the session is stored in this :class:`~pyzscaler.cache.TokenCache` and reused by other
+            processes with the same credentials until it expires. Pass ``True`` to use the default cache location.
 
     """
 
@@ -50,35 +88,77 @@ class ZDX(APISession):
         self._cloud = kw.get("cloud", os.getenv(f"{self._env_base}_CLOUD", self._env_cloud))
         self._url = kw.get("override_url", os.getenv(f"{self._env_base}_OVERRIDE_URL")) or f"https://api.{self._cloud}.net/v1"
         self.conv_box = True
+        self.rate_limiter = kw.get("rate_limiter") or RateLimiter(self._env_base)
+        self.raw = kw.get("raw", False)
+        self._pool_options = {key: kw[key] for key in pool_options if key in kw}
+        self._token_cache = TokenCache() if kw.get("token_cache") is True else kw.get("token_cache")
         super(ZDX, self).__init__(**kw)
 
     def _build_session(self, **kwargs) -> Box:
         """Creates a ZCC API session."""
+        kwargs.setdefault("session", JSONSession())
         super(ZDX, self)._build_session(**kwargs)
-        self._auth_token = self.session.create_token(client_id=self._client_id, client_secret=self._client_secret).token
-        return self._session.headers.update({"Authorization": f"Bearer {self._auth_token}"})
-
-    @property
+        mount_pool(self._session, admit=self.rate_limiter.request_hook(self._url), **self._pool_options)
+        self._session.hooks["response"].append(self.rate_limiter.response_hook(self._url))
+        # The token is refreshed in the background before it expires, using the expires_in of the token response.
+        self.token_manager = TokenManager(self._session, self._fetch_token)
+        self.token_manager.start()
+
+    def _create_token(self) -> tuple:
+        response = self.session.create_token(client_id=self._client_id, client_secret=self._client_secret)
+        return response.token, response.get("expires_in")
+
+    def _fetch_token(self) -> tuple:
+        if self._token_cache is None:
+            return self._create_token()
+        # Reuse the token of another process signed in with the same credentials, unless it is the one being replaced.
+        return self._token_cache.token(
+            (self._env_base, self._url, self._client_id),
+            self._client_secret,
+            self._create_token,
+            stale=self.token_manager.token,
+        )
+
+    def _deauthenticate(self):
+        """Stops refreshing the session token."""
+        self.token_manager.stop()
+
+    @cached_property
+    def batch(self):
+        """The interface object for running ``get_*`` calls concurrently with :meth:`~pyzscaler.batch.BatchAPI.get_many`."""
+        return BatchAPI(self)
+
+    @cached_property
     def session(self):
         """The interface object for the :ref:`ZDX Session interface <zdx-session>`."""
+        from pyzscaler.zdx.session import SessionAPI
+
         return SessionAPI(self)
 
-    @property
+    @cached_property
     def admin(self):
         """The interface object for the :ref:`ZDX Admin interface <zdx-admin>`."""
+        from pyzscaler.zdx.admin import AdminAPI
+
         return AdminAPI(self)
 
-    @property
+    @cached_property
     def apps(self):
         """The interface object for the :ref:`ZDX Apps interface <zdx-apps>`."""
+        from pyzscaler.zdx.apps import AppsAPI
+
         return AppsAPI(self)
 
-    @property
+    @cached_property
     def devices(self):
         """The interface object for the :ref:`ZDX Devices interface <zdx-devices>`."""
+        from pyzscaler.zdx.devices import DevicesAPI
+
         return DevicesAPI(self)
 
-    @property
+    @cached_property
     def users(self):
         """The interface object for the :ref:`ZDX Users interface <zdx-users>`."""
+        from pyzscaler.zdx.users import UsersAPI
+
         return UsersAPI(self)
@@ -1,7 +1,7 @@
 from box import BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import zdx_params
+from pyzscaler.utils import ZDXIterator, collect, zdx_params
 
 
 class AdminAPI(APIEndpoint):
@@ -13,6 +13,7 @@ class AdminAPI(APIEndpoint):
         Keyword Args:
             since (int): The number of hours to look back for devices.
             search (str): The search string to filter by name or department ID.
+            stream (bool): Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of departments in ZDX.
@@ -24,8 +25,7 @@ class AdminAPI(APIEndpoint):
             ...     print(department)
 
         """
-
-        return self._get("administration/departments", params=kwargs)
+        return collect(ZDXIterator(self._api, "administration/departments", **kwargs))
 
     @zdx_params
     def list_locations(self, **kwargs) -> BoxList:
@@ -35,6 +35,7 @@ class AdminAPI(APIEndpoint):
         Keyword Args:
             since (int): The number of hours to look back for devices.
             search (str): The search string to filter by name or location ID.
+            stream (bool): Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of locations in ZDX.
@@ -46,7 +47,7 @@ class AdminAPI(APIEndpoint):
             ...     print(location)
 
         """
-        return self._get("administration/locations", params=kwargs)
+        return collect(ZDXIterator(self._api, "administration/locations", **kwargs))
 
     @zdx_params
     def list_geolocations(self, **kwargs) -> BoxList:
@@ -58,6 +59,7 @@ class AdminAPI(APIEndpoint):
             location_id (str): The unique ID for the location.
             parent_geo_id (str): The unique ID for the parent geolocation.
             search (str): The search string to filter by name.
+            stream (bool): Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of geolocations in ZDX.
@@ -69,4 +71,4 @@ class AdminAPI(APIEndpoint):
             ...     print(geolocation)
 
         """
-        return self._get("active_geo", params=kwargs)
+        return collect(ZDXIterator(self._api, "active_geo", **kwargs))
@@ -1,7 +1,7 @@
 from box import BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import ZDXIterator, zdx_params
+from pyzscaler.utils import ZDXIterator, collect, zdx_params
 
 
 class AppsAPI(APIEndpoint):
@@ -15,6 +15,7 @@ class AppsAPI(APIEndpoint):
             location_id (str): The unique ID for the location.
             department_id (str): The unique ID for the department.
             geo_id (str): The unique ID for the geolocation.
+            stream (bool): Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of applications in ZDX.
@@ -26,7 +27,7 @@ class AppsAPI(APIEndpoint):
             ...     print(app)
 
         """
-        return self._get("apps", params=kwargs)
+        return collect(ZDXIterator(self._api, "apps", **kwargs))
 
     @zdx_params
     def get_app(self, app_id: str, **kwargs):
@@ -131,6 +132,7 @@ class AppsAPI(APIEndpoint):
                 * `poor` - 0-33
                 * `okay` - 34-65
                 * `good` - 66-100
+            stream (bool): Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of users and devices used to access the application.
@@ -142,11 +144,11 @@ class AppsAPI(APIEndpoint):
             ...     print(user)
 
         """
-        return BoxList(
+        return collect(
             ZDXIterator(
                 self._api,
                 f"apps/{app_id}/users",
-                pagination="offset_limit",
+                result_key="users",
                 **kwargs,
             )
         )
@@ -1,11 +1,13 @@
+from box import BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import zdx_params
+from pyzscaler.models import ZDXDevice
+from pyzscaler.utils import ZDXIterator, collect, zdx_params
 
 
 class DevicesAPI(APIEndpoint):
     @zdx_params
-    def list_devices(self, **kwargs):
+    def list_devices(self, **kwargs) -> BoxList:
         """
         Returns a list of all devices in ZDX.
 
@@ -14,6 +16,9 @@ class DevicesAPI(APIEndpoint):
             location_id (str): The unique ID for the location.
             department_id (str): The unique ID for the department.
             geo_id (str): The unique ID for the geolocation.
+            model (bool): Returns each record as a compact :class:`~pyzscaler.models.ZDXDevice` instead of a :obj:`Box`.
+            as_columns (bool): Returns a :class:`~pyzscaler.utils.ColumnTable` of one list per field, not a :obj:`BoxList`.
+            stream (bool): Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of devices in ZDX.
@@ -28,7 +33,7 @@ class DevicesAPI(APIEndpoint):
             >>> for device in zdx.devices.list_devices(since=24):
 
         """
-        return self._get("devices", params=kwargs)
+        return collect(ZDXIterator(self._api, "devices", result_key="devices", record_model=ZDXDevice, **kwargs))
 
     @zdx_params
     def get_device(self, device_id: str, **kwargs):
@@ -1,7 +1,8 @@
 from box import BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import ZDXIterator, zdx_params
+from pyzscaler.models import ZDXUser
+from pyzscaler.utils import ZDXIterator, collect, zdx_params
 
 
 class UsersAPI(APIEndpoint):
@@ -15,6 +16,8 @@ class UsersAPI(APIEndpoint):
             location_id (str): The unique ID for the location.
             department_id (str): The unique ID for the department.
             geo_id (str): The unique ID for the geolocation.
+            model (bool): Returns each record as a compact :class:`~pyzscaler.models.ZDXUser` instead of a :obj:`Box`.
+            stream (bool): Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of users in ZDX.
@@ -26,7 +29,7 @@ class UsersAPI(APIEndpoint):
             ...     print(user)
 
         """
-        return BoxList(ZDXIterator(self._api, "users", **kwargs))
+        return collect(ZDXIterator(self._api, "users", result_key="users", record_model=ZDXUser, **kwargs))
 
     @zdx_params
     def get_user(self, user_id: str, **kwargs):
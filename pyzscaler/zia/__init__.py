@@ -1,29 +1,41 @@
 import os
+from functools import cached_property
 
 from box import Box
 from restfly.session import APISession
 
 from pyzscaler import __version__
-
-from .admin_and_role_management import AdminAndRoleManagementAPI
-from .apptotal import AppTotalAPI
-from .audit_logs import AuditLogsAPI
-from .cloud_apps import CloudAppsAPI
-from .config import ActivationAPI
-from .dlp import DLPAPI
-from .firewall import FirewallPolicyAPI
-from .labels import RuleLabelsAPI
-from .locations import LocationsAPI
-from .sandbox import CloudSandboxAPI
-from .security import SecurityPolicyAPI
-from .session import AuthenticatedSessionAPI
-from .ssl_inspection import SSLInspectionAPI
-from .traffic import TrafficForwardingAPI
-from .url_categories import URLCategoriesAPI
-from .url_filters import URLFilteringAPI
-from .users import UserManagementAPI
-from .vips import DataCenterVIPSAPI
-from .web_dlp import WebDLPAPI
+from pyzscaler.batch import BatchAPI
+from pyzscaler.cache import TokenCache
+from pyzscaler.ratelimit import RateLimiter
+from pyzscaler.utils import JSONSession, lazy_import, mount_pool, pool_options
+
+# The endpoint modules are imported when an interface is first used, so importing a controller stays fast.
+_endpoints = {
+    "ActivationAPI": ".config",
+    "AdminAndRoleManagementAPI": ".admin_and_role_management",
+    "AppTotalAPI": ".apptotal",
+    "AuditLogsAPI": ".audit_logs",
+    "AuthenticatedSessionAPI": ".session",
+    "CloudAppsAPI": ".cloud_apps",
+    "CloudSandboxAPI": ".sandbox",
+    "DLPAPI": ".dlp",
+    "DataCenterVIPSAPI": ".vips",
+    "FirewallPolicyAPI": ".firewall",
+    "LocationsAPI": ".locations",
+    "RuleLabelsAPI": ".labels",
+    "SSLInspectionAPI": ".ssl_inspection",
+    "SecurityPolicyAPI": ".security",
+    "TrafficForwardingAPI": ".traffic",
+    "URLCategoriesAPI": ".url_categories",
+    "URLFilteringAPI": ".url_filters",
+    "UserManagementAPI": ".users",
+    "WebDLPAPI": ".web_dlp",
+}
+
+
+def __getattr__(name):
+    return lazy_import(__name__, _endpoints, name)
 
 
 class ZIA(APISession):
@@ -50,6 +62,30 @@ class ZIA(APISession):
             (e.g. internal test instance etc). When using this attribute, there is no need to supply the `cloud`
             attribute. The override URL will be prepended to the API endpoint suffixes. The protocol must be included
             i.e. http:// or https://.
+        rate_limiter (RateLimiter):
+            If supplied, paginated and bulk requests will draw from this :class:`~pyzscaler.ratelimit.RateLimiter`
+            instead of the default limiter of one request per second for each endpoint family. Pass an
+            :class:`~pyzscaler.ratelimit.AdaptiveRateLimiter` to adapt the rate to the one the tenant allows.
+            Pass a :class:`~pyzscaler.ratelimit.RequestScheduler` to schedule every request by priority.
+        pool_connections (int): The number of hosts to keep an HTTP connection pool for. Defaults to ``10``.
+        pool_maxsize (int):
+            The maximum number of connections kept open to each host. Size this to the number of concurrent requests.
+            Defaults to ``32``.
+        pool_block (bool):
+            Wait for a free pooled connection once ``pool_maxsize`` connections to a host are in use, instead of opening
+            one that is discarded after the request. Defaults to ``False``.
+        keep_alive (bool):
+            Reuse connections between requests, with TCP keep-alive probes enabled. Defaults to ``True``.
+        compress_requests (bool or int):
+            Gzip request bodies of at least this many bytes, or at least 1 KiB if ``True``, e.g. for bulk URL category
+            updates. Only enable this for tenants whose API accepts ``Content-Encoding: gzip``. Defaults to ``False``.
+        raw (bool):
+            Return the records of paginated list methods as plain dicts and lists instead of :obj:`Box` objects, which
+            skips the Box conversion on large exports. Any list method can also be called with ``raw=True``.
+            Defaults to ``False``.
+        token_cache (TokenCache):
+            If supplied, the session is stored in this :class:`~pyzscaler.cache.TokenCache` and reused by other
+            processes with the same credentials until it expires. Pass ``True`` to use the default cache location.
 
     """
 
@@ -73,167 +109,226 @@ class ZIA(APISession):
         )
         self.conv_box = True
         self.sandbox_token = kw.get("sandbox_token", os.getenv(f"{self._env_base}_SANDBOX_TOKEN"))
+        self.rate_limiter = kw.get("rate_limiter") or RateLimiter(self._env_base)
+        self.raw = kw.get("raw", False)
+        self._pool_options = {key: kw[key] for key in pool_options if key in kw}
+        self._token_cache = TokenCache() if kw.get("token_cache") is True else kw.get("token_cache")
         super(ZIA, self).__init__(**kw)
 
     def _build_session(self, **kwargs) -> Box:
         """Creates a ZIA API session."""
+        kwargs.setdefault("session", JSONSession())
         super(ZIA, self)._build_session(**kwargs)
-        return self.session.create(
-            api_key=self._api_key,
-            username=self._username,
-            password=self._password,
+        mount_pool(self._session, admit=self.rate_limiter.request_hook(self._url), **self._pool_options)
+        self._session.hooks["response"].append(self.rate_limiter.response_hook(self._url))
+        if self._token_cache is None:
+            return self._create_session()
+        # Reuse the session cookie of another process signed in with the same credentials, and replace it through the
+        # cache if the API rejects it.
+        scope, secret = (self._env_base, self._url, self._username), f"{self._api_key}:{self._password}"
+        self._token_cache.cookies(scope, secret, self._session, self._create_session)
+        self._session.hooks["response"].append(
+            self._token_cache.cookie_hook(scope, secret, self._session, self._create_session)
         )
 
+    def _create_session(self) -> Box:
+        return self.session.create(api_key=self._api_key, username=self._username, password=self._password)
+
     def _deauthenticate(self):
-        """Ends the authentication session."""
+        """Ends the authentication session, unless it is shared with other processes through the token cache."""
+        if self._token_cache is not None:
+            return None
         return self.session.delete()
 
-    @property
+    @cached_property
+    def batch(self):
+        """The interface object for running ``get_*`` calls concurrently with :meth:`~pyzscaler.batch.BatchAPI.get_many`."""
+        return BatchAPI(self)
+
+    @cached_property
     def session(self):
         """The interface object for the :ref:`ZIA Authenticated Session interface <zia-session>`."""
+        from .session import AuthenticatedSessionAPI
+
         return AuthenticatedSessionAPI(self)
 
-    @property
+    @cached_property
     def admin_and_role_management(self):
         """
         The interface object for the :ref:`ZIA Admin and Role Management interface <zia-admin_and_role_management>`.
 
         """
+        from .admin_and_role_management import AdminAndRoleManagementAPI
+
         return AdminAndRoleManagementAPI(self)
 
-    @property
+    @cached_property
     def apptotal(self):
         """
         The interface object for the :ref:`ZIA AppTotal interface <zia-apptotal>`.
 
         """
+        from .apptotal import AppTotalAPI
+
         return AppTotalAPI(self)
 
-    @property
+    @cached_property
     def audit_logs(self):
         """
         The interface object for the :ref:`ZIA Admin Audit Logs interface <zia-audit_logs>`.
 
         """
+        from .audit_logs import AuditLogsAPI
+
         return AuditLogsAPI(self)
 
-    @property
+    @cached_property
     def config(self):
         """
         The interface object for the :ref:`ZIA Activation interface <zia-config>`.
 
         """
+        from .config import ActivationAPI
+
         return ActivationAPI(self)
 
-    @property
+    @cached_property
     def dlp(self):
         """
         The interface object for the :ref:`ZIA DLP Dictionaries interface <zia-dlp>`.
 
 
         """
+        from .dlp import DLPAPI
+
         return DLPAPI(self)
 
-    @property
+    @cached_property
     def firewall(self):
         """
         The interface object for the :ref:`ZIA Firewall Policies interface <zia-firewall>`.
 
         """
+        from .firewall import FirewallPolicyAPI
+
         return FirewallPolicyAPI(self)
 
-    @property
+    @cached_property
     def labels(self):
         """
         The interface object for the :ref:`ZIA Rule Labels interface <zia-labels>`.
 
         """
+        from .labels import RuleLabelsAPI
+
         return RuleLabelsAPI(self)
 
-    @property
+    @cached_property
     def locations(self):
         """
         The interface object for the :ref:`ZIA Locations interface <zia-locations>`.
 
         """
+        from .locations import LocationsAPI
+
         return LocationsAPI(self)
 
-    @property
+    @cached_property
     def cloud_apps(self):
         """
         The interface object for the :ref:`ZIA Cloud Applications interface <zia-cloud_apps>`.
 
         """
+        from .cloud_apps import CloudAppsAPI
+
         return CloudAppsAPI(self)
 
-    @property
+    @cached_property
     def sandbox(self):
         """
         The interface object for the :ref:`ZIA Cloud Sandbox interface <zia-sandbox>`.
 
         """
+        from .sandbox import CloudSandboxAPI
+
         return CloudSandboxAPI(self)
 
-    @property
+    @cached_property
     def security(self):
         """
         The interface object for the :ref:`ZIA Security Policy Settings interface <zia-security>`.
 
         """
+        from .security import SecurityPolicyAPI
+
         return SecurityPolicyAPI(self)
 
-    @property
+    @cached_property
     def ssl(self):
         """
         The interface object for the :ref:`ZIA SSL Inspection interface <zia-ssl_inspection>`.
 
         """
+        from .ssl_inspection import SSLInspectionAPI
+
         return SSLInspectionAPI(self)
 
-    @property
+    @cached_property
     def traffic(self):
         """
         The interface object for the :ref:`ZIA Traffic Forwarding interface <zia-traffic>`.
 
         """
+        from .traffic import TrafficForwardingAPI
+
         return TrafficForwardingAPI(self)
 
-    @property
+    @cached_property
     def url_categories(self):
         """
         The interface object for the :ref:`ZIA URL Categories interface <zia-url_categories>`.
 
         """
+        from .url_categories import URLCategoriesAPI
+
         return URLCategoriesAPI(self)
 
-    @property
+    @cached_property
     def url_filters(self):
         """
         The interface object for the :ref:`ZIA URL Filtering interface <zia-url_filters>`.
 
         """
+        from .url_filters import URLFilteringAPI
+
         return URLFilteringAPI(self)
 
-    @property
+    @cached_property
     def users(self):
         """
         The interface object for the :ref:`ZIA User Management interface <zia-users>`.
 
         """
+        from .users import UserManagementAPI
+
         return UserManagementAPI(self)
 
-    @property
+    @cached_property
     def vips(self):
         """
         The interface object for the :ref:`ZIA Data Center VIPs interface <zia-vips>`.
 
         """
+        from .vips import DataCenterVIPSAPI
+
         return DataCenterVIPSAPI(self)
 
-    @property
+    @cached_property
     def web_dlp(self):
         """
         The interface object for the :ref:`ZIA Web DLP interface <zia-web_dlp>`.
 
         """
+        from .web_dlp import WebDLPAPI
+
         return WebDLPAPI(self)
@@ -1,7 +1,7 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, snake_to_camel
+from pyzscaler.utils import Iterator, collect, snake_to_camel
 
 
 class AdminAndRoleManagementAPI(APIEndpoint):
@@ -117,7 +117,9 @@ class AdminAndRoleManagementAPI(APIEndpoint):
             **page (int, optional):
                 Specifies the page offset.
             **page_size (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The admin_users resource record.
@@ -126,7 +128,7 @@ class AdminAndRoleManagementAPI(APIEndpoint):
             >>> users = zia.admin_and_role_management.list_users(search='login_name')
 
         """
-        return BoxList(Iterator(self._api, "adminUsers", **kwargs))
+        return collect(Iterator(self._api, "adminUsers", **kwargs))
 
     def list_roles(self, **kwargs) -> BoxList:
         """
@@ -165,7 +167,7 @@ class AdminAndRoleManagementAPI(APIEndpoint):
             >>> print(zia.admin_and_role_management.get_user('987321202'))
 
         """
-        admin_user = next(user for user in self.list_users() if user.id == int(user_id))
+        admin_user = next(user for user in self.list_users(stream=True) if user.id == int(user_id))
 
         return admin_user
 
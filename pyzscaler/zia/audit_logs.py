@@ -1,6 +1,8 @@
 from box import Box
 from restfly.endpoint import APIEndpoint
 
+from pyzscaler.utils import stream_to_file
+
 
 class AuditLogsAPI(APIEndpoint):
     def status(self) -> Box:
@@ -55,12 +57,17 @@ class AuditLogsAPI(APIEndpoint):
         """
         return self._delete("auditlogEntryReport", box=False).status_code
 
-    def get_report(self) -> str:
+    def get_report(self, filename: str = None) -> str:
         """
         Returns the most recently created audit log report.
 
+        Args:
+            filename (str):
+                If supplied, the report is streamed to this file as it downloads instead of being held in memory, and
+                the filename is returned.
+
         Returns:
-            :obj:`str`: String representation of CSV file.
+            :obj:`str`: String representation of CSV file, or the filename if ``filename`` was supplied.
 
         Examples:
             Write report to CSV file:
@@ -68,5 +75,11 @@ class AuditLogsAPI(APIEndpoint):
             >>> with open("audit_log.csv", "w+") as fh:
             ...    fh.write(zia.audit_logs.get_report())
 
+            Stream a large report straight to disk:
+
+            >>> zia.audit_logs.get_report(filename="audit_log.csv")
+
         """
+        if filename:
+            return stream_to_file(self._get("auditlogEntryReport/download", box=False, stream=True), filename)
         return self._get("auditlogEntryReport/download").text
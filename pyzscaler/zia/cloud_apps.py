@@ -1,6 +1,6 @@
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import convert_keys
+from pyzscaler.utils import convert_keys, stream_to_file
 
 
 class CloudAppsAPI(APIEndpoint):
@@ -72,9 +72,10 @@ class CloudAppsAPI(APIEndpoint):
         if custom_tag_ids is not None:
             payload["customTags"] = self._convert_ids_to_dict_list(custom_tag_ids)
 
+        self._api.rate_limiter.acquire("cloudApplications/bulkUpdate")
         return self._put("cloudApplications/bulkUpdate", json=payload).status_code
 
-    def export_shadow_it_report(self, duration: str = "LAST_1_DAYS", **kwargs) -> str:
+    def export_shadow_it_report(self, duration: str = "LAST_1_DAYS", filename: str = None, **kwargs) -> str:
         """
         Export the Shadow IT Report (in CSV format) for the cloud applications recognized by Zscaler
         based on their usage in your organisation.
@@ -84,6 +85,9 @@ class CloudAppsAPI(APIEndpoint):
                 Filters the data by using predefined time frames. Defaults to last day.
 
                 Possible values: ``LAST_1_DAYS``, ``LAST_7_DAYS``, ``LAST_15_DAYS``, ``LAST_MONTH``, ``LAST_QUARTER``
+            filename (str):
+                If supplied, the report is streamed to this file as it downloads instead of being held in memory, and
+                the filename is returned.
             **kwargs:
                 Arbitrary keyword arguments for filtering the report.
 
@@ -257,7 +261,7 @@ class CloudAppsAPI(APIEndpoint):
                 ``BITS_3072``, ``BITS_384``, ``BITS_4096``, ``BITS_1024``.
 
         Returns:
-            :obj:`str`: The Shadow IT Report in CSV format.
+            :obj:`str`: The Shadow IT Report in CSV format, or the filename if ``filename`` was supplied.
 
         Examples:
             Export the Shadow IT Report for the last 7 days::
@@ -271,9 +275,13 @@ class CloudAppsAPI(APIEndpoint):
         payload = {"duration": duration}
         convert_keys(payload.update(kwargs))
 
+        if filename:
+            return stream_to_file(self._post("shadowIT/applications/export", json=payload, box=False, stream=True), filename)
         return self._post("shadowIT/applications/export", json=payload).text
 
-    def export_shadow_it_csv(self, application: str, entity: str, duration: str = "LAST_1_DAYS", **kwargs):
+    def export_shadow_it_csv(
+        self, application: str, entity: str, duration: str = "LAST_1_DAYS", filename: str = None, **kwargs
+    ):
         """
         Export the Shadow IT Report (in CSV format) for the list of users or known locations
         identified with using the cloud applications specified in the request. The report
@@ -291,6 +299,9 @@ class CloudAppsAPI(APIEndpoint):
             entity (str): The entity type that the Shadow IT Report will be generated for.
 
             Possible values: ``USER``, ``LOCATION``.
+            filename (str):
+                If supplied, the report is streamed to this file as it downloads instead of being held in memory, and
+                the filename is returned.
 
         Keyword Args:
             order (dict): Sorts the list in increasing or decreasing order based on the specified attribute.
@@ -322,7 +333,7 @@ class CloudAppsAPI(APIEndpoint):
                 ``id`` and ``name`` fields specify the department information.
 
         Returns:
-            :obj:`str`: The Shadow IT Report in CSV format.
+            :obj:`str`: The Shadow IT Report in CSV format, or the filename if ``filename`` was supplied.
 
         Examples:
             Export the Shadow IT Report for GitHub the last 15 days::
@@ -343,7 +354,10 @@ class CloudAppsAPI(APIEndpoint):
 
         convert_keys(payload.update(kwargs))
 
-        return self._post(f"shadowIT/applications/{entity}/exportCsv", json=payload).text
+        path = f"shadowIT/applications/{entity}/exportCsv"
+        if filename:
+            return stream_to_file(self._post(path, json=payload, box=False, stream=True), filename)
+        return self._post(path, json=payload).text
 
     def list_apps(self):
         """
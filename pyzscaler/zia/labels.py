@@ -1,7 +1,7 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, convert_keys, snake_to_camel
+from pyzscaler.utils import Iterator, collect, convert_keys, snake_to_camel
 
 
 class RuleLabelsAPI(APIEndpoint):
@@ -15,7 +15,9 @@ class RuleLabelsAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **page_size (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of Rule Labels configured in ZIA.
@@ -37,7 +39,7 @@ class RuleLabelsAPI(APIEndpoint):
             ...    print(label)
 
         """
-        return BoxList(Iterator(self._api, "ruleLabels", **kwargs))
+        return collect(Iterator(self._api, "ruleLabels", **kwargs))
 
     def get_label(self, label_id: str) -> Box:
         """
@@ -1,7 +1,8 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, snake_to_camel
+from pyzscaler.models import ZIALocation
+from pyzscaler.utils import Iterator, collect, snake_to_camel
 
 
 class LocationsAPI(APIEndpoint):
@@ -19,9 +20,13 @@ class LocationsAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **page_size (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
             **search (str, optional):
                 The search string used to partially match against a location's name and port attributes.
+            **model (bool, optional):
+                Returns each record as a compact :class:`~pyzscaler.models.ZIALocation` instead of a :obj:`Box`.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
             **xff_enabled (bool, optional):
                 Filter based on whether the Enforce XFF Forwarding setting is enabled or disabled for a location.
 
@@ -45,7 +50,7 @@ class LocationsAPI(APIEndpoint):
             ...    print(location)
 
         """
-        return BoxList(Iterator(self._api, "locations", **kwargs))
+        return collect(Iterator(self._api, "locations", record_model=ZIALocation, **kwargs))
 
     def add_location(self, name: str, **kwargs) -> Box:
         """
@@ -188,7 +193,9 @@ class LocationsAPI(APIEndpoint):
         if location_id and location_name:
             raise ValueError("TOO MANY ARGUMENTS: Expected either location_id or location_name. Both were provided.")
         elif location_name:
-            location = (record for record in self.list_locations(search=location_name) if record.name == location_name)
+            location = (
+                record for record in self.list_locations(search=location_name, stream=True) if record.name == location_name
+            )
             return next(location, None)
 
         return self._get(f"locations/{location_id}")
@@ -217,9 +224,11 @@ class LocationsAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **page_size (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
             **search (str, optional):
                 The search string used to partially match against a location's name and port attributes.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
             **xff_enabled (bool, optional):
                 Filter based on whether the Enforce XFF Forwarding setting is enabled or disabled for a location.
 
@@ -231,7 +240,7 @@ class LocationsAPI(APIEndpoint):
             ...    pprint(sub_location)
 
         """
-        return BoxList(Iterator(self._api, f"locations/{location_id}/sublocations", max_pages=1, **kwargs))
+        return collect(Iterator(self._api, f"locations/{location_id}/sublocations", max_pages=1, **kwargs))
 
     def list_locations_lite(self, **kwargs) -> BoxList:
         """
@@ -247,9 +256,11 @@ class LocationsAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **page_size (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
             **search (str, optional):
                 The search string used to partially match against a location's name and port attributes.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: A list of configured locations.
@@ -271,7 +282,7 @@ class LocationsAPI(APIEndpoint):
             ...    print(location)
 
         """
-        return BoxList(Iterator(self._api, "locations/lite", **kwargs))
+        return collect(Iterator(self._api, "locations/lite", **kwargs))
 
     def update_location(self, location_id: str, **kwargs) -> Box:
         """
@@ -475,6 +486,7 @@ class LocationsAPI(APIEndpoint):
             prefix (str): The prefix string to search for cities.
             page (int): The page number of the results.
             page_size (int): The number of results per page.
+            stream (bool): Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of cities (along with their geographical data) that match the prefix search.
@@ -490,4 +502,4 @@ class LocationsAPI(APIEndpoint):
             returned. Ensure you narrow your search result as much as possible to avoid this.
 
         """
-        return BoxList(Iterator(self._api, "region/search", **kwargs))
+        return collect(Iterator(self._api, "region/search", **kwargs))
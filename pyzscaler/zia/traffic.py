@@ -1,7 +1,7 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, convert_keys, snake_to_camel
+from pyzscaler.utils import Iterator, collect, convert_keys, snake_to_camel
 
 
 class TrafficForwardingAPI(APIEndpoint):
@@ -15,7 +15,9 @@ class TrafficForwardingAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **page_size (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: A list of GRE tunnels configured in ZIA.
@@ -37,7 +39,7 @@ class TrafficForwardingAPI(APIEndpoint):
             ...    print(tunnel)
 
         """
-        return BoxList(Iterator(self._api, "greTunnels", **kwargs))
+        return collect(Iterator(self._api, "greTunnels", **kwargs))
 
     def get_gre_tunnel(self, tunnel_id: str) -> Box:
         """
@@ -165,7 +167,9 @@ class TrafficForwardingAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **page_size (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: A list of the configured static IPs
@@ -188,7 +192,7 @@ class TrafficForwardingAPI(APIEndpoint):
 
         """
 
-        return BoxList(Iterator(self._api, "staticIP", **kwargs))
+        return collect(Iterator(self._api, "staticIP", **kwargs))
 
     def get_static_ip(self, static_ip_id: str) -> Box:
         """
@@ -348,9 +352,11 @@ class TrafficForwardingAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **page_size (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
             **region (str, optional):
                 Filter based on region.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: List of VIP resource records.
@@ -372,7 +378,7 @@ class TrafficForwardingAPI(APIEndpoint):
             ...    print(vip)
 
         """
-        return BoxList(Iterator(self._api, "vips", **kwargs))
+        return collect(Iterator(self._api, "vips", **kwargs))
 
     def list_vips_recommended(self, source_ip: str, **kwargs) -> BoxList:
         """
@@ -463,10 +469,12 @@ class TrafficForwardingAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **page_size (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
             **search (str, optional):
                 The search string used to match against a VPN credential's commonName, fqdn, ipAddress,
                 comments, or locationName
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
             **type (str, optional):
                 Only gets VPN credentials for the specified type (CN, IP, UFQDN, XAUTH)
 
@@ -490,7 +498,7 @@ class TrafficForwardingAPI(APIEndpoint):
             ...    print(credential)
 
         """
-        return BoxList(Iterator(self._api, "vpnCredentials", **kwargs))
+        return collect(Iterator(self._api, "vpnCredentials", **kwargs))
 
     def add_vpn_credential(self, authentication_type: str, pre_shared_key: str, **kwargs) -> Box:
         """
@@ -570,6 +578,7 @@ class TrafficForwardingAPI(APIEndpoint):
 
         payload = {"ids": credential_ids}
 
+        self._api.rate_limiter.acquire("vpnCredentials/bulkDelete")
         return self._post("vpnCredentials/bulkDelete", json=payload, box=False).status_code
 
     def get_vpn_credential(self, credential_id: str = None, fqdn: str = None) -> Box:
@@ -594,7 +603,7 @@ class TrafficForwardingAPI(APIEndpoint):
         if credential_id and fqdn:
             raise ValueError("TOO MANY ARGUMENTS: Expected either a credential_id or an fqdn. Both were provided.")
         elif fqdn:
-            credential = (record for record in self.list_vpn_credentials(search=fqdn) if record.fqdn == fqdn)
+            credential = (record for record in self.list_vpn_credentials(search=fqdn, stream=True) if record.fqdn == fqdn)
             return next(credential, None)
 
         return self._get(f"vpnCredentials/{credential_id}")
@@ -677,9 +686,7 @@ class TrafficForwardingAPI(APIEndpoint):
         """
         # There is an edge case in the camelcase to snake conversion that we're going to handle here. We'll revert
         # the default camel_killer_box and run it through our conversion function in utils that handles edge-cases.
-        self._box_attrs = {"camel_killer_box": False}
-
-        return convert_keys(self._get("ipv6config"), "to_snake")
+        return convert_keys(self._get("ipv6config", box_attrs={"camel_killer_box": False}), "to_snake")
 
     def list_dns64_prefixes(self, **kwargs):
         """
@@ -707,8 +714,9 @@ class TrafficForwardingAPI(APIEndpoint):
 
         Keyword Args:
             page (int): Page number to return. Defaults to 1.
-            page_size (int): Number of results to return per page. Defaults to 100. Max size is 1000.
+            page_size (int): Number of results to return per page. Defaults to the maximum size of 1000.
             search (str, optional): Search string to filter results by. Defaults to None.
+            stream (bool, optional): Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: List of NAT64 prefixes configured for the organisation
@@ -720,7 +728,7 @@ class TrafficForwardingAPI(APIEndpoint):
                     print(prefix)
 
         """
-        return BoxList(Iterator(self._api, "ipv6config/nat64prefix", **kwargs))
+        return collect(Iterator(self._api, "ipv6config/nat64prefix", **kwargs))
 
     def list_gre_ip_addresses(self, **kwargs) -> BoxList:
         """
@@ -1,5 +1,3 @@
-import time
-
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
@@ -28,12 +26,13 @@ class URLCategoriesAPI(APIEndpoint):
         if len(urls) > 100:
             results = BoxList()
             for chunk in chunker(urls, 100):
+                self._api.rate_limiter.acquire("urlLookup")
                 results.extend(self._post("urlLookup", json=chunk))
-                time.sleep(1)
             return results
 
         else:
             payload = urls
+            self._api.rate_limiter.acquire("urlLookup")
             return self._post("urlLookup", json=payload)
 
     def list_categories(self, custom_only: bool = False, only_counts: bool = False) -> BoxList:
@@ -1,7 +1,8 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, convert_keys, snake_to_camel
+from pyzscaler.models import ZIAUser
+from pyzscaler.utils import Iterator, collect, convert_keys, snake_to_camel
 
 
 class UserManagementAPI(APIEndpoint):
@@ -22,9 +23,11 @@ class UserManagementAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **page_size (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
             **search (str, optional):
                 The search string used to match against a department's name or comments attributes.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of departments configured in ZIA.
@@ -45,7 +48,7 @@ class UserManagementAPI(APIEndpoint):
             >>> for department in zia.users.list_departments(page_size=200, max_pages=2):
             ...    print(department)
         """
-        return BoxList(Iterator(self._api, "departments", **kwargs))
+        return collect(Iterator(self._api, "departments", **kwargs))
 
     def get_department(self, department_id: str) -> Box:
         """
@@ -73,9 +76,11 @@ class UserManagementAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **page_size (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
             **search (str, optional):
                 The search string used to match against a group's name or comments attributes.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of user groups configured in ZIA.
@@ -97,7 +102,7 @@ class UserManagementAPI(APIEndpoint):
             ...    print(group)
 
         """
-        return BoxList(Iterator(self._api, "groups", **kwargs))
+        return collect(Iterator(self._api, "groups", **kwargs))
 
     def get_group(self, group_id: str) -> Box:
         """
@@ -131,7 +136,13 @@ class UserManagementAPI(APIEndpoint):
             **name (str, optional):
                 Filters by user name. This is a `partial` match.
             **page_size (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
+            **model (bool, optional):
+                Returns each record as a compact :class:`~pyzscaler.models.ZIAUser` instead of a :obj:`Box`.
+            **as_columns (bool, optional):
+                Returns a :class:`~pyzscaler.utils.ColumnTable` holding one list per field instead of a :obj:`BoxList`.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of users configured in ZIA.
@@ -153,7 +164,7 @@ class UserManagementAPI(APIEndpoint):
             ...    print(user)
 
         """
-        return BoxList(Iterator(self._api, "users", **kwargs))
+        return collect(Iterator(self._api, "users", record_model=ZIAUser, **kwargs))
 
     def add_user(self, name: str, email: str, groups: list, department: dict, **kwargs) -> Box:
         """
@@ -230,6 +241,7 @@ class UserManagementAPI(APIEndpoint):
 
         payload = {"ids": user_ids}
 
+        self._api.rate_limiter.acquire("users/bulkDelete")
         return self._post("users/bulkDelete", json=payload)
 
     def get_user(self, user_id: str = None, email: str = None) -> Box:
@@ -254,7 +266,7 @@ class UserManagementAPI(APIEndpoint):
             raise ValueError("TOO MANY ARGUMENTS: Expected either a user_id or an email. Both were provided.")
 
         elif email:
-            user = (record for record in self.list_users(search=email) if record.email == email)
+            user = (record for record in self.list_users(search=email, stream=True) if record.email == email)
             return next(user, None)
 
         return self._get(f"users/{user_id}")
@@ -1,28 +1,42 @@
 import os
+from functools import cached_property
 
 from restfly.session import APISession
 
 from pyzscaler import __version__
-from pyzscaler.zpa.app_segments import AppSegmentsAPI
-from pyzscaler.zpa.certificates import CertificatesAPI
-from pyzscaler.zpa.cloud_connector_groups import CloudConnectorGroupsAPI
-from pyzscaler.zpa.connectors import ConnectorsAPI
-from pyzscaler.zpa.idp import IDPControllerAPI
-from pyzscaler.zpa.inspection import InspectionControllerAPI
-from pyzscaler.zpa.lss import LSSConfigControllerAPI
-from pyzscaler.zpa.machine_groups import MachineGroupsAPI
-from pyzscaler.zpa.policies import PolicySetsAPI
-from pyzscaler.zpa.posture_profiles import PostureProfilesAPI
-from pyzscaler.zpa.provisioning import ProvisioningAPI
-from pyzscaler.zpa.saml_attributes import SAMLAttributesAPI
-from pyzscaler.zpa.scim_attributes import SCIMAttributesAPI
-from pyzscaler.zpa.scim_groups import SCIMGroupsAPI
-from pyzscaler.zpa.segment_groups import SegmentGroupsAPI
-from pyzscaler.zpa.server_groups import ServerGroupsAPI
-from pyzscaler.zpa.servers import AppServersAPI
-from pyzscaler.zpa.service_edges import ServiceEdgesAPI
-from pyzscaler.zpa.session import AuthenticatedSessionAPI
-from pyzscaler.zpa.trusted_networks import TrustedNetworksAPI
+from pyzscaler.batch import BatchAPI
+from pyzscaler.cache import TokenCache
+from pyzscaler.ratelimit import RateLimiter
+from pyzscaler.tokens import TokenManager
+from pyzscaler.utils import JSONSession, lazy_import, mount_pool, pool_options
+
+# The endpoint modules are imported when an interface is first used, so importing a controller stays fast.
+_endpoints = {
+    "AppSegmentsAPI": "pyzscaler.zpa.app_segments",
+    "AppServersAPI": "pyzscaler.zpa.servers",
+    "AuthenticatedSessionAPI": "pyzscaler.zpa.session",
+    "CertificatesAPI": "pyzscaler.zpa.certificates",
+    "CloudConnectorGroupsAPI": "pyzscaler.zpa.cloud_connector_groups",
+    "ConnectorsAPI": "pyzscaler.zpa.connectors",
+    "IDPControllerAPI": "pyzscaler.zpa.idp",
+    "InspectionControllerAPI": "pyzscaler.zpa.inspection",
+    "LSSConfigControllerAPI": "pyzscaler.zpa.lss",
+    "MachineGroupsAPI": "pyzscaler.zpa.machine_groups",
+    "PolicySetsAPI": "pyzscaler.zpa.policies",
+    "PostureProfilesAPI": "pyzscaler.zpa.posture_profiles",
+    "ProvisioningAPI": "pyzscaler.zpa.provisioning",
+    "SAMLAttributesAPI": "pyzscaler.zpa.saml_attributes",
+    "SCIMAttributesAPI": "pyzscaler.zpa.scim_attributes",
+    "SCIMGroupsAPI": "pyzscaler.zpa.scim_groups",
+    "SegmentGroupsAPI": "pyzscaler.zpa.segment_groups",
+    "ServerGroupsAPI": "pyzscaler.zpa.server_groups",
+    "ServiceEdgesAPI": "pyzscaler.zpa.service_edges",
+    "TrustedNetworksAPI": "pyzscaler.zpa.trusted_networks",
+}
+
+
+def __getattr__(name):
+    return lazy_import(__name__, _endpoints, name)
 
 
 class ZPA(APISession):
@@ -46,6 +60,30 @@ class ZPA(APISession):
             (e.g. internal test instance etc). When using this attribute, there is no need to supply the `cloud`
             attribute. The override URL will be prepended to the API endpoint suffixes. The protocol must be included
             i.e. http:// or https://.
+        rate_limiter (RateLimiter):
+            If supplied, paginated and bulk requests will draw from this :class:`~pyzscaler.ratelimit.RateLimiter`
+            instead of the default limiter of one request per second for each endpoint family. Pass an
+            :class:`~pyzscaler.ratelimit.AdaptiveRateLimiter` to adapt the rate to the one the tenant allows.
+            Pass a :class:`~pyzscaler.ratelimit.RequestScheduler` to schedule every request by priority.
+        pool_connections (int): The number of hosts to keep an HTTP connection pool for. Defaults to ``10``.
+        pool_maxsize (int):
+            The maximum number of connections kept open to each host. Size this to the number of concurrent requests.
+            Defaults to ``32``.
+        pool_block (bool):
+            Wait for a free pooled connection once ``pool_maxsize`` connections to a host are in use, instead of opening
+            one that is discarded after the request. Defaults to ``False``.
+        keep_alive (bool):
+            Reuse connections between requests, with TCP keep-alive probes enabled. Defaults to ``True``.
+        compress_requests (bool or int):
+            Gzip request bodies of at least this many bytes, or at least 1 KiB if ``True``, e.g. for bulk URL category
+            updates. Only enable this for tenants whose API accepts ``Content-Encoding: gzip``. Defaults to ``False``.
+        raw (bool):
+            Return the records of paginated list methods as plain dicts and lists instead of :obj:`Box` objects, which
+            skips the Box conversion on large exports. Any list method can also be called with ``raw=True``.
+            Defaults to ``False``.
+        token_cache (TokenCache):
+            If supplied, the session is stored in this :class:`~pyzscaler.cache.TokenCache` and reused by other
+            processes with the same credentials until it expires. Pass ``True`` to use the default cache location.
 
     """
 
@@ -64,11 +102,17 @@ class ZPA(APISession):
         self._cloud = kw.get("cloud", os.getenv(f"{self._env_base}_CLOUD"))
         self._override_url = kw.get("override_url", os.getenv(f"{self._env_base}_OVERRIDE_URL"))
         self.conv_box = True
+        self.rate_limiter = kw.get("rate_limiter") or RateLimiter(self._env_base)
+        self.raw = kw.get("raw", False)
+        self._pool_options = {key: kw[key] for key in pool_options if key in kw}
+        self._token_cache = TokenCache() if kw.get("token_cache") is True else kw.get("token_cache")
         super(ZPA, self).__init__(**kw)
 
     def _build_session(self, **kwargs) -> None:
         """Creates a ZPA API authenticated session."""
+        kwargs.setdefault("session", JSONSession())
         super(ZPA, self)._build_session(**kwargs)
+        mount_pool(self._session, admit=self.rate_limiter.request_hook(self._url), **self._pool_options)
 
         # Configure URL base for this API session
         if self._override_url:
@@ -86,166 +130,236 @@ class ZPA(APISession):
         # The v2 URL supports additional API endpoints
         self.v2_url = f"{self.url_base}/mgmtconfig/v2/admin/customers/{self._customer_id}"
 
-        self._auth_token = self.session.create_token(client_id=self._client_id, client_secret=self._client_secret)
-        return self._session.headers.update({"Authorization": f"Bearer {self._auth_token}"})
+        # Feed every response back to the rate limiter so it can adapt to 429s and Retry-After.
+        self._session.hooks["response"].append(self.rate_limiter.response_hook(self._url))
 
-    @property
+        # The token is refreshed in the background before it expires, using the JWT exp claim.
+        self.token_manager = TokenManager(self._session, self._fetch_token)
+        self.token_manager.start()
+
+    def _create_token(self) -> tuple:
+        return self.session.create_token(client_id=self._client_id, client_secret=self._client_secret), None
+
+    def _fetch_token(self) -> tuple:
+        if self._token_cache is None:
+            return self._create_token()
+        # Reuse the token of another process signed in with the same credentials, unless it is the one being replaced.
+        return self._token_cache.token(
+            (self._env_base, self._url, self._client_id),
+            self._client_secret,
+            self._create_token,
+            stale=self.token_manager.token,
+        )
+
+    def _deauthenticate(self):
+        """Stops refreshing the session token."""
+        self.token_manager.stop()
+
+    @cached_property
+    def batch(self):
+        """
+        The interface object for running ``get_*`` calls concurrently with :meth:`~pyzscaler.batch.BatchAPI.get_many`.
+
+        """
+        return BatchAPI(self)
+
+    @cached_property
     def app_segments(self):
         """
         The interface object for the :ref:`ZPA Application Segments interface <zpa-app_segments>`.
 
         """
+        from pyzscaler.zpa.app_segments import AppSegmentsAPI
+
         return AppSegmentsAPI(self)
 
-    @property
+    @cached_property
     def certificates(self):
         """
         The interface object for the :ref:`ZPA Browser Access Certificates interface <zpa-certificates>`.
 
         """
+        from pyzscaler.zpa.certificates import CertificatesAPI
+
         return CertificatesAPI(self)
 
-    @property
+    @cached_property
     def cloud_connector_groups(self):
         """
         The interface object for the :ref:`ZPA Cloud Connector Groups interface <zpa-cloud_connector_groups>`.
 
         """
+        from pyzscaler.zpa.cloud_connector_groups import CloudConnectorGroupsAPI
+
         return CloudConnectorGroupsAPI(self)
 
-    @property
+    @cached_property
     def connectors(self):
         """
         The interface object for the :ref:`ZPA Connectors interface <zpa-connectors>`.
 
         """
+        from pyzscaler.zpa.connectors import ConnectorsAPI
+
         return ConnectorsAPI(self)
 
-    @property
+    @cached_property
     def idp(self):
         """
         The interface object for the :ref:`ZPA IDP interface <zpa-idp>`.
 
         """
+        from pyzscaler.zpa.idp import IDPControllerAPI
+
         return IDPControllerAPI(self)
 
-    @property
+    @cached_property
     def inspection(self):
         """
         The interface object for the :ref:`ZPA Inspection interface <zpa-inspection>`.
 
         """
+        from pyzscaler.zpa.inspection import InspectionControllerAPI
+
         return InspectionControllerAPI(self)
 
-    @property
+    @cached_property
     def lss(self):
         """
         The interface object for the :ref:`ZIA Log Streaming Service Config interface <zpa-lss>`.
 
         """
+        from pyzscaler.zpa.lss import LSSConfigControllerAPI
+
         return LSSConfigControllerAPI(self)
 
-    @property
+    @cached_property
     def machine_groups(self):
         """
         The interface object for the :ref:`ZPA Machine Groups interface <zpa-machine_groups>`.
 
         """
+        from pyzscaler.zpa.machine_groups import MachineGroupsAPI
+
         return MachineGroupsAPI(self)
 
-    @property
+    @cached_property
     def policies(self):
         """
         The interface object for the :ref:`ZPA Policy Sets interface <zpa-policies>`.
 
         """
+        from pyzscaler.zpa.policies import PolicySetsAPI
+
         return PolicySetsAPI(self)
 
-    @property
+    @cached_property
     def posture_profiles(self):
         """
         The interface object for the :ref:`ZPA Posture Profiles interface <zpa-posture_profiles>`.
 
         """
+        from pyzscaler.zpa.posture_profiles import PostureProfilesAPI
+
         return PostureProfilesAPI(self)
 
-    @property
+    @cached_property
     def provisioning(self):
         """
         The interface object for the :ref:`ZPA Provisioning interface <zpa-provisioning>`.
 
         """
+        from pyzscaler.zpa.provisioning import ProvisioningAPI
+
         return ProvisioningAPI(self)
 
-    @property
+    @cached_property
     def saml_attributes(self):
         """
         The interface object for the :ref:`ZPA SAML Attributes interface <zpa-saml_attributes>`.
 
         """
+        from pyzscaler.zpa.saml_attributes import SAMLAttributesAPI
+
         return SAMLAttributesAPI(self)
 
-    @property
+    @cached_property
     def scim_attributes(self):
         """
         The interface object for the :ref:`ZPA SCIM Attributes interface <zpa-scim_attributes>`.
 
         """
+        from pyzscaler.zpa.scim_attributes import SCIMAttributesAPI
+
         return SCIMAttributesAPI(self)
 
-    @property
+    @cached_property
     def scim_groups(self):
         """
         The interface object for the :ref:`ZPA SCIM Groups interface <zpa-scim_groups>`.
 
         """
+        from pyzscaler.zpa.scim_groups import SCIMGroupsAPI
+
         return SCIMGroupsAPI(self)
 
-    @property
+    @cached_property
     def segment_groups(self):
         """
         The interface object for the :ref:`ZPA Segment Groups interface <zpa-segment_groups>`.
 
         """
+        from pyzscaler.zpa.segment_groups import SegmentGroupsAPI
+
         return SegmentGroupsAPI(self)
 
-    @property
+    @cached_property
     def server_groups(self):
         """
         The interface object for the :ref:`ZPA Server Groups interface <zpa-server_groups>`.
 
         """
+        from pyzscaler.zpa.server_groups import ServerGroupsAPI
+
         return ServerGroupsAPI(self)
 
-    @property
+    @cached_property
     def servers(self):
         """
         The interface object for the :ref:`ZPA Application Servers interface <zpa-app_servers>`.
 
         """
+        from pyzscaler.zpa.servers import AppServersAPI
+
         return AppServersAPI(self)
 
-    @property
+    @cached_property
     def service_edges(self):
         """
         The interface object for the :ref:`ZPA Service Edges interface <zpa-service_edges>`.
 
         """
+        from pyzscaler.zpa.service_edges import ServiceEdgesAPI
+
         return ServiceEdgesAPI(self)
 
-    @property
+    @cached_property
     def session(self):
         """
         The interface object for the :ref:`ZPA Session API calls <zpa-session>`.
 
         """
 
+        from pyzscaler.zpa.session import AuthenticatedSessionAPI
+
         return AuthenticatedSessionAPI(self)
 
-    @property
+    @cached_property
     def trusted_networks(self):
         """
         The interface object for the :ref:`ZPA Trusted Networks interface <zpa-trusted_networks>`.
 
         """
+        from pyzscaler.zpa.trusted_networks import TrustedNetworksAPI
+
         return TrustedNetworksAPI(self)
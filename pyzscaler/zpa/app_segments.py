@@ -1,7 +1,14 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, add_id_groups, convert_keys, snake_to_camel
+from pyzscaler.models import ZPAAppSegment
+from pyzscaler.utils import (
+    Iterator,
+    add_id_groups,
+    collect,
+    convert_keys,
+    snake_to_camel,
+)
 
 
 class AppSegmentsAPI(APIEndpoint):
@@ -15,6 +22,12 @@ class AppSegmentsAPI(APIEndpoint):
         """
         Retrieve all configured application segments.
 
+        Keyword Args:
+            **model (bool, optional):
+                Returns each record as a compact :class:`~pyzscaler.models.ZPAAppSegment` instead of a :obj:`Box`.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
+
         Returns:
             :obj:`BoxList`: List of application segments.
 
@@ -22,7 +35,7 @@ class AppSegmentsAPI(APIEndpoint):
             >>> app_segments = zpa.app_segments.list_segments()
 
         """
-        return BoxList(Iterator(self._api, "application", **kwargs))
+        return collect(Iterator(self._api, "application", record_model=ZPAAppSegment, **kwargs))
 
     def get_segment(self, segment_id: str) -> Box:
         """
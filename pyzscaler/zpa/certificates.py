@@ -1,7 +1,7 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint, APISession
 
-from pyzscaler.utils import Iterator
+from pyzscaler.utils import Iterator, collect
 
 
 class CertificatesAPI(APIEndpoint):
@@ -23,9 +23,11 @@ class CertificatesAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int, optional):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: List of all Browser Access certificates.
@@ -35,7 +37,7 @@ class CertificatesAPI(APIEndpoint):
             ...    print(cert)
 
         """
-        return BoxList(Iterator(self._api, f"{self.v2_url}/clientlessCertificate/issued", **kwargs))
+        return collect(Iterator(self._api, f"{self.v2_url}/clientlessCertificate/issued", **kwargs))
 
     def get_browser_access(self, certificate_id: str) -> Box:
         """
@@ -84,9 +86,11 @@ class CertificatesAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int, optional):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: List of all enrollment certificates.
@@ -96,4 +100,4 @@ class CertificatesAPI(APIEndpoint):
             ...    print(cert)
 
         """
-        return BoxList(Iterator(self._api, f"{self.v2_url}/enrollmentCert", **kwargs))
+        return collect(Iterator(self._api, f"{self.v2_url}/enrollmentCert", **kwargs))
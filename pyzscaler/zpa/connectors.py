@@ -1,9 +1,11 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
+from pyzscaler.models import ZPAConnector
 from pyzscaler.utils import (
     Iterator,
     add_id_groups,
+    collect,
     pick_version_profile,
     snake_to_camel,
 )
@@ -28,9 +30,13 @@ class ConnectorsAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
             **search (str, optional):
                 The search string used to match against a department's name or comments attributes.
+            **model (bool, optional):
+                Returns each record as a compact :class:`~pyzscaler.models.ZPAConnector` instead of a :obj:`Box`.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: List containing all configured ZPA App Connectors.
@@ -42,7 +48,7 @@ class ConnectorsAPI(APIEndpoint):
             ...    print(connector)
 
         """
-        return BoxList(Iterator(self._api, "connector", **kwargs))
+        return collect(Iterator(self._api, "connector", record_model=ZPAConnector, **kwargs))
 
     def get_connector(self, connector_id: str) -> Box:
         """
@@ -130,6 +136,7 @@ class ConnectorsAPI(APIEndpoint):
 
         """
         payload = {"ids": connector_ids}
+        self._api.rate_limiter.acquire("connector/bulkDelete")
         return self._post("connector/bulkDelete", json=payload, box=False).status_code
 
     def list_connector_groups(self, **kwargs) -> BoxList:
@@ -142,9 +149,11 @@ class ConnectorsAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
             **search (str, optional):
                 The search string used to match against a department's name or comments attributes.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: List of all configured connector groups.
@@ -153,7 +162,7 @@ class ConnectorsAPI(APIEndpoint):
             >>> connector_groups = zpa.connectors.list_connector_groups()
 
         """
-        return BoxList(Iterator(self._api, "appConnectorGroup", **kwargs))
+        return collect(Iterator(self._api, "appConnectorGroup", **kwargs))
 
     def get_connector_group(self, group_id: str) -> Box:
         """
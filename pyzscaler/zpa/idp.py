@@ -2,7 +2,7 @@ from box import Box, BoxList
 from restfly import APISession
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator
+from pyzscaler.utils import Iterator, collect
 
 
 class IDPControllerAPI(APIEndpoint):
@@ -21,11 +21,13 @@ class IDPControllerAPI(APIEndpoint):
             **max_pages (int):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **scim_enabled (bool):
                 Returns all SCIM IdPs if ``True``. Returns all non-SCIM IdPs if ``False``.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: A list of all configured IdPs.
@@ -35,7 +37,7 @@ class IDPControllerAPI(APIEndpoint):
             ...    pprint(idp)
 
         """
-        return BoxList(Iterator(self._api, f"{self.v2_url}/idp", **kwargs))
+        return collect(Iterator(self._api, f"{self.v2_url}/idp", **kwargs))
 
     def get_idp(self, idp_id: str) -> Box:
         """
@@ -1,7 +1,7 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, convert_keys, snake_to_camel
+from pyzscaler.utils import Iterator, collect, convert_keys, snake_to_camel
 
 
 class InspectionControllerAPI(APIEndpoint):
@@ -441,6 +441,8 @@ class InspectionControllerAPI(APIEndpoint):
 
                 - ``ASC`` - ascending order
                 - ``DESC`` - descending order
+            **stream (bool):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: A list containing all custom ZPA Inspection Controls.
@@ -454,7 +456,7 @@ class InspectionControllerAPI(APIEndpoint):
                     print(control)
 
         """
-        return BoxList(Iterator(self._api, "inspectionControls/custom", **kwargs))
+        return collect(Iterator(self._api, "inspectionControls/custom", **kwargs))
 
     def list_custom_http_methods(self) -> BoxList:
         """
@@ -548,9 +550,11 @@ class InspectionControllerAPI(APIEndpoint):
 
         Keyword Args:
             **pagesize (int):
-                Specifies the page size. The default size is 20 and the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The list of ZPA Inspection Profile resource records.
@@ -564,7 +568,7 @@ class InspectionControllerAPI(APIEndpoint):
                     print(profile)
 
         """
-        return BoxList(Iterator(self._api, "inspectionProfile", **kwargs))
+        return collect(Iterator(self._api, "inspectionProfile", **kwargs))
 
     def profile_control_attach(self, profile_id: str, action: str, **kwargs) -> Box:
         """
@@ -2,7 +2,7 @@ from box import Box, BoxList
 from restfly import APISession
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, convert_keys, keys_exists, snake_to_camel
+from pyzscaler.utils import Iterator, collect, convert_keys, keys_exists, snake_to_camel
 
 
 class LSSConfigControllerAPI(APIEndpoint):
@@ -111,9 +111,11 @@ class LSSConfigControllerAPI(APIEndpoint):
             **max_pages (int):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: List of all configured LSS receivers.
@@ -124,7 +126,7 @@ class LSSConfigControllerAPI(APIEndpoint):
             >>> for lss_config in zpa.lss.list_configs():
             ...    print(config)
         """
-        return BoxList(Iterator(self._api, f"{self.v2_url}/lssConfig", **kwargs))
+        return collect(Iterator(self._api, f"{self.v2_url}/lssConfig", **kwargs))
 
     def get_config(self, lss_id: str) -> Box:
         """
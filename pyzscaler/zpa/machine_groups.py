@@ -1,7 +1,7 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator
+from pyzscaler.utils import Iterator, collect
 
 
 class MachineGroupsAPI(APIEndpoint):
@@ -15,9 +15,11 @@ class MachineGroupsAPI(APIEndpoint):
             **max_pages (int):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`list`: A list of all configured machine groups.
@@ -27,7 +29,7 @@ class MachineGroupsAPI(APIEndpoint):
             ...    pprint(machine_group)
 
         """
-        return BoxList(Iterator(self._api, "machineGroup", **kwargs))
+        return collect(Iterator(self._api, "machineGroup", **kwargs))
 
     def get_group(self, group_id: str) -> Box:
         """
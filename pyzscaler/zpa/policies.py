@@ -1,7 +1,7 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, convert_keys, snake_to_camel
+from pyzscaler.utils import Iterator, collect, convert_keys, snake_to_camel
 
 
 class PolicySetsAPI(APIEndpoint):
@@ -147,6 +147,10 @@ class PolicySetsAPI(APIEndpoint):
                 |  ``timeout`` - returns Timeout Policy rules
                 |  ``client_forwarding`` - returns Client Forwarding Policy rules
 
+        Keyword Args:
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
+
         Returns:
             :obj:`list`: A list of all policy rules that match the requested type.
 
@@ -166,7 +170,7 @@ class PolicySetsAPI(APIEndpoint):
                 f"Policy type must be 'access', 'timeout', 'client_forwarding' or 'siem'."
             )
 
-        return BoxList(Iterator(self._api, f"policySet/rules/policyType/{mapped_policy_type}", **kwargs))
+        return collect(Iterator(self._api, f"policySet/rules/policyType/{mapped_policy_type}", **kwargs))
 
     def delete_rule(self, policy_type: str, rule_id: str) -> int:
         """
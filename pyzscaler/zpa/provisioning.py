@@ -1,7 +1,7 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, snake_to_camel
+from pyzscaler.utils import Iterator, collect, snake_to_camel
 
 
 def simplify_key_type(key_type):
@@ -31,9 +31,11 @@ class ProvisioningAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int, optional):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: A list containing the requested provisioning keys.
@@ -51,7 +53,7 @@ class ProvisioningAPI(APIEndpoint):
 
         """
 
-        return BoxList(Iterator(self._api, f"associationType/{simplify_key_type(key_type)}/provisioningKey", **kwargs))
+        return collect(Iterator(self._api, f"associationType/{simplify_key_type(key_type)}/provisioningKey", **kwargs))
 
     def get_provisioning_key(self, key_id: str, key_type: str) -> Box:
         """
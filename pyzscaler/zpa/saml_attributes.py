@@ -2,7 +2,7 @@ from box import Box, BoxList
 from restfly import APISession
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator
+from pyzscaler.utils import Iterator, collect
 
 
 class SAMLAttributesAPI(APIEndpoint):
@@ -21,9 +21,11 @@ class SAMLAttributesAPI(APIEndpoint):
             **max_pages (int):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: A list of all configured SAML attributes.
@@ -33,7 +35,7 @@ class SAMLAttributesAPI(APIEndpoint):
             ...    pprint(saml_attribute)
 
         """
-        return BoxList(Iterator(self._api, f"{self.v2_url}/samlAttribute", **kwargs))
+        return collect(Iterator(self._api, f"{self.v2_url}/samlAttribute", **kwargs))
 
     def list_attributes_by_idp(self, idp_id: str, **kwargs) -> BoxList:
         """
@@ -48,9 +50,11 @@ class SAMLAttributesAPI(APIEndpoint):
             **max_pages (int):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: A list of all configured SAML attributes for the specified IdP.
@@ -60,7 +64,7 @@ class SAMLAttributesAPI(APIEndpoint):
             ...    pprint(saml_attribute)
 
         """
-        return BoxList(Iterator(self._api, f"{self.v2_url}/samlAttribute/idp/{idp_id}", **kwargs))
+        return collect(Iterator(self._api, f"{self.v2_url}/samlAttribute/idp/{idp_id}", **kwargs))
 
     def get_attribute(self, attribute_id: str) -> Box:
         """
@@ -1,7 +1,7 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint, APISession
 
-from pyzscaler.utils import Iterator
+from pyzscaler.utils import Iterator, collect
 
 
 class SCIMAttributesAPI(APIEndpoint):
@@ -23,9 +23,11 @@ class SCIMAttributesAPI(APIEndpoint):
             **max_pages (int):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: A list of all configured SCIM attributes for the specified IdP.
@@ -35,7 +37,7 @@ class SCIMAttributesAPI(APIEndpoint):
             ...    pprint(scim_attribute)
 
         """
-        return BoxList(Iterator(self._api, f"idp/{idp_id}/scimattribute", **kwargs))
+        return collect(Iterator(self._api, f"idp/{idp_id}/scimattribute", **kwargs))
 
     def get_attribute(self, idp_id: str, attribute_id: str) -> Box:
         """
@@ -76,9 +78,11 @@ class SCIMAttributesAPI(APIEndpoint):
             **max_pages (int):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: The resource record for the SCIM attribute values.
@@ -87,6 +91,6 @@ class SCIMAttributesAPI(APIEndpoint):
             >>> pprint(zpa.scim_attributes.get_values('99999', '88888'))
 
         """
-        return BoxList(
+        return collect(
             Iterator(self._api, f"{self.user_config_url}/scimattribute/idpId/{idp_id}/attributeId/{attribute_id}", **kwargs)
         )
@@ -1,7 +1,7 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint, APISession
 
-from pyzscaler.utils import Iterator
+from pyzscaler.utils import Iterator, collect
 
 
 class SCIMGroupsAPI(APIEndpoint):
@@ -28,7 +28,7 @@ class SCIMGroupsAPI(APIEndpoint):
             **max_pages (int):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **scim_user_id (str):
                 The unique id for the SCIM user.
             **search (str, optional):
@@ -39,6 +39,8 @@ class SCIMGroupsAPI(APIEndpoint):
             **start_time (str):
                 The start of a time range for requesting last updated data (modified_time) for the SCIM group.
                 This requires setting the ``end_time`` parameter as well.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`list`: A list of all configured SCIM groups.
@@ -48,7 +50,7 @@ class SCIMGroupsAPI(APIEndpoint):
             ...    pprint(scim_group)
 
         """
-        return BoxList(Iterator(self._api, f"{self.user_config_url}/scimgroup/idpId/{idp_id}", **kwargs))
+        return collect(Iterator(self._api, f"{self.user_config_url}/scimgroup/idpId/{idp_id}", **kwargs))
 
     def get_group(self, group_id: str, **kwargs) -> Box:
         """
@@ -1,7 +1,7 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, snake_to_camel
+from pyzscaler.utils import Iterator, collect, snake_to_camel
 
 
 class SegmentGroupsAPI(APIEndpoint):
@@ -9,6 +9,10 @@ class SegmentGroupsAPI(APIEndpoint):
         """
         Returns a list of all configured segment groups.
 
+        Keyword Args:
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
+
         Returns:
             :obj:`BoxList`: A list of all configured segment groups.
 
@@ -17,7 +21,7 @@ class SegmentGroupsAPI(APIEndpoint):
             ...    pprint(segment_group)
 
         """
-        return BoxList(Iterator(self._api, "segmentGroup", **kwargs))
+        return collect(Iterator(self._api, "segmentGroup", **kwargs))
 
     def get_group(self, group_id: str) -> Box:
         """
@@ -1,7 +1,7 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, add_id_groups, snake_to_camel
+from pyzscaler.utils import Iterator, add_id_groups, collect, snake_to_camel
 
 
 class ServerGroupsAPI(APIEndpoint):
@@ -21,9 +21,11 @@ class ServerGroupsAPI(APIEndpoint):
             **max_pages (int):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: A list of all configured server groups.
@@ -33,7 +35,7 @@ class ServerGroupsAPI(APIEndpoint):
             ...    pprint(server_group)
 
         """
-        return BoxList(Iterator(self._api, "serverGroup", **kwargs))
+        return collect(Iterator(self._api, "serverGroup", **kwargs))
 
     def get_group(self, group_id: str) -> Box:
         """
@@ -1,7 +1,8 @@
 from box import Box, BoxList
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator, snake_to_camel
+from pyzscaler.models import ZPAServer
+from pyzscaler.utils import Iterator, collect, snake_to_camel
 
 
 class AppServersAPI(APIEndpoint):
@@ -57,9 +58,15 @@ class AppServersAPI(APIEndpoint):
             **max_pages (int):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **model (bool, optional):
+                Returns each record as a compact :class:`~pyzscaler.models.ZPAServer` instead of a :obj:`Box`.
+            **as_columns (bool, optional):
+                Returns a :class:`~pyzscaler.utils.ColumnTable` holding one list per field instead of a :obj:`BoxList`.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: List of all configured servers.
@@ -67,7 +74,7 @@ class AppServersAPI(APIEndpoint):
         Examples:
             >>> servers = zpa.servers.list_servers()
         """
-        return BoxList(Iterator(self._api, "server", **kwargs))
+        return collect(Iterator(self._api, "server", record_model=ZPAServer, **kwargs))
 
     def get_server(self, server_id: str) -> Box:
         """
@@ -4,6 +4,7 @@ from restfly.endpoint import APIEndpoint
 from pyzscaler.utils import (
     Iterator,
     add_id_groups,
+    collect,
     pick_version_profile,
     snake_to_camel,
 )
@@ -29,9 +30,11 @@ class ServiceEdgesAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
             **search (str, optional):
                 The search string used to match against a department's name or comments attributes.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: List containing information on all configured ZPA Service Edges.
@@ -41,7 +44,7 @@ class ServiceEdgesAPI(APIEndpoint):
             ...    print(service_edge)
 
         """
-        return BoxList(Iterator(self._api, "serviceEdge", **kwargs))
+        return collect(Iterator(self._api, "serviceEdge", **kwargs))
 
     def get_service_edge(self, service_edge_id: str) -> Box:
         """
@@ -128,6 +131,7 @@ class ServiceEdgesAPI(APIEndpoint):
             "ids": service_edge_ids,
         }
 
+        self._api.rate_limiter.acquire("serviceEdge/bulkDelete")
         return self._post("serviceEdge/bulkDelete", json=payload).status_code
 
     def list_service_edge_groups(self, **kwargs) -> BoxList:
@@ -143,9 +147,11 @@ class ServiceEdgesAPI(APIEndpoint):
             **max_pages (int, optional):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int, optional):
-                Specifies the page size. The default size is 100, but the maximum size is 1000.
+                Specifies the page size. Defaults to the maximum size of 1000.
             **search (str, optional):
                 The search string used to match against a department's name or comments attributes.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: A list of all ZPA Service Edge Group resource records.
@@ -157,7 +163,7 @@ class ServiceEdgesAPI(APIEndpoint):
             ...    print(group)
 
         """
-        return BoxList(Iterator(self._api, "serviceEdgeGroup", **kwargs))
+        return collect(Iterator(self._api, "serviceEdgeGroup", **kwargs))
 
     def get_service_edge_group(self, group_id: str) -> Box:
         """
@@ -2,7 +2,7 @@ from box import Box, BoxList
 from restfly import APISession
 from restfly.endpoint import APIEndpoint
 
-from pyzscaler.utils import Iterator
+from pyzscaler.utils import Iterator, collect
 
 
 class TrustedNetworksAPI(APIEndpoint):
@@ -21,9 +21,11 @@ class TrustedNetworksAPI(APIEndpoint):
             **max_pages (int):
                 The maximum number of pages to request before stopping iteration.
             **pagesize (int):
-                Specifies the page size. The default size is 20, but the maximum size is 500.
+                Specifies the page size. Defaults to the maximum size of 500.
             **search (str, optional):
                 The search string used to match against features and fields.
+            **stream (bool, optional):
+                Returns an iterator that yields records as each page arrives instead of a :obj:`BoxList`.
 
         Returns:
             :obj:`BoxList`: A list of all configured trusted networks.
@@ -33,7 +35,7 @@ class TrustedNetworksAPI(APIEndpoint):
             ...    pprint(trusted_network)
 
         """
-        return BoxList(Iterator(self._api, f"{self.v2_url}/network", **kwargs))
+        return collect(Iterator(self._api, f"{self.v2_url}/network", **kwargs))
 
     def get_network(self, network_id: str) -> Box:
         """
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+import responses
+from box import Box
+from responses import matchers
+
+from pyzscaler import AsyncZIA, AsyncZPA
+
+
+def add_zia_session():
+    responses.add(responses.POST, url="https://zsapi.zscaler.net/api/v1/authenticatedSession", json={}, status=200)
+    responses.add(responses.DELETE, url="https://zsapi.zscaler.net/api/v1/authenticatedSession", json={}, status=200)
+
+
+@responses.activate
+def test_async_zia_gathers_requests():
+    add_zia_session()
+    for user_id in range(20):
+        responses.add(
+            responses.GET,
+            url=f"https://zsapi.zscaler.net/api/v1/users/{user_id}",
+            json={"id": user_id, "name": f"user-{user_id}"},
+            status=200,
+        )
+
+    async def main():
+        async with AsyncZIA(
+            username="test@example.com", password="hunter2", cloud="zscaler", api_key="123456789abcdef", max_concurrency=8
+        ) as zia:
+            return await asyncio.gather(*(zia.users.get_user(str(user_id)) for user_id in range(20)))
+
+    users = asyncio.run(main())
+
+    assert [user.id for user in users] == list(range(20))
+    assert isinstance(users[0], Box)
+    assert responses.calls[-1].request.method == "DELETE"
+
+
+@responses.activate
+def test_async_zpa_streams_pages():
+    responses.add(responses.POST, url="https://config.private.zscaler.com/signin", json={"access_token": "xyz"}, status=200)
+    for page, records in ((1, [{"id": "1"}, {"id": "2"}]), (2, [{"id": "3"}])):
+        responses.add(
+            responses.GET,
+            url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/application",
+            json={"totalPages": "2", "list": records},
+            status=200,
+            match=[matchers.query_param_matcher({"page": str(page), "pagesize": "2"})],
+        )
+
+    async def main():
+        async with AsyncZPA(client_id="1", client_secret="yyy", customer_id="1") as zpa:
+            return [segment.id async for segment in await zpa.app_segments.list_segments(stream=True, page_size=2)]
+
+    assert asyncio.run(main()) == ["1", "2", "3"]
+
+
+def test_async_controller_must_be_opened():
+    zia = AsyncZIA()
+
+    with pytest.raises(RuntimeError):
+        zia.users
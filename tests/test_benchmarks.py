@@ -0,0 +1,69 @@
+import pytest
+
+from benchmarks.columns import run as run_columns
+from benchmarks.conversion import CASES, PAYLOADS
+from benchmarks.conversion import run_case as run_conversion_case
+from benchmarks.imports import run_case as run_import_case
+from benchmarks.json_codec import run as run_json_codec
+from benchmarks.mock_server import MockZscalerServer
+from benchmarks.pagination import compare, run_case
+
+
+@pytest.fixture(name="server", scope="module")
+def fixture_server():
+    with MockZscalerServer(records=2500, throttle_every=4) as server:
+        yield server
+
+
+@pytest.mark.parametrize("product", ["zia", "zpa", "zdx"])
+def test_run_case(server, product):
+    result = run_case(product, server.url, 2500, rate=1000000, prefetch=2, stream=True)
+
+    assert result["records"] == 2500
+    assert result["pages"] >= 3
+    assert result["items_per_sec"] > 0
+    assert result["p99_ms"] >= result["p50_ms"]
+    assert server.throttled
+
+
+def test_compare():
+    baseline = [{"product": "zia", "records": 1000, "items_per_sec": 100.0}]
+
+    assert compare([{"product": "zia", "records": 1000, "items_per_sec": 95.0}], baseline, 0.1) == []
+    assert len(compare([{"product": "zia", "records": 1000, "items_per_sec": 80.0}], baseline, 0.1)) == 1
+    assert compare([{"product": "zpa", "records": 1000, "items_per_sec": 1.0}], baseline, 0.1) == []
+
+
+def test_import_benchmark():
+    result = run_import_case("eager", repeat=1)
+
+    assert result["case"] == "eager"
+    assert result["median_ms"] > 0
+    assert result["pyzscaler_modules"] > run_import_case("zia", repeat=1)["pyzscaler_modules"]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("case", CASES)
+def test_conversion_benchmark(payload, case):
+    # run_case raises if the output differs from the legacy converter.
+    result = run_conversion_case(payload, case, iterations=10)
+
+    assert result["current_us"] > 0
+    assert result["legacy_us"] > 0
+
+
+def test_json_codec_benchmark():
+    # run_case raises if a backend doesn't round-trip the payload.
+    results = run_json_codec(size_mb=0.05, iterations=1)
+
+    assert {case["backend"] for case in results} >= {"json"}
+    assert all(case["decode_ms_per_mb"] > 0 and case["encode_ms_per_mb"] > 0 for case in results)
+    assert all(case["decode_speedup"] == 1.0 for case in results if case["backend"] == "json")
+
+
+def test_columns_benchmark():
+    # run raises if the ColumnTable columns differ from the ones built from a BoxList.
+    results = {case["case"]: case for case in run_columns(records=500)}
+
+    assert results["column_table"]["us_per_record"] > 0
+    assert results["column_table"]["peak_mb"] < results["boxlist"]["peak_mb"]
@@ -0,0 +1,139 @@
+import os
+import stat
+import time
+
+import pytest
+import responses
+
+from pyzscaler import cache as token_cache
+from pyzscaler.cache import TokenCache, seal, unseal
+from pyzscaler.zia import ZIA
+from pyzscaler.zpa import ZPA
+
+
+@pytest.fixture(name="cache")
+def fixture_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(TokenCache, "iterations", 1000)
+    return TokenCache(path=str(tmp_path))
+
+
+def test_seal_round_trip():
+    token = seal("secret", b"plaintext", iterations=1000)
+
+    assert unseal("secret", token, iterations=1000) == b"plaintext"
+    with pytest.raises(ValueError):
+        unseal("wrong", token, iterations=1000)
+    with pytest.raises(ValueError):
+        unseal("secret", b"garbage", iterations=1000)
+
+
+@pytest.mark.skipif(token_cache.Fernet is None, reason="cryptography is not installed")
+def test_seal_encrypts_with_cryptography():
+    token = seal("secret", b"plaintext", iterations=1000)
+
+    assert token.startswith(b"fernet:")
+    assert b"plaintext" not in token
+
+
+def test_get_or_create_is_shared_and_expires(cache):
+    calls = []
+
+    def create():
+        calls.append(1)
+        return {"token": f"token-{len(calls)}"}, time.time() + 3600
+
+    assert cache.get_or_create(("ZPA", "url", "id"), "secret", create)["data"] == {"token": "token-1"}
+    # A second process with the same credentials reuses the entry
+    assert TokenCache(path=cache.path).get_or_create(("ZPA", "url", "id"), "secret", create)["data"]["token"] == "token-1"
+    # Other credentials don't
+    assert cache.get_or_create(("ZPA", "url", "other"), "secret", create)["data"]["token"] == "token-2"
+    assert cache.get_or_create(("ZPA", "url", "id"), "changed", create)["data"]["token"] == "token-3"
+    # A stale entry is replaced
+    assert cache.get_or_create(("ZPA", "url", "id"), "changed", create, stale={"token": "token-3"})["data"]["token"] == (
+        "token-4"
+    )
+
+    file = cache._file(("ZPA", "url", "id"))
+    assert stat.S_IMODE(os.stat(file).st_mode) == 0o600
+
+
+def test_expired_entry_is_replaced(cache):
+    cache.get_or_create(("ZIA", "url", "user"), "secret", lambda: ({"cookies": {"a": "1"}}, time.time() + 30))
+
+    entry = cache.get_or_create(("ZIA", "url", "user"), "secret", lambda: ({"cookies": {"a": "2"}}, None))
+
+    # Expiring within the margin counts as expired, and the TTL is used when the expiry is unknown
+    assert entry["data"] == {"cookies": {"a": "2"}}
+    assert entry["expires_at"] == pytest.approx(time.time() + 1800, abs=5)
+
+
+@responses.activate
+def test_zia_reuses_cached_session_cookie(cache):
+    responses.add(
+        responses.POST,
+        url="https://zsapi.zscaler.net/api/v1/authenticatedSession",
+        json={"authType": "ADMIN_LOGIN"},
+        headers={"Set-Cookie": "JSESSIONID=abc123; Path=/"},
+        status=200,
+    )
+    credentials = dict(username="test@example.com", password="hunter2", cloud="zscaler", api_key="123456789abcdef")
+
+    ZIA(token_cache=cache, **credentials)
+    zia = ZIA(token_cache=cache, **credentials)
+
+    assert len(responses.calls) == 1
+    assert zia._session.cookies.get("JSESSIONID") == "abc123"
+
+
+@responses.activate
+def test_zpa_reuses_cached_token(cache):
+    responses.add(responses.POST, url="https://config.private.zscaler.com/signin", json={"access_token": "xyz"}, status=200)
+
+    first = ZPA(client_id="1", client_secret="yyy", customer_id="1", token_cache=cache)
+    second = ZPA(client_id="1", client_secret="yyy", customer_id="1", token_cache=cache)
+    first.token_manager.stop()
+    second.token_manager.stop()
+
+    assert len(responses.calls) == 1
+    assert second._session.headers["Authorization"] == "Bearer xyz"
+
+
+@responses.activate
+def test_zia_cached_session_isnt_signed_out(cache):
+    responses.add(
+        responses.POST,
+        url="https://zsapi.zscaler.net/api/v1/authenticatedSession",
+        json={"authType": "ADMIN_LOGIN"},
+        headers={"Set-Cookie": "JSESSIONID=abc123; Path=/"},
+        status=200,
+    )
+    credentials = dict(username="test@example.com", password="hunter2", cloud="zscaler", api_key="123456789abcdef")
+
+    with ZIA(token_cache=cache, **credentials):
+        pass
+    ZIA(token_cache=cache, **credentials)
+
+    # Other processes may still be using the cached cookie, so it isn't logged out and is reused.
+    assert [call.request.method for call in responses.calls] == ["POST"]
+
+
+@responses.activate
+def test_zia_replaces_rejected_cached_cookie(cache):
+    credentials = dict(username="test@example.com", password="hunter2", cloud="zscaler", api_key="123456789abcdef")
+    for cookie in ("old", "new"):
+        responses.add(
+            responses.POST,
+            url="https://zsapi.zscaler.net/api/v1/authenticatedSession",
+            json={"authType": "ADMIN_LOGIN"},
+            headers={"Set-Cookie": f"JSESSIONID={cookie}; Path=/"},
+            status=200,
+        )
+    responses.add(responses.GET, url="https://zsapi.zscaler.net/api/v1/status", json={}, status=401)
+    responses.add(responses.GET, url="https://zsapi.zscaler.net/api/v1/status", json={"status": "ACTIVE"}, status=200)
+    zia = ZIA(token_cache=cache, **credentials)
+
+    assert zia.get("status") == {"status": "ACTIVE"}
+    assert responses.calls[-1].request.headers["Cookie"] == "JSESSIONID=new"
+    # The replacement is cached for other processes
+    assert ZIA(token_cache=cache, **credentials)._session.cookies.get("JSESSIONID") == "new"
+    assert len(responses.calls) == 4
@@ -0,0 +1,112 @@
+import tracemalloc
+
+import pytest
+from box import BoxList
+
+from pyzscaler.models import Record, ZCCDevice, ZIAUser, ZPAAppSegment
+from pyzscaler.utils import SnakeView, record_model
+
+
+@pytest.fixture(name="user")
+def fixture_user():
+    return {
+        "id": 1,
+        "name": "Test User A",
+        "email": "testusera@example.com",
+        "groups": [{"id": 1, "name": "test"}],
+        "department": {"id": 1, "name": "test_department", "isNonEditable": False},
+        "adminUser": False,
+        "customAttribute": {"costCenter": "42"},
+    }
+
+
+def test_record_fields(user):
+    record = ZIAUser(user)
+
+    assert record.id == 1
+    assert record.admin_user is False
+    assert record.comments is None
+    assert isinstance(record.department, SnakeView)
+    assert record.department.is_non_editable is False
+    assert record.groups[0].name == "test"
+
+
+def test_record_is_slotted(user):
+    record = ZIAUser(user)
+
+    assert not hasattr(record, "__dict__")
+    assert "admin_user" in ZIAUser.__slots__
+    assert "_department" in ZIAUser.__slots__
+    with pytest.raises(AttributeError):
+        record.unknown = 1
+
+
+def test_record_extra_keys(user):
+    record = ZIAUser(user)
+
+    assert record.custom_attribute.cost_center == "42"
+    assert record.get("custom_attribute")["costCenter"] == "42"
+    assert record.get("missing", "default") == "default"
+    with pytest.raises(AttributeError):
+        record.missing
+
+
+def test_record_to_dict(user):
+    record = ZIAUser(user)
+
+    assert record.to_dict() == user
+    assert record == ZIAUser(user)
+    assert record != ZIAUser({**user, "id": 2})
+    assert repr(record).startswith("ZIAUser({")
+
+
+def test_record_subclass():
+    class Tenant(Record):
+        _fields = ("id", "tenantName", "owner")
+        _nested = ("owner",)
+
+    record = Tenant({"id": 1, "tenantName": "acme", "owner": {"userName": "admin"}})
+
+    assert record.tenant_name == "acme"
+    assert record.owner.user_name == "admin"
+    assert Tenant._slots == {"id": "id", "tenantName": "tenant_name", "owner": "_owner"}
+
+
+def test_record_model():
+    assert record_model(False, ZIAUser) is None
+    assert record_model(True, ZIAUser) is ZIAUser
+    assert record_model(ZPAAppSegment, ZIAUser) is ZPAAppSegment
+    with pytest.raises(ValueError):
+        record_model(True)
+
+
+def test_record_memory():
+    devices = [
+        {
+            "udid": f"{i:08x}-udid",
+            "user": f"user{i}@example.com",
+            "type": 3,
+            "osVersion": "Microsoft Windows 10 Pro;64 bit",
+            "agentVersion": "4.1.0.85",
+            "companyName": "Example",
+            "machineHostname": f"LAPTOP-{i}",
+            "manufacturer": "LENOVO",
+            "state": 1,
+            "registrationState": "Registered",
+            "last_seen_time": "2023-05-25 15:44:36 GMT",
+        }
+        for i in range(200)
+    ]
+
+    def allocated(build):
+        tracemalloc.start()
+        try:
+            records = build()  # noqa: F841
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    boxes = allocated(lambda: BoxList(devices, camel_killer_box=True))
+    models = allocated(lambda: [ZCCDevice(device) for device in devices])
+
+    assert models * 4 < boxes
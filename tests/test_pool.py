@@ -0,0 +1,124 @@
+import threading
+import time
+
+import pytest
+import responses
+
+from pyzscaler import TenantPool
+
+
+class FakeController:
+    built = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+        FakeController.built.append(self)
+
+    def __exit__(self, *exc):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reset_built():
+    FakeController.built = []
+
+
+def test_controllers_are_built_lazily_and_shared():
+    pool = TenantPool()
+    pool.add("a", FakeController, api_key="1")
+    pool.add("a-again", FakeController, api_key="1")
+    pool.add("b", FakeController, api_key="2")
+
+    assert FakeController.built == []
+    assert pool.get("a") is pool.get("a-again")
+    assert pool.get("b") is not pool.get("a")
+    assert len(FakeController.built) == 2
+    assert pool.get("a").kwargs == {"api_key": "1", "pool_maxsize": 4}
+
+    pool.close()
+    assert all(api.closed for api in FakeController.built)
+
+
+def test_least_recently_used_controller_is_closed():
+    pool = TenantPool(max_controllers=1)
+    pool.add("a", FakeController, api_key="1")
+    pool.add("b", FakeController, api_key="2")
+
+    first = pool.get("a")
+    pool.get("b")
+
+    assert first.closed
+    assert pool.get("a") is not first
+
+
+def test_leased_controller_is_closed_once_idle():
+    pool = TenantPool(max_controllers=1)
+    pool.add("a", FakeController, api_key="1")
+    pool.add("b", FakeController, api_key="2")
+    started, evicted = threading.Event(), threading.Event()
+    seen = {}
+
+    def use_a():
+        with pool.lease("a") as api:
+            started.set()
+            evicted.wait(5)
+            # Evicting the controller doesn't close it while this thread is still using it.
+            seen["closed_during_use"] = api.closed
+        seen["api"] = api
+
+    worker = threading.Thread(target=use_a)
+    worker.start()
+    started.wait(5)
+    other = threading.Thread(target=pool.get, args=("b",))
+    other.start()
+    other.join(5)
+    evicted.set()
+    worker.join(5)
+
+    assert seen["closed_during_use"] is False
+    assert seen["api"].closed
+    assert pool.get("a") is not seen["api"]
+
+
+def test_run_limits_concurrency_per_tenant():
+    pool = TenantPool(max_workers=8, per_tenant=2)
+    pool.add("a", FakeController, api_key="1")
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def work(api):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return api.kwargs["api_key"]
+
+    results = list(pool.run(work, tenants=["a"] * 6))
+
+    assert [item.result for item in results] == ["1"] * 6
+    assert peak[0] == 2
+    assert len(FakeController.built) == 1
+
+
+@responses.activate
+def test_map_fans_out_and_reports_errors():
+    for customer_id in ("1", "2"):
+        responses.add(
+            responses.POST, url="https://config.private.zscaler.com/signin", json={"access_token": "xyz"}, status=200
+        )
+        responses.add(
+            responses.GET,
+            url=f"https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/{customer_id}/application/1",
+            json={"id": customer_id},
+            status=200 if customer_id == "1" else 404,
+        )
+
+    with TenantPool() as pool:
+        pool.add("one", "ZPA", client_id="1", client_secret="yyy", customer_id="1")
+        pool.add("two", "zpa", client_id="1", client_secret="yyy", customer_id="2")
+        results = {item.tenant: item for item in pool.map("app_segments", "get_segment", "1")}
+
+    assert results["one"].result.id == "1"
+    assert results["two"].error is not None
@@ -1,5 +1,8 @@
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
 import toml
 
 import pyzscaler
@@ -15,3 +18,43 @@ def test_versions_are_in_sync():
     package_init_version = pyzscaler.__version__
 
     assert package_init_version == pyproject_version
+
+
+def loaded_modules(statement: str) -> set:
+    """Returns the modules that are loaded after running ``statement`` in a fresh interpreter."""
+    code = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    return set(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout.split())
+
+
+def test_import_is_lazy():
+    modules = loaded_modules("import pyzscaler")
+
+    assert "pyzscaler" in modules
+    assert not {"restfly", "box", "pyzscaler.zia", "pyzscaler.utils"} & modules
+
+
+def test_controller_import_skips_endpoint_modules():
+    modules = loaded_modules("from pyzscaler import ZIA")
+
+    assert "pyzscaler.zia" in modules
+    assert "pyzscaler.zia.locations" not in modules
+    assert "pyzscaler.zpa" not in modules
+
+
+def test_public_api_is_unchanged():
+    from pyzscaler.zia import ZIA
+    from pyzscaler.zia.locations import LocationsAPI
+    from pyzscaler.zpa import ZPA, AppSegmentsAPI
+
+    assert pyzscaler.ZIA is ZIA
+    assert pyzscaler.zia.LocationsAPI is LocationsAPI
+    assert pyzscaler.zpa.ZPA is ZPA
+    assert AppSegmentsAPI.__module__ == "pyzscaler.zpa.app_segments"
+    assert {"AsyncZIA", "TenantPool", "ZCC", "ZCON", "ZDX", "ZIA", "ZPA", "zia"} <= set(dir(pyzscaler))
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        pyzscaler.ZXX
+    with pytest.raises(AttributeError):
+        pyzscaler.zia.UnknownAPI
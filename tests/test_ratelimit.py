@@ -0,0 +1,300 @@
+import threading
+import time
+
+import pytest
+import requests
+import responses
+
+from pyzscaler import ratelimit
+from pyzscaler.ratelimit import (
+    AdaptiveRateLimiter,
+    RateLimiter,
+    RequestScheduler,
+    TokenBucket,
+    endpoint_family,
+    endpoint_path,
+    retry_after,
+)
+from pyzscaler.utils import mount_pool
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(name="clock")
+def fixture_clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ratelimit, "time", clock)
+    return clock
+
+
+@pytest.mark.parametrize(
+    "path,family",
+    [
+        ("users", "users"),
+        ("locations/1/sublocations", "locations"),
+        ("https://zsapi.zscaler.net/api/v1/users/bulkDelete", "users"),
+        ("https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/lssConfig", "lssConfig"),
+        ("https://config.private.zscaler.com/userconfig/v1/customers/1/scimgroup/idpId/1", "scimgroup"),
+        ("public/v1/getDevices", "getDevices"),
+        ("public/v1/downloadDevices", "downloadDevices"),
+        ("https://api-mobile.zscaler.net/papi/public/v1/getOtp?deviceId=1", "getOtp"),
+        ("https://api-mobile.zscaler.net/papi/auth/v1/login", "auth"),
+        ("", ""),
+    ],
+)
+def test_endpoint_family(path, family):
+    assert endpoint_family(path) == family
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("locations/lite", "locations/lite"),
+        ("https://zsapi.zscaler.net/api/v1/locations/1/sublocations", "locations/1/sublocations"),
+        ("https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/appConnectorGroup", "appConnectorGroup"),
+        ("https://api-mobile.zscaler.net/papi/public/v1/getDevices?page=1", "getDevices"),
+    ],
+)
+def test_endpoint_path(path, expected):
+    assert endpoint_path(path) == expected
+
+
+def test_token_bucket_only_blocks_when_empty(clock):
+    bucket = TokenBucket(rate=1, capacity=1)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 1
+    assert clock.slept == [1]
+
+    # Time spent elsewhere counts towards the next token.
+    clock.now += 0.75
+    assert bucket.acquire() == pytest.approx(0.25)
+
+
+def test_token_bucket_burst(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0, 0, 0]
+    assert bucket.acquire() == 0.5
+
+
+def test_rate_limiter_buckets_are_per_family(clock):
+    limiter = RateLimiter("ZIA", limits={"users": (10, 5)})
+
+    assert limiter.acquire("users") == 0
+    assert limiter.acquire("groups") == 0
+    assert limiter.acquire("groups") == 1
+    assert limiter.bucket("users").capacity == 5
+    assert limiter.bucket("users") is limiter.bucket("users")
+
+
+@pytest.mark.parametrize(
+    "status,headers,expected",
+    [
+        (429, {"Retry-After": "5"}, 5),
+        (200, {"Retry-After": "5"}, 0),
+        (200, {"RateLimit-Remaining": "0", "RateLimit-Reset": "3"}, 3),
+        (200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"}, 2),
+        (200, {"RateLimit-Remaining": "4", "RateLimit-Reset": "3"}, 0),
+        (429, {}, 0),
+        (429, {"Retry-After": "soon"}, 0),
+    ],
+)
+def test_retry_after(status, headers, expected):
+    assert retry_after(status, headers) == expected
+
+
+def test_retry_after_epoch_reset(monkeypatch):
+    monkeypatch.setattr(ratelimit.time, "time", lambda: 1700000000.0)
+
+    assert retry_after(200, {"RateLimit-Remaining": "0", "RateLimit-Reset": "1700000004"}) == 4
+
+
+def test_rate_limiter_pauses_on_retry_after(clock):
+    limiter = RateLimiter("ZIA")
+
+    assert limiter.acquire("users") == 0
+    clock.now += 1
+    limiter.update("users", 429, {"Retry-After": "5"})
+
+    assert limiter.acquire("users") == 5
+    # Other endpoint families are unaffected
+    assert limiter.acquire("groups") == 0
+
+
+def test_adaptive_rate_limiter_aimd(clock):
+    limiter = AdaptiveRateLimiter("ZPA", rate=2, max_rate=3, increase=0.5, decrease=0.5, min_rate=0.5)
+
+    for _ in range(4):
+        limiter.acquire("application")
+        limiter.update("application", 200, {})
+    assert limiter.rates == {"application": 3}
+
+    limiter.update("application", 429, {})
+    assert limiter.rates == {"application": 1.5}
+    for _ in range(3):
+        limiter.update("application", 429, {})
+    assert limiter.rates == {"application": 0.5}
+
+
+def test_adaptive_rate_limiter_only_grows_on_limited_requests(clock):
+    limiter = AdaptiveRateLimiter("ZIA", rate=1, increase=1)
+    limiter.acquire("users")
+
+    # Only one of these responses is for a request that drew a token.
+    for _ in range(5):
+        limiter.update("users/1", 200, {})
+
+    assert limiter.rates == {"users": 2}
+
+
+def test_response_hook_strips_base_url(clock):
+    class Response:
+        url = "https://api.zdxcloud.net/v1/devices?offset=10"
+        status_code = 429
+        headers = {"Retry-After": "2"}
+
+    limiter = AdaptiveRateLimiter("ZDX", rate=4, burst=4)
+    limiter.response_hook("https://api.zdxcloud.net/v1")(Response())
+
+    assert limiter.rates == {"devices": 2}
+    assert limiter.acquire("devices") == 2
+
+
+@responses.activate
+def test_limit_requests_draws_by_request_path():
+    base_url = "https://zsapi.zscaler.net/api/v1"
+    responses.add(responses.GET, f"{base_url}/locations/1", json={})
+    limiter = RateLimiter("ZIA")
+    acquired = []
+    limiter.acquire = lambda path, tokens=1.0: acquired.append(path) or 0
+    session = requests.Session()
+    mount_pool(session, admit=limiter.request_hook(base_url))
+
+    session.get(f"{base_url}/locations/1")
+    with limiter.limit_requests():
+        session.get(f"{base_url}/locations/1?page=2")
+
+    # Only requests sent within the context draw a token, from the family of their own path.
+    assert acquired == ["/locations/1"]
+
+
+def fixed_scheduler(rate, **kwargs):
+    return RequestScheduler("ZCC", rate=rate, burst=1, min_rate=rate, max_rate=rate, **kwargs)
+
+
+def wait_for_waiters(scheduler, count):
+    deadline = time.monotonic() + 5
+    while len(scheduler._waiters) < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_request_scheduler_serves_interactive_before_bulk():
+    scheduler = fixed_scheduler(5)
+    scheduler.acquire("public/v1/getDevices")
+    order = []
+
+    def call(name, priority):
+        scheduler.acquire("public/v1/getDevices", priority=priority)
+        order.append(name)
+
+    threads = [threading.Thread(target=call, args=(f"bulk{i}", "bulk")) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    wait_for_waiters(scheduler, 3)
+    threads.append(threading.Thread(target=call, args=("otp", "interactive")))
+    threads[-1].start()
+    for thread in threads:
+        thread.join()
+
+    assert order[0] == "otp"
+    assert sorted(order[1:]) == ["bulk0", "bulk1", "bulk2"]
+
+
+def test_request_scheduler_does_not_hold_up_other_families():
+    scheduler = fixed_scheduler(100)
+    scheduler.bucket("getDevices").pause(0.5)
+    waiting = threading.Thread(target=scheduler.acquire, args=("public/v1/getDevices",), kwargs={"priority": "interactive"})
+    waiting.start()
+    wait_for_waiters(scheduler, 1)
+
+    assert scheduler.acquire("otp", priority="bulk") < 0.1
+    waiting.join()
+
+
+def test_request_scheduler_tenant_budget():
+    scheduler = fixed_scheduler(100, tenant_rate=5)
+
+    assert scheduler.acquire("users") < 0.1
+    assert scheduler.acquire("groups") > 0.1
+
+
+def test_request_scheduler_priority_context():
+    scheduler = fixed_scheduler(100)
+
+    with pytest.raises(ValueError):
+        with scheduler.priority("urgent"):
+            pass
+    with scheduler.priority("interactive"):
+        assert scheduler._local.priority == "interactive"
+    assert scheduler._local.priority is None
+
+
+@responses.activate
+def test_request_scheduler_admits_every_request_once():
+    base_url = "https://api-mobile.zscaler.net/papi"
+    responses.add(responses.GET, f"{base_url}/public/v1/getDevices", json=[])
+    responses.add(responses.GET, f"{base_url}/public/v1/getOtp", json={})
+    scheduler = fixed_scheduler(100)
+    admitted = []
+    admit = scheduler._admit
+    scheduler._admit = lambda family, tokens, priority: admitted.append((family, priority)) or admit(family, tokens, priority)
+    session = requests.Session()
+    mount_pool(session, admit=scheduler.request_hook(base_url))
+
+    # Paginated calls take their token before the request, so it isn't scheduled twice.
+    scheduler.acquire("public/v1/getDevices")
+    session.get(f"{base_url}/public/v1/getDevices")
+    session.get(f"{base_url}/public/v1/getOtp?deviceId=1")
+    with scheduler.priority("interactive"):
+        session.get(f"{base_url}/public/v1/getOtp?deviceId=1")
+
+    assert admitted == [("getDevices", "bulk"), ("getOtp", "normal"), ("getOtp", "interactive")]
+
+
+@responses.activate
+def test_request_scheduler_ties_admission_to_request():
+    base_url = "https://api-mobile.zscaler.net/papi"
+    responses.add(responses.GET, f"{base_url}/public/v1/getDevices", status=503)
+    responses.add(responses.GET, f"{base_url}/public/v1/getDevices", json=[])
+    responses.add(responses.GET, f"{base_url}/public/v1/getOtp", json={})
+    scheduler = fixed_scheduler(100)
+    admitted = []
+    admit = scheduler._admit
+    scheduler._admit = lambda family, tokens, priority: admitted.append((family, priority)) or admit(family, tokens, priority)
+    session = requests.Session()
+    mount_pool(session, admit=scheduler.request_hook(base_url))
+    session.hooks["response"].append(scheduler.response_hook(base_url))
+
+    # A token taken for one endpoint family doesn't admit a request for another.
+    scheduler.acquire("public/v1/getDevices")
+    session.get(f"{base_url}/public/v1/getOtp?deviceId=1")
+    assert admitted == [("getDevices", "bulk"), ("getOtp", "normal")]
+
+    # A failed request is retried at its original priority rather than the thread's.
+    admitted.clear()
+    scheduler.acquire("public/v1/getDevices")
+    session.get(f"{base_url}/public/v1/getDevices")
+    session.get(f"{base_url}/public/v1/getDevices")
+    assert admitted == [("getDevices", "bulk"), ("getDevices", "bulk")]
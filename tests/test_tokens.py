@@ -0,0 +1,81 @@
+import base64
+import json
+import threading
+import time
+
+import requests
+import responses
+
+from pyzscaler.tokens import TokenManager, jwt_expiry
+from pyzscaler.zpa import ZPA
+
+
+def make_jwt(exp):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+def test_jwt_expiry():
+    assert jwt_expiry(make_jwt(1700000000)) == 1700000000
+    assert jwt_expiry("not-a-jwt") is None
+    assert jwt_expiry(None) is None
+
+
+def test_refresh_scheduled_before_expiry():
+    manager = TokenManager(requests.Session(), lambda: ("abc", 3600), margin=60)
+    manager.start()
+    try:
+        assert manager.session.headers["Authorization"] == "Bearer abc"
+        assert 3530 < manager.delay() <= 3540
+        assert manager._timer.daemon
+    finally:
+        manager.stop()
+    assert manager._timer is None
+
+
+def test_refresh_uses_jwt_exp_and_unknown_expiry():
+    manager = TokenManager(requests.Session(), lambda: (make_jwt(time.time() + 600), None))
+    manager.start()
+    manager.stop()
+    assert 530 < manager.delay() <= 540
+
+    manager = TokenManager(requests.Session(), lambda: ("opaque", None))
+    manager.start()
+    assert manager.delay() is None
+    assert manager._timer is None
+
+
+def test_concurrent_refresh_signs_in_once():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return f"token-{len(calls)}", None
+
+    manager = TokenManager(requests.Session(), fetch)
+    stale = manager.start()
+    threads = [threading.Thread(target=manager.refresh, kwargs={"stale": stale}) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 2
+    assert manager.token == "token-2"
+
+
+@responses.activate
+def test_zpa_refreshes_and_retries_on_401():
+    responses.add(responses.POST, url="https://config.private.zscaler.com/signin", json={"access_token": "old"}, status=200)
+    responses.add(responses.POST, url="https://config.private.zscaler.com/signin", json={"access_token": "new"}, status=200)
+    url = "https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/application/1"
+    responses.add(responses.GET, url=url, json={"message": "expired"}, status=401)
+    responses.add(responses.GET, url=url, json={"id": "1"}, status=200)
+
+    zpa = ZPA(client_id="1", client_secret="yyy", customer_id="1")
+    segment = zpa.app_segments.get_segment("1")
+
+    assert segment.id == "1"
+    assert responses.calls[-1].request.headers["Authorization"] == "Bearer new"
+    assert zpa._session.headers["Authorization"] == "Bearer new"
@@ -1,4 +1,30 @@
-from pyzscaler.utils import zdx_params
+import gzip
+import json
+import math
+
+import pytest
+import requests
+import responses
+from box import Box, BoxList
+
+from pyzscaler import utils
+from pyzscaler.models import ZCCDevice
+from pyzscaler.utils import (
+    ColumnTable,
+    Iterator,
+    JSONResponse,
+    JSONSession,
+    PoolAdapter,
+    SnakeView,
+    ZDXIterator,
+    collect,
+    convert_keys,
+    json_backends,
+    mount_pool,
+    set_json_backend,
+    sharded,
+    zdx_params,
+)
 
 
 def test_zdx_params():
@@ -16,3 +42,503 @@ def test_zdx_params():
     assert result["loc"] == "test_loc"
     assert result["dept"] == "test_dept"
     assert result["geo"] == "test_geo"
+
+
+class FakeLimiter:
+    def __init__(self):
+        self.acquired = []
+
+    def acquire(self, path, tokens=1):
+        self.acquired.append(path)
+        return 0
+
+
+class FakeAPI:
+    """Serves ``pages`` of records in the ZPA (``list``/``totalPages``) or ZIA (bare list) format."""
+
+    def __init__(self, pages, zpa=True):
+        self.pages = pages
+        self.zpa = zpa
+        self._env_base = "ZPA" if zpa else "ZIA"
+        self.requested = []
+        self.params = []
+        self.rate_limiter = FakeLimiter()
+        self.options = []
+
+    def get(self, path, params=None, **kwargs):
+        page = params["page"]
+        self.options.append(kwargs)
+        self.requested.append(page)
+        self.params.append(params)
+        records = self.pages[page - 1] if page <= len(self.pages) else []
+        if self.zpa:
+            return {"totalPages": str(len(self.pages)), "list": records}
+        return records
+
+
+def test_iterator_prefetch_zpa_returns_pages_in_order():
+    pages = [[{"id": i} for i in range(p * 10, p * 10 + 10)] for p in range(5)]
+    api = FakeAPI(pages)
+
+    records = list(Iterator(api, "application", prefetch=3, page_size=10))
+
+    assert [record["id"] for record in records] == list(range(50))
+    # totalPages is known so nothing is requested past the last page.
+    assert sorted(api.requested) == [1, 2, 3, 4, 5]
+
+
+def test_iterator_prefetch_zia_stops_at_empty_page():
+    pages = [[{"id": i} for i in range(p * 10, p * 10 + 10)] for p in range(3)]
+    api = FakeAPI(pages, zpa=False)
+
+    iterator = Iterator(api, "users", prefetch=1, page_size=10)
+    records = list(iterator)
+
+    assert [record["id"] for record in records] == list(range(30))
+    # ZIA doesn't report the number of pages, so a full last page is followed by one empty page.
+    assert api.requested == [1, 2, 3, 4]
+    assert iterator._executor is None
+
+
+def test_iterator_prefetch_zia_stops_at_short_page():
+    pages = [[{"id": i} for i in range(p * 10, p * 10 + 10)] for p in range(2)] + [[{"id": 20}]]
+    api = FakeAPI(pages, zpa=False)
+
+    records = list(Iterator(api, "users", prefetch=3, page_size=10))
+
+    assert [record["id"] for record in records] == list(range(21))
+    assert api.requested[:3] == [1, 2, 3]
+    # Page 4 may have been scheduled while page 2 was consumed, but nothing is scheduled after the short page.
+    assert max(api.requested) <= 4
+
+
+def test_iterator_prefetch_short_first_page():
+    api = FakeAPI([[{"id": 1}]], zpa=False)
+
+    iterator = Iterator(api, "users", prefetch=4)
+
+    assert list(iterator) == [{"id": 1}]
+    assert api.requested == [1]
+    assert iterator._executor is None
+
+
+def test_iterator_prefetch_respects_max_items():
+    pages = [[{"id": i} for i in range(p * 10, p * 10 + 10)] for p in range(5)]
+    api = FakeAPI(pages, zpa=False)
+
+    records = list(Iterator(api, "users", prefetch=4, page_size=10, max_items=25))
+
+    assert len(records) == 25
+    assert sorted(api.requested) == [1, 2, 3]
+
+
+def test_iterator_prefetch_respects_max_pages():
+    pages = [[{"id": i} for i in range(p * 10, p * 10 + 10)] for p in range(5)]
+    api = FakeAPI(pages)
+
+    records = list(Iterator(api, "application", prefetch=4, max_pages=2, page_size=10))
+
+    assert len(records) == 20
+    assert sorted(api.requested) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "zpa,path,kwargs,expected",
+    [
+        (True, "application", {}, {"pagesize": 500}),
+        (True, "connector", {}, {"pagesize": 500}),
+        (True, "application", {"page_size": 1000}, {"pagesize": 500}),
+        (True, "application", {"pagesize": 50}, {"pagesize": 50}),
+        (True, "application", {"page_size": 50}, {"pagesize": 50}),
+        (False, "users", {}, {"pageSize": 1000}),
+        (False, "users", {"page_size": 200}, {"pageSize": 200}),
+        (False, "users", {"max_items": 10}, {"pageSize": 10}),
+        (False, "users", {"page_size": 5000}, {"pageSize": 1000}),
+        (False, "locations/lite", {}, {}),
+        (False, "locations/1/sublocations", {}, {}),
+        (False, "region/search", {}, {}),
+    ],
+)
+def test_iterator_page_size(zpa, path, kwargs, expected):
+    api = FakeAPI([[{"id": 1}]], zpa=zpa)
+
+    list(Iterator(api, path, **kwargs))
+
+    params = {key: value for key, value in api.params[0].items() if key != "page"}
+    assert params == expected
+
+
+def test_iterator_resumes_from_cursor():
+    pages = [[{"id": i} for i in range(p * 10, p * 10 + 10)] for p in range(4)]
+    api = FakeAPI(pages)
+    get = api.get
+
+    def flaky_get(path, params=None):
+        if params["page"] == 3 and api.requested.count(3) == 0:
+            api.requested.append(3)
+            raise ConnectionError("transient failure")
+        return get(path, params=params)
+
+    api.get = flaky_get
+    iterator = Iterator(api, "application", search="app", page_size=10, stream=True)
+    seen = []
+    with pytest.raises(ConnectionError):
+        for record in iterator:
+            seen.append(record["id"])
+
+    cursor = json.loads(json.dumps(iterator.cursor))
+    assert cursor == {
+        "path": "application",
+        "params": {"search": "app", "pagesize": 10},
+        "page": 3,
+        "offset": 0,
+        "count": 20,
+    }
+
+    resumed = Iterator(api, "application", cursor=cursor)
+    assert seen + [record["id"] for record in resumed] == list(range(40))
+    assert resumed.count == 40
+
+
+def test_iterator_cursor_mid_page():
+    pages = [[{"id": i} for i in range(p * 10, p * 10 + 10)] for p in range(2)]
+    api = FakeAPI(pages, zpa=False)
+
+    iterator = Iterator(api, "users", page_size=10)
+    first = [next(iterator)["id"] for _ in range(13)]
+    cursor = iterator.cursor
+    assert (cursor["page"], cursor["offset"]) == (2, 3)
+
+    resumed = Iterator(api, "users", cursor=cursor)
+    assert first + [record["id"] for record in resumed] == list(range(20))
+
+    # A cursor taken from a resumed iterator accounts for the skipped records
+    resumed = Iterator(api, "users", cursor=cursor)
+    next(resumed)
+    assert (resumed.cursor["page"], resumed.cursor["offset"]) == (2, 4)
+
+
+def test_iterator_cursor_max_items_counts_resumed_records():
+    pages = [[{"id": i} for i in range(p * 10, p * 10 + 10)] for p in range(3)]
+    api = FakeAPI(pages, zpa=False)
+
+    iterator = Iterator(api, "users", page_size=10)
+    first = [next(iterator)["id"] for _ in range(13)]
+
+    # Only 7 records are left on page 2, so it doesn't reach max_items and page 3 is still requested.
+    resumed = Iterator(api, "users", cursor=iterator.cursor, max_items=22)
+    assert first + [record["id"] for record in resumed] == list(range(22))
+
+
+def test_iterator_cursor_path_mismatch():
+    with pytest.raises(ValueError):
+        Iterator(FakeAPI([]), "application", cursor={"path": "server", "params": {}, "page": 1, "offset": 0, "count": 0})
+
+
+def test_zdx_iterator_result_key():
+    class ZDXAPI:
+        rate_limiter = FakeLimiter()
+
+        def get(self, path, params=None):
+            return {"devices": [{"id": 1}, {"id": 2}], "next_offset": None}
+
+    api = ZDXAPI()
+
+    assert list(ZDXIterator(api, "devices", result_key="devices")) == [{"id": 1}, {"id": 2}]
+    assert api.rate_limiter.acquired == ["devices"]
+
+
+def test_iterator_cursor_params_must_match():
+    cursor = {"path": "application", "params": {"search": "app", "pagesize": 500}, "page": 2, "offset": 0, "count": 10}
+
+    # Repeating the original arguments is fine
+    Iterator(FakeAPI([]), "application", search="app", page_size=500, cursor=cursor)
+
+    with pytest.raises(ValueError):
+        Iterator(FakeAPI([]), "application", search="other", cursor=cursor)
+    with pytest.raises(ValueError):
+        Iterator(FakeAPI([]), "application", page_size=100, cursor=cursor)
+    with pytest.raises(ValueError):
+        Iterator(FakeAPI([]), "application", sort_by="name", cursor=cursor)
+
+
+def test_sharded_merges_and_deduplicates():
+    users = {"a": [{"id": 1, "name": "alice"}, {"id": 2, "name": "adam"}], "ad": [{"id": 2, "name": "adam"}], "b": []}
+    calls = []
+
+    def list_users(name=None, dept=None):
+        calls.append((name, dept))
+        return users[name] + [{"name": "no id"}]
+
+    result = sharded(list_users, [{"name": "a"}, {"name": "ad"}, {"name": "b"}], dept="IT")
+
+    assert isinstance(result, BoxList)
+    assert sorted(record.id for record in result if "id" in record) == [1, 2]
+    assert len([record for record in result if "id" not in record]) == 3
+    assert sorted(calls) == [("a", "IT"), ("ad", "IT"), ("b", "IT")]
+
+
+def test_sharded_stream_propagates_errors():
+    def list_users(name=None):
+        if name == "bad":
+            raise ConnectionError("shard failed")
+        return [{"id": name}]
+
+    records = sharded(list_users, [{"name": "bad"}, {"name": "good"}], stream=True)
+
+    assert not isinstance(records, BoxList)
+    with pytest.raises(ConnectionError):
+        list(records)
+
+
+def test_sharded_as_columns():
+    def list_users(name=None, raw=False):
+        assert raw is True
+        return {"a": [{"id": 1, "name": "alice"}, {"id": 2, "name": "adam"}], "ad": [{"id": 2, "name": "adam"}]}[name]
+
+    result = sharded(list_users, [{"name": "a"}, {"name": "ad"}], as_columns=True)
+
+    assert isinstance(result, ColumnTable)
+    assert sorted(result["id"]) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "zpa,pages,kwargs,requested",
+    [
+        # A short page is the last page
+        (False, [[{"id": 1}, {"id": 2}]], {"page_size": 10}, [1]),
+        # ZPA reports the total number of pages
+        (True, [[{"id": 1}], [{"id": 2}]], {"page_size": 1}, [1, 2]),
+        # The page that reaches max_items is the last page
+        (False, [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}]], {"page_size": 2, "max_items": 2}, [1]),
+        # A page shorter than an earlier page is the last page
+        (False, [[{"id": i} for i in range(150)], [{"id": 150}]], {"page_size": 1000}, [1, 2]),
+    ],
+)
+def test_iterator_final_page_skips_trailing_request(zpa, pages, kwargs, requested):
+    api = FakeAPI(pages, zpa=zpa)
+
+    list(Iterator(api, "users", **kwargs))
+
+    assert api.requested == requested
+    # No rate limiter token is drawn for a page that isn't requested
+    assert len(api.rate_limiter.acquired) == len(requested)
+
+
+def test_iterator_capped_page_size_doesnt_end_iteration():
+    # The API returns fewer records per page than requested, so a full capped page isn't taken as the last page.
+    pages = [[{"id": i} for i in range(p * 100, p * 100 + 100)] for p in range(3)]
+    api = FakeAPI(pages, zpa=False)
+
+    records = list(Iterator(api, "users", page_size=500))
+
+    assert len(records) == 300
+    assert api.requested == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("keep_alive", [True, False])
+def test_mount_pool(keep_alive):
+    session = requests.Session()
+
+    mount_pool(session, pool_connections=4, pool_maxsize=64, pool_block=True, keep_alive=keep_alive)
+
+    adapter = session.get_adapter("https://zsapi.zscaler.net/api/v1/users")
+    assert isinstance(adapter, PoolAdapter)
+    assert session.get_adapter("http://localhost") is adapter
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 64
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert adapter._pool_connections == 4
+    assert ("socket_options" in adapter.poolmanager.connection_pool_kw) is keep_alive
+    assert (session.headers.get("Connection") == "close") is not keep_alive
+
+
+@responses.activate
+@pytest.mark.parametrize(
+    "compress_requests,size,compressed", [(False, 5000, False), (True, 5000, True), (True, 100, False), (64, 100, True)]
+)
+def test_mount_pool_compresses_requests(compress_requests, size, compressed):
+    payload = {"urls": ["a" * size]}
+    responses.add(responses.PUT, "https://zsapi.zscaler.net/api/v1/urlCategories/1", json={})
+    session = requests.Session()
+    mount_pool(session, compress_requests=compress_requests)
+
+    session.put("https://zsapi.zscaler.net/api/v1/urlCategories/1", json=payload)
+
+    request = responses.calls[0].request
+    assert (request.headers.get("Content-Encoding") == "gzip") is compressed
+    body = gzip.decompress(request.body) if compressed else request.body
+    assert json.loads(body) == payload
+    assert int(request.headers["Content-Length"]) == len(request.body)
+
+
+@pytest.fixture(name="json_backend", params=[name for name, (loads, _) in json_backends.items() if loads is not None])
+def fixture_json_backend(request):
+    previous = utils.json_backend
+    yield set_json_backend(request.param)
+    set_json_backend(previous)
+
+
+@responses.activate
+def test_json_session(json_backend):
+    payload = {"name": "Finance ✓", "urls": ["example.com/a"], "id": 2**70}
+    responses.add(responses.POST, "https://zsapi.zscaler.net/api/v1/urlCategories", json={"id": 1, "big": 2**70})
+    session = JSONSession()
+
+    resp = session.post("https://zsapi.zscaler.net/api/v1/urlCategories", json=payload)
+
+    request = responses.calls[0].request
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.body) == payload
+    assert isinstance(resp, JSONResponse)
+    assert resp.json() == {"id": 1, "big": 2**70}
+
+
+@responses.activate
+def test_json_session_keeps_content_type(json_backend):
+    responses.add(responses.POST, "https://zsapi.zscaler.net/api/v1/users", json={})
+    session = JSONSession()
+    session.headers["Content-Type"] = "application/json; charset=utf-8"
+
+    session.post("https://zsapi.zscaler.net/api/v1/users", json={"name": "a"})
+
+    assert responses.calls[0].request.headers["Content-Type"] == "application/json; charset=utf-8"
+
+
+def test_json_response_falls_back(json_backend):
+    resp = JSONResponse()
+    resp._content = b'{"score": NaN}'
+    resp.encoding = "utf-8"
+    assert math.isnan(resp.json()["score"])
+
+    resp._content = b'{"score": '
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        resp.json()
+
+
+def test_set_json_backend():
+    assert utils.json_backend == next(name for name, (loads, _) in json_backends.items() if loads is not None)
+    with pytest.raises(ValueError):
+        set_json_backend("simdjson")
+
+
+def test_iterator_model():
+    api = FakeAPI([[{"udid": "a", "osVersion": "14"}, {"udid": "b"}]])
+
+    result = collect(Iterator(api, "devices", record_model=ZCCDevice, model=True))
+
+    assert type(result) is list
+    assert [type(device) for device in result] == [ZCCDevice, ZCCDevice]
+    assert result[0].os_version == "14"
+    assert api.options[0] == {"box": False, "conv_json": True}
+
+
+def test_iterator_model_without_default():
+    with pytest.raises(ValueError):
+        Iterator(FakeAPI([]), "devices", model=True)
+
+
+def test_column_table():
+    table = ColumnTable([{"id": 1, "osVersion": "14"}, {"id": 2, "userName": "alice"}])
+    table.extend([{"id": 3, "osVersion": "15", "userName": "bob"}])
+
+    assert table.num_rows == 3
+    assert list(table) == ["id", "os_version", "user_name"]
+    assert table["os_version"] == ["14", None, "15"]
+    assert table["userName"] == [None, "alice", "bob"]
+    assert table.to_dict()["id"] is table["id"]
+    assert repr(table) == "ColumnTable(columns=['id', 'os_version', 'user_name'], num_rows=3)"
+
+
+def test_column_table_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    table = ColumnTable([{"id": 1, "score": 90, "active": True, "name": "a"}, {"id": 2, "active": False, "name": "b"}])
+
+    arrays = table.to_numpy()
+
+    assert arrays["id"].dtype == numpy.int64
+    assert arrays["score"].dtype == numpy.float64 and numpy.isnan(arrays["score"][1])
+    assert arrays["active"].dtype == bool
+    assert arrays["name"].dtype == object
+
+
+def test_iterator_as_columns():
+    api = FakeAPI([[{"id": 1, "name": "a"}, {"id": 2}], [{"id": 3, "name": "c"}]])
+
+    result = collect(Iterator(api, "users", page_size=2, as_columns=True))
+
+    assert isinstance(result, ColumnTable)
+    assert result.to_dict() == {"id": [1, 2, 3], "name": ["a", None, "c"]}
+    assert api.options[0] == {"box": False, "conv_json": True}
+
+
+@pytest.mark.parametrize("kwargs", [{"stream": True}, {"model": ZCCDevice}])
+def test_iterator_as_columns_conflicts(kwargs):
+    with pytest.raises(ValueError):
+        collect(Iterator(FakeAPI([]), "devices", as_columns=True, **kwargs))
+
+
+def test_snake_view():
+    record = {"id": 1, "surrogateIP": True, "ipAddresses": ["203.0.113.1"], "vpnCredentials": [{"fqdn": "a.example.com"}]}
+    view = SnakeView(record)
+
+    assert view.surrogate_ip is True
+    assert view["ip_addresses"] == ["203.0.113.1"]
+    assert view.vpn_credentials[0].fqdn == "a.example.com"
+    assert list(view) == ["id", "surrogate_ip", "ip_addresses", "vpn_credentials"]
+    assert len(view) == 4
+    assert view.get("missing") is None
+    with pytest.raises(AttributeError):
+        view.missing
+
+
+def test_iterator_raw():
+    api = FakeAPI([[{"userName": "a"}]])
+    api.raw = True
+
+    records = collect(Iterator(api, "application"))
+
+    assert type(records) is list
+    assert records == [{"userName": "a"}]
+    assert api.options[0] == {"box": False, "conv_json": True}
+    assert type(collect(Iterator(api, "application", raw=False))) is BoxList
+
+
+def test_convert_keys_rebuilds_boxes():
+    record = Box(
+        {"adminUser": True, "department": {"id": 1}, "groups": [{"id": 2, "isNonEditable": False}]}, camel_killer_box=True
+    )
+
+    payload = convert_keys(record)
+
+    assert payload == {"adminUser": True, "department": {"id": 1}, "groups": [{"id": 2, "isNonEditable": False}]}
+    assert type(payload) is dict
+    assert type(payload["department"]) is dict
+    assert type(payload["groups"]) is list
+
+
+def test_convert_keys_copies_the_payload():
+    payload = {"app_connector_groups": [{"id": 1}], "server": {"name": "a", "ip_addresses": ["203.0.113.1"]}}
+
+    converted = convert_keys(payload)
+
+    assert converted == {"appConnectorGroups": [{"id": 1}], "server": {"name": "a", "ipAddresses": ["203.0.113.1"]}}
+    assert convert_keys(converted, "to_snake") == payload
+
+    # Keys that are already camelCase are copied too, so modifying the result leaves the input as it was.
+    record = {"id": 1, "tags": ["a"]}
+    copied = convert_keys(record)
+    copied.update(name="b")
+    copied["tags"].append("b")
+    assert record == {"id": 1, "tags": ["a"]}
+
+
+def test_convert_keys_deeply_nested():
+    payload = leaf = {}
+    for _ in range(5000):
+        leaf["child_node"] = {}
+        leaf = leaf["child_node"]
+
+    converted = convert_keys(payload)
+    for _ in range(5000):
+        converted = converted["childNode"]
+    assert converted == {}
@@ -1,7 +1,10 @@
+import gzip
+
 import pytest
 import responses
 from box import BoxList
 
+from pyzscaler.utils import ColumnTable
 from tests.conftest import stub_sleep
 
 
@@ -29,3 +32,64 @@ def test_list_devices(devices, zcc):
 
     assert isinstance(resp, BoxList)
     assert resp[0].id == 1
+
+
+@responses.activate
+@pytest.mark.parametrize("force,path", [(False, "removeDevices"), (True, "forceRemoveDevices")])
+def test_remove_devices(zcc, force, path):
+    acquired = []
+    zcc.rate_limiter.acquire = lambda family, tokens=1.0: acquired.append(family) or 0
+    responses.add(
+        method="POST",
+        url=f"https://api-mobile.zscaler.net/papi/public/v1/{path}",
+        json={"devicesRemoved": 2},
+        status=200,
+        match=[responses.matchers.json_params_matcher({"udids": ["99999", "88888"]})],
+    )
+    resp = zcc.devices.remove_devices(force=force, udids=["99999", "88888"])
+
+    assert resp.devices_removed == 2
+    assert acquired == [f"public/v1/{path}"]
+
+
+@responses.activate
+def test_download_devices_decompresses_gzip(zcc, tmp_path):
+    devices_csv = "User,Device type,Device model\n" + "test@example.com,Windows,VMware\n" * 500
+    responses.add(
+        method="GET",
+        url="https://api-mobile.zscaler.net/papi/public/v1/downloadDevices",
+        body=gzip.compress(devices_csv.encode()),
+        headers={"Content-Encoding": "gzip"},
+        content_type="application/octet-stream",
+        status=200,
+    )
+    filename = str(tmp_path / "devices.csv")
+
+    assert zcc.devices.download_devices(filename=filename, os_types=["windows"]) == filename
+    with open(filename) as f:
+        assert f.read() == devices_csv
+
+
+@responses.activate
+@stub_sleep
+def test_list_devices_as_columns(devices, zcc):
+    responses.add(
+        method="GET",
+        url="https://api-mobile.zscaler.net/papi/public/v1/getDevices",
+        json=devices,
+        status=200,
+        # as_columns isn't sent as a query parameter
+        match=[responses.matchers.query_string_matcher("page=1")],
+    )
+    responses.add(
+        method="GET",
+        url="https://api-mobile.zscaler.net/papi/public/v1/getDevices",
+        json=[],
+        status=200,
+        match=[responses.matchers.query_string_matcher("page=2")],
+    )
+
+    resp = zcc.devices.list_devices(as_columns=True)
+
+    assert isinstance(resp, ColumnTable)
+    assert resp["id"] == [1, 2]
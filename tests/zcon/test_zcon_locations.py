@@ -82,7 +82,11 @@ def test_list_locations(zcon, location_list):
         status=200,
     )
 
+    acquired = []
+    zcon.rate_limiter.acquire = lambda family, tokens=1.0: acquired.append(family) or 0
+
     resp = zcon.locations.list_locations()
+    assert acquired == ["location"]
     assert isinstance(resp, BoxList)
     assert len(resp) == 2
     assert resp[0]["id"] == 10000001
@@ -1,5 +1,8 @@
 import responses
 from box import Box, BoxList
+from responses import matchers
+
+from pyzscaler.models import ZDXDevice
 
 
 @responses.activate
@@ -11,12 +14,85 @@ def test_list_devices(zdx):
         ],
         "next_offset": "67677666",
     }
-    responses.add(responses.GET, url, json=mock_response, status=200)
+    responses.add(responses.GET, url, json=mock_response, status=200, match=[matchers.query_param_matcher({})])
+    responses.add(
+        responses.GET,
+        url,
+        json={"devices": [{"id": 40176155, "name": "LAPTOP-2", "userid": 76676624}], "next_offset": None},
+        status=200,
+        match=[matchers.query_param_matcher({"offset": "67677666"})],
+    )
 
     result = zdx.devices.list_devices()
 
-    assert isinstance(result, Box)
-    assert result.devices[0].id == mock_response["devices"][0]["id"]
+    assert isinstance(result, BoxList)
+    assert len(result) == 2
+    assert result[0].id == mock_response["devices"][0]["id"]
+    assert result[1].id == 40176155
+
+
+@responses.activate
+def test_list_devices_sends_filters_on_first_page(zdx):
+    url = "https://api.zdxcloud.net/v1/devices"
+    responses.add(
+        responses.GET,
+        url,
+        json={"devices": [{"id": 1}], "next_offset": None},
+        status=200,
+        match=[matchers.query_param_matcher({"loc": "99", "q": "laptop"})],
+    )
+
+    result = zdx.devices.list_devices(location_id="99", search="laptop")
+
+    assert [device.id for device in result] == [1]
+
+
+@responses.activate
+def test_list_devices_repeated_offset(zdx):
+    url = "https://api.zdxcloud.net/v1/devices"
+    responses.add(responses.GET, url, json={"devices": [{"id": 1}], "next_offset": "1"}, status=200)
+
+    result = zdx.devices.list_devices()
+
+    # The API handing back the offset that was just requested must not loop forever
+    assert [device.id for device in result] == [1, 1]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_list_devices_max_pages(zdx):
+    url = "https://api.zdxcloud.net/v1/devices"
+    for offset, next_offset in ((None, "1"), ("1", "2"), ("2", None)):
+        responses.add(
+            responses.GET,
+            url,
+            json={"devices": [{"id": offset or "0"}], "next_offset": next_offset},
+            status=200,
+            match=[matchers.query_param_matcher({"offset": offset} if offset else {})],
+        )
+
+    result = zdx.devices.list_devices(max_pages=2)
+
+    assert [device.id for device in result] == ["0", "1"]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_list_devices_prefetch(zdx):
+    url = "https://api.zdxcloud.net/v1/devices"
+    for offset, next_offset in ((None, "1"), ("1", "2"), ("2", None)):
+        responses.add(
+            responses.GET,
+            url,
+            json={"devices": [{"id": offset or "0"}], "next_offset": next_offset},
+            status=200,
+            match=[matchers.query_param_matcher({"offset": offset} if offset else {})],
+        )
+
+    result = zdx.devices.list_devices(prefetch=True, stream=True)
+
+    assert [device.id for device in result] == ["0", "1", "2"]
+    assert len(responses.calls) == 3
 
 
 @responses.activate
@@ -467,3 +543,41 @@ def test_get_deeptrace_top_processes(zdx):
 
     assert isinstance(result, Box)
     assert result == Box(mock_response)
+
+
+@responses.activate
+def test_list_devices_model(zdx):
+    responses.add(
+        responses.GET,
+        "https://api.zdxcloud.net/v1/devices",
+        json={"devices": [{"id": 1, "name": "LAPTOP-1", "userid": 2, "geo_loc": [{"city": "Sydney"}]}], "next_offset": None},
+        status=200,
+    )
+
+    result = zdx.devices.list_devices(model=True)
+
+    assert type(result[0]) is ZDXDevice
+    assert result[0].geo_loc[0].city == "Sydney"
+
+
+@responses.activate
+def test_list_devices_as_columns(zdx):
+    url = "https://api.zdxcloud.net/v1/devices"
+    responses.add(
+        responses.GET,
+        url,
+        json={"devices": [{"id": 1, "name": "LAPTOP-1", "userid": 2}], "next_offset": "1"},
+        status=200,
+        match=[matchers.query_param_matcher({})],
+    )
+    responses.add(
+        responses.GET,
+        url,
+        json={"devices": [{"id": 3, "name": "LAPTOP-3"}], "next_offset": None},
+        status=200,
+        match=[matchers.query_param_matcher({"offset": "1"})],
+    )
+
+    result = zdx.devices.list_devices(as_columns=True)
+
+    assert result.to_dict() == {"id": [1, 3], "name": ["LAPTOP-1", "LAPTOP-3"], "userid": [2, None]}
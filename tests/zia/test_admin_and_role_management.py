@@ -133,14 +133,14 @@ def test_admin_users_update_user(zia, admin_users):
 
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/adminUsers?page=1",
+        url="https://zsapi.zscaler.net/api/v1/adminUsers?pageSize=1000&page=1",
         json=admin_users,
         status=200,
     )
 
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/adminUsers?page=2",
+        url="https://zsapi.zscaler.net/api/v1/adminUsers?pageSize=1000&page=2",
         json=[],
         status=200,
     )
@@ -263,13 +263,13 @@ def test_list_admin_users_with_max_items_150(zia, paginated_items):
 def test_admin_users_get_user(admin_users, zia):
     responses.add(
         method="GET",
-        url="https://zsapi.zscaler.net/api/v1/adminUsers?page=1",
+        url="https://zsapi.zscaler.net/api/v1/adminUsers?pageSize=1000&page=1",
         json=admin_users,
         status=200,
     )
     responses.add(
         method="GET",
-        url="https://zsapi.zscaler.net/api/v1/adminUsers?page=2",
+        url="https://zsapi.zscaler.net/api/v1/adminUsers?pageSize=1000&page=2",
         json=[],
         status=200,
     )
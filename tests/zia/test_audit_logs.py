@@ -1,3 +1,5 @@
+import gzip
+
 import responses
 from box import Box
 
@@ -69,3 +71,21 @@ def test_audit_log_get_report(zia):
     resp = zia.audit_logs.get_report()
     assert isinstance(resp, str)
     assert resp == audit_report
+
+
+@responses.activate
+def test_audit_log_get_report_to_file(zia, tmp_path):
+    audit_report = "Time,User,Action\n" * 1000
+    responses.add(
+        method="GET",
+        url="https://zsapi.zscaler.net/api/v1/auditlogEntryReport/download",
+        body=gzip.compress(audit_report.encode()),
+        headers={"Content-Encoding": "gzip"},
+        content_type="text/csv",
+        status=200,
+    )
+    filename = str(tmp_path / "audit_log.csv")
+
+    assert zia.audit_logs.get_report(filename=filename) == filename
+    with open(filename) as f:
+        assert f.read() == audit_report
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 import responses
 from box import BoxList
@@ -77,11 +79,14 @@ def test_export_shadow_it_csv_with_id_filters(zia, shadow_it_report):
 
     # Assertions
     assert isinstance(resp, str)
-    assert (
-        responses.calls[0].request.body.decode("utf-8")
-        == '{"application": "test_app", "duration": "LAST_7_DAYS", "users": [{"id": "123"}, {"id": "456"}], '
-        '"locations": [{"id": "789"}, {"id": "101"}], "departments": [{"id": "112"}, {"id": "113"}]}'
-    )
+    # The body is compact when a faster JSON backend is installed, so compare the decoded document.
+    assert json.loads(responses.calls[0].request.body) == {
+        "application": "test_app",
+        "duration": "LAST_7_DAYS",
+        "users": [{"id": "123"}, {"id": "456"}],
+        "locations": [{"id": "789"}, {"id": "101"}],
+        "departments": [{"id": "112"}, {"id": "113"}],
+    }
 
 
 @responses.activate
@@ -206,13 +206,13 @@ def test_get_location_by_name_and_id(zia):
 def test_get_location_by_name(zia, locations):
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/locations?search=Test+B&page=1",
+        url="https://zsapi.zscaler.net/api/v1/locations?search=Test+B&pageSize=1000&page=1",
         json=locations,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/locations?search=Test+B&page=2",
+        url="https://zsapi.zscaler.net/api/v1/locations?search=Test+B&pageSize=1000&page=2",
         json=[],
         status=200,
     )
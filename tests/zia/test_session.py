@@ -1,5 +1,9 @@
 import responses
 
+from pyzscaler.ratelimit import RateLimiter
+from pyzscaler.utils import JSONSession
+from pyzscaler.zia import ZIA
+
 
 @responses.activate
 def test_create(zia, session):
@@ -51,3 +55,32 @@ def test_delete(zia):
 
     assert isinstance(resp, int)
     assert resp == 200
+
+
+@responses.activate
+def test_pool_options(session):
+    responses.add(responses.POST, url="https://zsapi.zscaler.net/api/v1/authenticatedSession", json=session, status=200)
+
+    zia = ZIA(
+        username="test@example.com",
+        password="hunter2",
+        cloud="zscaler",
+        api_key="123456789abcdef",
+        pool_maxsize=100,
+        pool_block=True,
+        compress_requests=True,
+    )
+
+    adapter = zia._session.get_adapter("https://zsapi.zscaler.net/api/v1/users")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 100
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert adapter.compress_min_size == 1024
+
+
+def test_json_session(zia):
+    assert isinstance(zia._session, JSONSession)
+
+
+def test_default_rate_limiter(zia):
+    # Adaptive rate limiting is opt-in, so the default is a fixed rate per endpoint family.
+    assert type(zia.rate_limiter) is RateLimiter
@@ -228,13 +228,13 @@ def fixture_ipv64_prefixes():
 def test_list_gre_tunnels(zia, gre_tunnels):
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/greTunnels?page=1",
+        url="https://zsapi.zscaler.net/api/v1/greTunnels?pageSize=1000&page=1",
         json=gre_tunnels,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/greTunnels?page=2",
+        url="https://zsapi.zscaler.net/api/v1/greTunnels?pageSize=1000&page=2",
         json=[],
         status=200,
     )
@@ -311,13 +311,13 @@ def test_add_gre_tunnel_with_params(zia, gre_tunnels, recommended_vips):
 def test_list_static_ips(zia, static_ips):
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/staticIP?ipAddress=203.0.113.0&page=1",
+        url="https://zsapi.zscaler.net/api/v1/staticIP?ipAddress=203.0.113.0&pageSize=1000&page=1",
         json=static_ips,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/staticIP?ipAddress=203.0.113.0&page=2",
+        url="https://zsapi.zscaler.net/api/v1/staticIP?ipAddress=203.0.113.0&pageSize=1000&page=2",
         json=[],
         status=200,
     )
@@ -439,13 +439,13 @@ def test_get_closest_diverse_vip_ids(zia, recommended_vips):
 def test_list_vpn_credentials(zia, vpn_credentials):
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/vpnCredentials?page=1",
+        url="https://zsapi.zscaler.net/api/v1/vpnCredentials?pageSize=1000&page=1",
         json=vpn_credentials,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/vpnCredentials?page=2",
+        url="https://zsapi.zscaler.net/api/v1/vpnCredentials?pageSize=1000&page=2",
         json=[],
         status=200,
     )
@@ -500,13 +500,13 @@ def test_get_vpn_credential_by_id(zia, vpn_credentials):
 def test_get_vpn_credential_by_fqdn(zia, vpn_credentials):
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/vpnCredentials?search=test@example.com&page=1",
+        url="https://zsapi.zscaler.net/api/v1/vpnCredentials?search=test@example.com&pageSize=1000&page=1",
         json=[vpn_credentials[1]],
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/vpnCredentials?search=test@example.com&page=2",
+        url="https://zsapi.zscaler.net/api/v1/vpnCredentials?search=test@example.com&pageSize=1000&page=2",
         json=[],
         status=200,
     )
@@ -567,13 +567,13 @@ def test_delete_vpn_credential(zia):
 def test_list_vips(zia, vips):
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/vips?page=1",
+        url="https://zsapi.zscaler.net/api/v1/vips?pageSize=1000&page=1",
         json=vips,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/vips?page=2",
+        url="https://zsapi.zscaler.net/api/v1/vips?pageSize=1000&page=2",
         json=[],
         status=200,
     )
@@ -603,13 +603,13 @@ def test_list_dns64_prefixes(zia, ipv6_prefixes):
 def test_list_nat64_prefixes(zia, ipv6_prefixes):
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/ipv6config/nat64prefix?page=1",
+        url="https://zsapi.zscaler.net/api/v1/ipv6config/nat64prefix?pageSize=1000&page=1",
         json=ipv6_prefixes,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://zsapi.zscaler.net/api/v1/ipv6config/nat64prefix?page=2",
+        url="https://zsapi.zscaler.net/api/v1/ipv6config/nat64prefix?pageSize=1000&page=2",
         json=[],
         status=200,
     )
@@ -634,3 +634,28 @@ def test_list_gre_ip_addresses(zia):
     resp = zia.traffic.list_gre_ip_addresses()
     assert isinstance(resp, BoxList)
     assert len(resp) == 2
+
+
+@responses.activate
+def test_get_ipv6_config_keeps_endpoint_box_attrs(zia):
+    responses.add(
+        responses.GET,
+        url="https://zsapi.zscaler.net/api/v1/ipv6config",
+        json={"ipV6Enabled": True},
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        url="https://zsapi.zscaler.net/api/v1/greTunnels/1",
+        json={"id": 1, "sourceIp": "203.0.113.1"},
+        status=200,
+    )
+
+    # Endpoint interfaces are cached on the controller
+    assert zia.traffic is zia.traffic
+
+    zia.traffic.get_ipv6_config()
+    resp = zia.traffic.get_gre_tunnel("1")
+
+    # The edge-case conversion used for the IPv6 config must not leak into later calls on the cached endpoint
+    assert resp.source_ip == "203.0.113.1"
@@ -5,6 +5,8 @@ import responses
 from box import Box
 from responses import matchers
 
+from pyzscaler.models import ZIAUser
+from pyzscaler.utils import ColumnTable
 from tests.conftest import stub_sleep
 
 
@@ -105,13 +107,13 @@ def test_users_get_user_by_id(users, zia):
 def test_users_get_user_by_email(users, zia):
     responses.add(
         method="GET",
-        url="https://zsapi.zscaler.net/api/v1/users?search=testuserb@example.com&page=1",
+        url="https://zsapi.zscaler.net/api/v1/users?search=testuserb@example.com&pageSize=1000&page=1",
         json=[users[1]],
         status=200,
     )
     responses.add(
         method="GET",
-        url="https://zsapi.zscaler.net/api/v1/users?search=testuserb@example.com&page=2",
+        url="https://zsapi.zscaler.net/api/v1/users?search=testuserb@example.com&pageSize=1000&page=2",
         json=[],
         status=200,
     )
@@ -205,6 +207,34 @@ def test_list_users_with_two_pages(zia, paginated_items):
     assert len(resp) == 200
 
 
+@responses.activate
+@stub_sleep
+def test_list_users_stream(zia, paginated_items):
+    items = paginated_items(200)
+
+    responses.add(
+        responses.GET,
+        url="https://zsapi.zscaler.net/api/v1/users",
+        json=items[0:100],
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        url="https://zsapi.zscaler.net/api/v1/users",
+        json=items[100:200],
+        status=200,
+    )
+
+    resp = zia.users.list_users(max_pages=2, page_size=100, stream=True)
+
+    assert not isinstance(resp, list)
+    assert next(resp).id == 0
+    # Only the first page has been requested so far
+    assert len(responses.calls) == 1
+    assert [user.id for user in resp] == list(range(1, 200))
+    assert "stream" not in responses.calls[0].request.url
+
+
 @responses.activate
 @stub_sleep
 def test_list_users_with_max_items_1(zia, paginated_items):
@@ -501,3 +531,50 @@ def test_users_bulk_delete_users(zia):
     resp = zia.users.bulk_delete_users(["1", "2"])
     assert isinstance(resp, dict)
     assert resp.ids == ["1", "2"]
+
+
+@responses.activate
+@stub_sleep
+def test_list_users_raw(zia, users):
+    responses.add(responses.GET, url="https://zsapi.zscaler.net/api/v1/users", json=users, status=200)
+
+    resp = zia.users.list_users(raw=True)
+
+    assert type(resp) is list
+    assert type(resp[0]) is dict
+    assert resp[0]["adminUser"] is False
+    assert resp == users
+
+
+@responses.activate
+@stub_sleep
+def test_list_users_raw_controller(zia, users):
+    responses.add(responses.GET, url="https://zsapi.zscaler.net/api/v1/users", json=users, status=200)
+    zia.raw = True
+
+    assert [type(user) for user in zia.users.list_users(stream=True)] == [dict, dict]
+    assert isinstance(zia.users.list_users(raw=False)[0], Box)
+
+
+@responses.activate
+@stub_sleep
+def test_list_users_model(zia, users):
+    responses.add(responses.GET, url="https://zsapi.zscaler.net/api/v1/users", json=users, status=200)
+
+    resp = zia.users.list_users(model=True)
+
+    assert [type(user) for user in resp] == [ZIAUser, ZIAUser]
+    assert resp[1].admin_user is True
+    assert resp[0].department.name == "test_department"
+
+
+@responses.activate
+@stub_sleep
+def test_list_users_as_columns(zia, users):
+    responses.add(responses.GET, url="https://zsapi.zscaler.net/api/v1/users", json=users, status=200)
+
+    resp = zia.users.list_users(as_columns=True)
+
+    assert isinstance(resp, ColumnTable)
+    assert resp["admin_user"] == [False, True]
+    assert resp["comments"] == ["Test", None]
@@ -88,13 +88,13 @@ def fixture_app_segments():
 def test_list_segments(zpa, app_segments):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/application?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/application?pagesize=500&page=1",
         json=app_segments,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/application?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/application?pagesize=500&page=2",
         json=[],
         status=200,
     )
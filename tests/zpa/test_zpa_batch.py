@@ -0,0 +1,46 @@
+import pytest
+import responses
+from box import Box
+
+from pyzscaler.batch import BatchResult
+from pyzscaler.ratelimit import endpoint_family
+
+
+@responses.activate
+def test_get_many(zpa):
+    acquired = []
+    zpa.rate_limiter.acquire = lambda path, tokens=1.0: acquired.append(path) or 0
+    for segment_id in ("1", "2", "3"):
+        responses.add(
+            responses.GET,
+            url=f"https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/application/{segment_id}",
+            json={"id": segment_id},
+            status=200,
+        )
+    responses.add(
+        responses.GET,
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/application/4",
+        json={"message": "not found"},
+        status=404,
+    )
+
+    results = {item.id: item for item in zpa.batch.get_many("app_segments", ["1", "2", "3", "4"], workers=2)}
+
+    assert all(isinstance(item, BatchResult) for item in results.values())
+    assert [results[segment_id].result.id for segment_id in ("1", "2", "3")] == ["1", "2", "3"]
+    assert isinstance(results["1"].result, Box)
+    # A failed call is reported without aborting the batch
+    assert results["4"].result is None
+    assert results["4"].error is not None
+    # Every request draws from the rate limiter bucket for its own path
+    assert sorted(acquired) == [f"/mgmtconfig/v1/admin/customers/1/application/{i}" for i in range(1, 5)]
+    assert {endpoint_family(path) for path in acquired} == {"application"}
+
+
+def test_get_many_requires_method_when_ambiguous(zpa):
+    with pytest.raises(ValueError):
+        list(zpa.batch.get_many("connectors", ["1"]))
+
+
+def test_get_many_no_ids(zpa):
+    assert list(zpa.batch.get_many("app_segments", [])) == []
@@ -17,13 +17,13 @@ def fixture_certificates():
 def test_list_browser_access(zpa, certificates):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/clientlessCertificate/issued?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/clientlessCertificate/issued?pagesize=500&page=1",  # noqa: E501
         json=certificates,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/clientlessCertificate/issued?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/clientlessCertificate/issued?pagesize=500&page=2",  # noqa: E501
         json=[],
         status=200,
     )
@@ -51,13 +51,13 @@ def test_get_browser_access(zpa, certificates):
 def test_list_enrolment(zpa, certificates):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/enrollmentCert?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/enrollmentCert?pagesize=500&page=1",
         json=certificates,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/enrollmentCert?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/enrollmentCert?pagesize=500&page=2",
         json=[],
         status=200,
     )
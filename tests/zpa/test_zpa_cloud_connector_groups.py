@@ -17,13 +17,13 @@ def fixture_cloud_connector_groups():
 def test_list_cloud_connector_groups(zpa, cloud_connector_groups):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/cloudConnectorGroup?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/cloudConnectorGroup?pagesize=500&page=1",
         json=cloud_connector_groups,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/cloudConnectorGroup?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/cloudConnectorGroup?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -216,13 +216,13 @@ def fixture_app_connector_groups():
 def test_list_connectors(zpa, app_connectors):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/connector?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/connector?pagesize=500&page=1",
         json=app_connectors,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/connector?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/connector?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -302,13 +302,13 @@ def test_bulk_delete_connectors(zpa):
 def test_list_connector_groups(zpa, app_connector_groups):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/appConnectorGroup?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/appConnectorGroup?pagesize=500&page=1",
         json=app_connector_groups,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/appConnectorGroup?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/appConnectorGroup?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -61,13 +61,13 @@ def fixture_idps():
 def test_list_idps(zpa, idps):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/idp?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/idp?pagesize=500&page=1",
         json=idps,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/idp?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/idp?pagesize=500&page=2",
         json=[],
         status=200,
     )
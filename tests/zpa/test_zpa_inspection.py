@@ -218,13 +218,13 @@ def test_list_custom_http_methods(zpa):
 def test_list_custom_controls(zpa, custom_controls):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionControls/custom?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionControls/custom?pagesize=500&page=1",
         json=custom_controls,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionControls/custom?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionControls/custom?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -238,16 +238,16 @@ def test_list_custom_controls(zpa, custom_controls):
 def test_list_custom_controls_params(zpa, custom_controls):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionControls/custom?search=test&sortdir=DESC&page=1",  # noqa: E501
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionControls/custom?search=test&sortdir=DESC&pagesize=500&page=1",  # noqa: E501
         json=custom_controls,
-        match=[matchers.query_param_matcher({"search": "test", "sortdir": "DESC", "page": "1"})],
+        match=[matchers.query_param_matcher({"search": "test", "sortdir": "DESC", "pagesize": "500", "page": "1"})],
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionControls/custom?search=test&sortdir=DESC&page=2",  # noqa: E501
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionControls/custom?search=test&sortdir=DESC&pagesize=500&page=2",  # noqa: E501
         json=[],
-        match=[matchers.query_param_matcher({"search": "test", "sortdir": "DESC", "page": "2"})],
+        match=[matchers.query_param_matcher({"search": "test", "sortdir": "DESC", "pagesize": "500", "page": "2"})],
         status=200,
     )
     resp = zpa.inspection.list_custom_controls(search="test", sortdir="DESC")
@@ -446,13 +446,13 @@ def test_get_predef_control(zpa, predefined_controls):
 def test_list_profiles(zpa, inspection_profiles):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionProfile?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionProfile?pagesize=500&page=1",
         json=inspection_profiles,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionProfile?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionProfile?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -466,16 +466,16 @@ def test_list_profiles(zpa, inspection_profiles):
 def test_list_profiles_params(zpa, inspection_profiles):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionProfile?search=test&page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionProfile?search=test&pagesize=500&page=1",  # noqa: E501
         json=inspection_profiles,
-        match=[matchers.query_param_matcher({"search": "test", "page": "1"})],
+        match=[matchers.query_param_matcher({"search": "test", "pagesize": "500", "page": "1"})],
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionProfile?search=test&page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/inspectionProfile?search=test&pagesize=500&page=2",  # noqa: E501
         json=[],
-        match=[matchers.query_param_matcher({"search": "test", "page": "2"})],
+        match=[matchers.query_param_matcher({"search": "test", "pagesize": "500", "page": "2"})],
         status=200,
     )
     resp = zpa.inspection.list_profiles(search="test")
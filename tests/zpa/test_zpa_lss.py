@@ -95,13 +95,13 @@ def fixture_lss_status_codes():
 def test_list_lss_configs(zpa, lss_config):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/lssConfig?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/lssConfig?pagesize=500&page=1",
         json=lss_config,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/lssConfig?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/lssConfig?pagesize=500&page=2",
         json=[],
         status=200,
     )
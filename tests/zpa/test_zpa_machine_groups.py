@@ -17,13 +17,13 @@ def fixture_machine_groups():
 def test_list_idps(zpa, machine_groups):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/machineGroup?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/machineGroup?pagesize=500&page=1",
         json=machine_groups,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/machineGroup?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/machineGroup?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -117,13 +117,13 @@ def fixture_policy_rules():
 def test_list_rules(zpa, policy_rules):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/policySet/rules/policyType/ACCESS_POLICY?page=1",  # noqa: E501
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/policySet/rules/policyType/ACCESS_POLICY?pagesize=500&page=1",  # noqa: E501
         json=policy_rules,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/policySet/rules/policyType/ACCESS_POLICY?page=2",  # noqa: E501
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/policySet/rules/policyType/ACCESS_POLICY?pagesize=500&page=2",  # noqa: E501
         json=[],
         status=200,
     )
@@ -17,13 +17,13 @@ def fixture_posture_profiles():
 def test_list_posture_profiles(zpa, posture_profiles):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/posture?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/posture?pagesize=500&page=1",
         json=posture_profiles,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/posture?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/posture?pagesize=500&page=2",
         json=[],
         status=200,
     )
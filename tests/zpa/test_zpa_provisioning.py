@@ -52,13 +52,13 @@ def fixture_provisioning_keys():
 def test_list_connector_provisioning_keys(zpa, provisioning_keys):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/associationType/CONNECTOR_GRP/provisioningKey?page=1",  # noqa: E501
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/associationType/CONNECTOR_GRP/provisioningKey?pagesize=500&page=1",  # noqa: E501
         json=provisioning_keys,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/associationType/CONNECTOR_GRP/provisioningKey?page=2",  # noqa: E501
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/associationType/CONNECTOR_GRP/provisioningKey?pagesize=500&page=2",  # noqa: E501
         json=[],
         status=200,
     )
@@ -73,13 +73,13 @@ def test_list_connector_provisioning_keys(zpa, provisioning_keys):
 def test_list_service_edge_provisioning_keys(zpa, provisioning_keys):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/associationType/SERVICE_EDGE_GRP/provisioningKey?page=1",  # noqa: E501
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/associationType/SERVICE_EDGE_GRP/provisioningKey?pagesize=500&page=1",  # noqa: E501
         json=provisioning_keys,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/associationType/SERVICE_EDGE_GRP/provisioningKey?page=2",  # noqa: E501
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/associationType/SERVICE_EDGE_GRP/provisioningKey?pagesize=500&page=2",  # noqa: E501
         json=[],
         status=200,
     )
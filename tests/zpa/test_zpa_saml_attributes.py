@@ -17,13 +17,13 @@ def fixture_saml_attributes():
 def test_list_saml_attributes(zpa, saml_attributes):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/samlAttribute?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/samlAttribute?pagesize=500&page=1",
         json=saml_attributes,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/samlAttribute?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/samlAttribute?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -38,13 +38,13 @@ def test_list_saml_attributes(zpa, saml_attributes):
 def test_list_saml_attributes_by_idp(zpa, saml_attributes):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/samlAttribute/idp/1?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/samlAttribute/idp/1?pagesize=500&page=1",
         json=saml_attributes,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/samlAttribute/idp/1?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/samlAttribute/idp/1?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -17,13 +17,13 @@ def fixture_scim_attributes():
 def test_list_scim_attributes_by_idp(zpa, scim_attributes):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/idp/1/scimattribute?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/idp/1/scimattribute?pagesize=500&page=1",
         json=scim_attributes,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/idp/1/scimattribute?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/idp/1/scimattribute?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -51,13 +51,13 @@ def test_get_scim_attribute(zpa, scim_attributes):
 def test_list_scim_values(zpa, scim_attributes):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/userconfig/v1/customers/1/scimattribute/idpId/1/attributeId/1?page=1",
+        url="https://config.private.zscaler.com/userconfig/v1/customers/1/scimattribute/idpId/1/attributeId/1?pagesize=500&page=1",  # noqa: E501
         json=scim_attributes,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/userconfig/v1/customers/1/scimattribute/idpId/1/attributeId/1?page=2",
+        url="https://config.private.zscaler.com/userconfig/v1/customers/1/scimattribute/idpId/1/attributeId/1?pagesize=500&page=2",  # noqa: E501
         json=[],
         status=200,
     )
@@ -84,13 +84,13 @@ def fixture_segment_groups():
 def test_list_groups(zpa, segment_groups):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/segmentGroup?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/segmentGroup?pagesize=500&page=1",
         json=segment_groups,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/segmentGroup?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/segmentGroup?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -96,13 +96,13 @@ def fixture_server_groups():
 def test_list_groups(zpa, server_groups):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/serverGroup?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/serverGroup?pagesize=500&page=1",
         json=server_groups,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/serverGroup?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/serverGroup?pagesize=500&page=2",
         json=[],
         status=200,
     )
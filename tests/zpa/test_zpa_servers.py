@@ -42,13 +42,13 @@ def fixture_servers():
 def test_list_servers(zpa, servers):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/server?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/server?pagesize=500&page=1",
         json=servers,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/server?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/server?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -23,13 +23,13 @@ def fixture_service_edge_groups():
 def test_list_service_edges(zpa, service_edges):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/serviceEdge?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/serviceEdge?pagesize=500&page=1",
         json=service_edges,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/serviceEdge?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/serviceEdge?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -44,13 +44,13 @@ def test_list_service_edges(zpa, service_edges):
 def test_list_service_edge_groups(zpa, service_edge_groups):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/serviceEdgeGroup?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/serviceEdgeGroup?pagesize=500&page=1",
         json=service_edge_groups,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/serviceEdgeGroup?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/serviceEdgeGroup?pagesize=500&page=2",
         json=[],
         status=200,
     )
@@ -17,13 +17,13 @@ def fixture_trusted_networks():
 def test_list_networks(zpa, trusted_networks):
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/network?page=1",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/network?pagesize=500&page=1",
         json=trusted_networks,
         status=200,
     )
     responses.add(
         responses.GET,
-        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/network?page=2",
+        url="https://config.private.zscaler.com/mgmtconfig/v2/admin/customers/1/network?pagesize=500&page=2",
         json=[],
         status=200,
     )